@@ -3,27 +3,67 @@ with Home Assistant.
 """
 
 import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from datetime import datetime, timedelta
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from pyfujitsugeneral.client import FGLairApiClient
+from homeassistant.util.dt import utcnow
 
+from .api import FglairApiClient
+from .breaker import CircuitOpenError, CircuitState
+from .capabilities import CapabilityRegistry, capability_key
+from .commands import DeviceCommandQueue
 from .const import (
+    CAPABILITY_STORAGE_VERSION,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_OPTIMISTIC_GRACE_PERIOD,
+    CONF_PUBLISH_DEADBAND,
+    CONF_RELAX_UNCOMMANDED_REFRESH,
+    CONF_TEMPERATURE_OFFSET,
     CONF_TOKENPATH,
+    DATA_CAPABILITIES,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_OPTIMISTIC_GRACE_PERIOD,
+    DEFAULT_PUBLISH_DEADBAND,
+    DEFAULT_RELAX_UNCOMMANDED_REFRESH,
+    DEFAULT_TEMPERATURE_OFFSET,
     DEFAULT_TIMEOUT,
     DEFAULT_TOKEN_PATH,
     DOMAIN,
+    FAST_SCAN_DURATION,
+    FAST_SCAN_INTERVAL,
+    FRESH_SNAPSHOT_AGE,
+    IDLE_SCAN_INTERVAL,
+    IDLE_THRESHOLD,
+    INTERACTION_DURATION,
+    INVENTORY_REFRESH_INTERVAL,
     PLATFORMS,
+    REFRESH_MINUTES_INTERVAL,
     SCAN_INTERVAL,
+    SERVICE_REFRESH_DEVICES,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
     STARTUP_MESSAGE,
+    TOKEN_STORAGE_VERSION,
+    UNCOMMANDED_REFRESH_INTERVAL,
 )
+from .device import DeviceSnapshot, FglairSplitAC
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Scheduled ticks may fire slightly early, devices due within it are polled
+POLL_TOLERANCE = timedelta(seconds=1)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Establish connection with FGLair."""
@@ -36,15 +76,74 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     password = entry.data.get(CONF_PASSWORD)
     region = entry.data.get(CONF_REGION)
     tokenpath = entry.data.get(CONF_TOKENPATH, DEFAULT_TOKEN_PATH)
+    temperature_offset = entry.data.get(
+        CONF_TEMPERATURE_OFFSET, DEFAULT_TEMPERATURE_OFFSET
+    )
+    max_concurrent_requests = entry.options.get(
+        CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+    )
+    optimistic_grace_period = entry.options.get(
+        CONF_OPTIMISTIC_GRACE_PERIOD, DEFAULT_OPTIMISTIC_GRACE_PERIOD
+    )
+    publish_deadband = entry.options.get(
+        CONF_PUBLISH_DEADBAND, DEFAULT_PUBLISH_DEADBAND
+    )
+    min_publish_interval = entry.options.get(
+        CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+    )
+    relax_uncommanded_refresh = entry.options.get(
+        CONF_RELAX_UNCOMMANDED_REFRESH, DEFAULT_RELAX_UNCOMMANDED_REFRESH
+    )
 
+    capabilities = await _async_get_capability_registry(hass)
     session = async_get_clientsession(hass)
-    client = FGLairApiClient(username, password, region, tokenpath, session)
+    client = FglairApiClient(
+        username,
+        password,
+        region,
+        tokenpath,
+        session,
+        access_token=entry.data.get(CONF_TOKEN),
+        store=_token_store(hass, entry),
+    )
+    await client.async_load_token()
+
+    coordinator = FglairDataUpdateCoordinator(
+        hass,
+        client=client,
+        config_entry=entry,
+        tokenpath=tokenpath,
+        temperature_offset=temperature_offset,
+        max_concurrent_requests=max_concurrent_requests,
+        optimistic_grace_period=timedelta(seconds=optimistic_grace_period),
+        publish_deadband=publish_deadband,
+        min_publish_interval=timedelta(seconds=min_publish_interval),
+        relax_uncommanded_refresh=relax_uncommanded_refresh,
+        capabilities=capabilities,
+        store=_snapshot_store(hass, entry),
+    )
+    # Entities are set up from the last known state, if any, and the cloud is
+    # only waited for in the background so it never stalls the startup
+    await coordinator.async_restore()
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_refresh(),
+        name=f"{DOMAIN} first refresh {entry.entry_id}",
+    )
 
-    coordinator = FglairDataUpdateCoordinator(hass, client=client)
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_create_background_task(
+        hass,
+        client.async_renew_token_before_expiry(),
+        name=f"{DOMAIN} token renewal {entry.entry_id}",
+    )
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_DEVICES):
+        hass.services.async_register(
+            DOMAIN, SERVICE_REFRESH_DEVICES, _async_refresh_devices
+        )
     return True
 
 
@@ -52,32 +151,497 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload FGLair config."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_REFRESH_DEVICES)
     return unload_ok
 
 
-class FglairDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the API."""
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted token and state of a removed FGLair config."""
+    await _token_store(hass, entry).async_remove()
+    await _snapshot_store(hass, entry).async_remove()
+
+
+async def _async_refresh_devices(call: ServiceCall) -> None:
+    """Refresh the device inventory of every FGLair account."""
+    coordinators: list[FglairDataUpdateCoordinator] = list(
+        call.hass.data.get(DOMAIN, {}).values()
+    )
+    await asyncio.gather(
+        *(coordinator.async_refresh_inventory() for coordinator in coordinators)
+    )
+
+
+@singleton(DATA_CAPABILITIES)
+async def _async_get_capability_registry(hass: HomeAssistant) -> CapabilityRegistry:
+    """Return the capability registry shared by every entry."""
+    registry = CapabilityRegistry(
+        Store(hass, CAPABILITY_STORAGE_VERSION, f"{DOMAIN}.capabilities")
+    )
+    await registry.async_load()
+    return registry
+
+
+def _token_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store persisting the access token of an entry."""
+    return Store(hass, TOKEN_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.token")
+
+
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store persisting the last known device state of an entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshots")
+
+
+class FglairDataUpdateCoordinator(DataUpdateCoordinator[dict[str, DeviceSnapshot]]):
+    """Class to manage fetching data from the API.
+
+    ``data`` maps the DSN of every device of the account to its latest
+    ``DeviceSnapshot``. A cycle only fetches the devices that are due, at
+    most ``max_concurrent_requests`` at a time.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
-        client: FGLairApiClient,
+        client: FglairApiClient,
+        *,
+        config_entry: ConfigEntry | None = None,
+        tokenpath: str = DEFAULT_TOKEN_PATH,
+        temperature_offset: float = DEFAULT_TEMPERATURE_OFFSET,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        optimistic_grace_period: timedelta = timedelta(
+            seconds=DEFAULT_OPTIMISTIC_GRACE_PERIOD
+        ),
+        publish_deadband: float = DEFAULT_PUBLISH_DEADBAND,
+        min_publish_interval: timedelta = timedelta(
+            seconds=DEFAULT_MIN_PUBLISH_INTERVAL
+        ),
+        relax_uncommanded_refresh: bool = DEFAULT_RELAX_UNCOMMANDED_REFRESH,
+        capabilities: CapabilityRegistry | None = None,
+        store: Store[dict[str, Any]] | None = None,
     ) -> None:
         """Initialize."""
         self.client = client
+        self._store = store
+        self.capabilities = capabilities or CapabilityRegistry()
+        # Read by the entities when they show requested and measured values
+        self.optimistic_grace_period = optimistic_grace_period
+        self.publish_deadband = publish_deadband
+        self.min_publish_interval = min_publish_interval
+        self._relax_uncommanded_refresh = relax_uncommanded_refresh
+        self.devices: dict[str, FglairSplitAC] = {}
+        self.devices_dsn: list[str] = []
+        self._capability_keys: dict[str, str | None] = {}
+        self._inventory_expires: datetime | None = None
+        self._command_queues: dict[str, DeviceCommandQueue] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._tokenpath = tokenpath
+        self._temperature_offset = temperature_offset
+        self._next_poll: dict[str, datetime] = {}
+        # When the snapshot of each device was last fetched by this run
+        self._fetched_at: dict[str, datetime] = {}
+        self._fast_poll_until: dict[str, datetime] = {}
+        self._last_change: dict[str, datetime] = {}
+        self._activity: dict[str, tuple[Any, ...]] = {}
+        self._refresh_requested: dict[str, datetime] = {}
+        self._interaction_until: dict[str, datetime] = {}
+        self._changed_dsn: set[str] | None = None
 
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
         )
 
-    async def _async_update_data(self) -> None:
-        """Fetch data from library FGLairApiClient."""
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled refreshes and the writes not sent yet."""
+        await super().async_shutdown()
+        for queue in self._command_queues.values():
+            queue.async_shutdown()
+
+    @callback
+    def _async_create_background_task(
+        self, target: Coroutine[Any, Any, Any], name: str
+    ) -> asyncio.Task[Any]:
+        """Run a task owned by the config entry, cancelled when it unloads."""
+        if self.config_entry is None:
+            return self.hass.async_create_background_task(target, name=name)
+        return self.config_entry.async_create_background_task(
+            self.hass, target, name=name
+        )
+
+    def get_device(self, dsn: str) -> FglairSplitAC:
+        """Return the FglairSplitAC owned by the coordinator for a DSN."""
+        if (device := self.devices.get(dsn)) is None:
+            device = FglairSplitAC(
+                dsn, self.client, self._tokenpath, self._temperature_offset
+            )
+            self.devices[dsn] = device
+        return device
+
+    def capability_key(self, dsn: str) -> str | None:
+        """Return the capability profile key of a device, None when unknown."""
+        return self._capability_keys.get(dsn)
+
+    async def async_restore(self) -> bool:
+        """Put back the state persisted by a previous run.
+
+        Returns False when nothing was persisted. The restored inventory,
+        which may list devices without a known state, is expired so the next
+        refresh fetches it again.
+        """
+        if self._store is None or not (stored := await self._store.async_load()):
+            return False
+
+        data: dict[str, DeviceSnapshot] = {}
+        for dsn, state in stored["devices"].items():
+            # Parsed by the device as well, so writes know the property keys
+            properties = state["properties"]
+            await self.get_device(dsn).async_parse_properties(properties)
+            data[dsn] = DeviceSnapshot.from_properties(
+                properties,
+                current_temperature=state["current_temperature"],
+                target_temperature=state["target_temperature"],
+            )
+        self._capability_keys = stored["capability_keys"]
+        self.devices_dsn = list(self._capability_keys)
+        self.data = data
+        _LOGGER.debug("Restored the last known state of %s", self.devices_dsn)
+        return True
+
+    def is_fresh(self, dsn: str) -> bool:
+        """Return True when the snapshot of a device was fetched lately.
+
+        Restored snapshots, and those of devices only polled every
+        ``IDLE_SCAN_INTERVAL``, are not fresh.
+        """
+        fetched_at = self._fetched_at.get(dsn)
+        return fetched_at is not None and utcnow() - fetched_at <= FRESH_SNAPSHOT_AGE
+
+    async def async_refresh_inventory(self) -> None:
+        """Fetch the device inventory again, then refresh."""
+        self._inventory_expires = None
+        await self.async_refresh()
+
+    async def async_send_command(
+        self, dsn: str, prop: str, write: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Send a write of a device property through its command queue."""
+        if (queue := self._command_queues.get(dsn)) is None:
+            queue = DeviceCommandQueue()
+            self._command_queues[dsn] = queue
+        return await queue.async_write(prop, write)
+
+    async def async_refresh_properties(self, dsn: str, names: Iterable[str]) -> None:
+        """Re-read a few properties of a device and publish its snapshot.
+
+        Only the latest datapoint of the named properties is read, the rest
+        of the snapshot is kept as is. Only the listeners of the device are
+        updated.
+        """
+        device = self.get_device(dsn)
+        keys: dict[str, Any] = {}
+        for name in names:
+            prop = getattr(device, f"get_{name}")()
+            if prop and prop.get("key") is not None:
+                keys[name] = prop["key"]
+        async with self._semaphore:
+            responses = await asyncio.gather(
+                *(self.client.async_get_device_property(key) for key in keys.values())
+            )
+
+        values: dict[str, Any] = {}
+        for (name, key), datapoints in zip(keys.items(), responses, strict=True):
+            # The history of the property, the latest datapoint last. Errors
+            # come back as a mapping instead
+            if not isinstance(datapoints, list) or not datapoints:
+                continue
+            value = datapoints[-1]["datapoint"]["value"]
+            # The device parses a property out of any payload holding it
+            await getattr(device, f"async_set_{name}")(
+                [{"property": {"name": name, "key": key, "value": value}}]
+            )
+            values[name] = value
+
+        if (snapshot := (self.data or {}).get(dsn)) is None:
+            return
+        self.data = {**self.data, dsn: snapshot.with_values(**values)}
+        self._changed_dsn = {dsn}
+        self.async_update_listeners()
+        self._async_schedule_save()
+
+    @callback
+    def async_note_command(self, dsn: str) -> None:
+        """Poll a device fast for a while after a command was sent to it."""
+        self.async_note_interaction(dsn)
+        self._fast_poll_until[dsn] = utcnow() + FAST_SCAN_DURATION
+        if self.update_interval != FAST_SCAN_INTERVAL:
+            self.update_interval = FAST_SCAN_INTERVAL
+            self._schedule_refresh()
+
+    @callback
+    def async_note_interaction(self, dsn: str) -> None:
+        """Fetch a device in the next cycle and keep its sensor data fresh.
+
+        Called when a command is sent to the device or its entity is updated
+        on request. Automations merely reading the state of the entity are not
+        noticed. With ``relax_uncommanded_refresh`` its sensor data is
+        refreshed every ``REFRESH_MINUTES_INTERVAL`` for
+        ``INTERACTION_DURATION`` only, then every
+        ``UNCOMMANDED_REFRESH_INTERVAL``.
+        """
+        now = utcnow()
+        self._interaction_until[dsn] = now + INTERACTION_DURATION
+        self._next_poll[dsn] = now
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners of the devices whose snapshot changed.
+
+        Listeners registered with a DSN context are only called when the
+        fingerprint of that device changed, the others on every update.
+        """
+        if self._changed_dsn is None:
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in self._changed_dsn:
+                update_callback()
+
+    async def _async_update_data(self) -> dict[str, DeviceSnapshot]:
+        """Fetch data from library FGLairApiClient.
+
+        Devices that are not due keep their previous snapshot. While the
+        circuit breaker of the account is not closed every update fails.
+        """
+        now = utcnow()
+        previous_data = self.data or {}
+        previous_inventory = (self.devices_dsn, self._capability_keys)
         try:
             async with asyncio.timeout(DEFAULT_TIMEOUT):
-                await self.client.async_get_devices_dsn()
+                devices_dsn = await self._async_get_devices_dsn(now)
+                due_dsn = [dsn for dsn in devices_dsn if self._is_due(dsn, now)]
+                snapshots = await asyncio.gather(
+                    *(self._async_fetch_device(dsn) for dsn in due_dsn)
+                )
         except Exception as exception:
             _LOGGER.warning("Failed to update coordinator data: %s", exception)
+            self._changed_dsn = None
             raise UpdateFailed from exception
+
+        if self.client.breaker.state is not CircuitState.CLOSED:
+            # The devices that failed fast must not show their last state
+            self._changed_dsn = None
+            raise UpdateFailed("FGLair cloud unavailable")
+
+        data = {dsn: previous_data[dsn] for dsn in devices_dsn if dsn in previous_data}
+        for dsn, snapshot in zip(due_dsn, snapshots, strict=True):
+            if snapshot is not None:
+                data[dsn] = snapshot
+                self._fetched_at[dsn] = now
+            self._next_poll[dsn] = now + self._device_poll_interval(dsn, snapshot, now)
+
+        for dsn in set(self._next_poll) - set(devices_dsn):
+            self._next_poll.pop(dsn)
+            self._fetched_at.pop(dsn, None)
+            self.devices.pop(dsn, None)
+            self._refresh_requested.pop(dsn, None)
+            self._interaction_until.pop(dsn, None)
+            self._fast_poll_until.pop(dsn, None)
+            self._last_change.pop(dsn, None)
+            self._activity.pop(dsn, None)
+            if (queue := self._command_queues.pop(dsn, None)) is not None:
+                queue.async_shutdown()
+
+        stale_dsn = [
+            dsn
+            for dsn, snapshot in zip(due_dsn, snapshots, strict=True)
+            if snapshot is not None and self._needs_refresh_request(dsn, snapshot, now)
+        ]
+        if stale_dsn:
+            for dsn in stale_dsn:
+                self._refresh_requested[dsn] = now
+            # Sent concurrently in the background, the poll does not wait
+            self._async_create_background_task(
+                self._async_send_refresh_requests(stale_dsn),
+                name=f"{DOMAIN} sensor refresh requests",
+            )
+        self.update_interval = self._next_update_interval(now)
+
+        changed_dsn = {
+            dsn
+            for dsn in data.keys() | previous_data.keys()
+            if getattr(data.get(dsn), "fingerprint", None)
+            != getattr(previous_data.get(dsn), "fingerprint", None)
+        }
+        # After a failed cycle every entity must refresh its availability
+        self._changed_dsn = changed_dsn if self.last_update_success else None
+        if changed_dsn or previous_inventory != (
+            self.devices_dsn,
+            self._capability_keys,
+        ):
+            self._async_schedule_save()
+        return data
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Persist the last known state of the devices, delayed."""
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the last known state of the devices to persist."""
+        return {
+            "devices": {
+                dsn: {
+                    "properties": self.get_device(dsn).compact_properties(),
+                    "current_temperature": snapshot.current_temperature,
+                    "target_temperature": snapshot.target_temperature,
+                }
+                for dsn, snapshot in (self.data or {}).items()
+            },
+            "capability_keys": {
+                dsn: self._capability_keys.get(dsn) for dsn in self.devices_dsn
+            },
+        }
+
+    async def _async_get_devices_dsn(self, now: datetime) -> list[str]:
+        """Return the cached device inventory, fetching it when it expired.
+
+        The inventory expires every ``INVENTORY_REFRESH_INTERVAL`` or when
+        ``async_refresh_inventory`` is called.
+        """
+        if self._inventory_expires is None or now >= self._inventory_expires:
+            devices = await self.client.async_get_devices()
+            devices_dsn = [device["dsn"] for device in devices]
+            self._capability_keys = {
+                device["dsn"]: capability_key(device) for device in devices
+            }
+            if set(devices_dsn) != set(self.devices_dsn):
+                _LOGGER.debug("FGLair device inventory changed: %s", devices_dsn)
+            self.devices_dsn = devices_dsn
+            self._inventory_expires = now + INVENTORY_REFRESH_INTERVAL
+        return self.devices_dsn
+
+    def _is_due(self, dsn: str, now: datetime) -> bool:
+        """Return True when a device must be fetched in this cycle."""
+        next_poll = self._next_poll.get(dsn)
+        return next_poll is None or next_poll <= now + POLL_TOLERANCE
+
+    def _device_poll_interval(
+        self, dsn: str, snapshot: DeviceSnapshot | None, now: datetime
+    ) -> timedelta:
+        """Return how long to wait before fetching a device again.
+
+        Fast for a while after a command, slow once the device is off or did
+        not change for ``IDLE_THRESHOLD``.
+        """
+        if now < self._fast_poll_until.get(dsn, now):
+            return FAST_SCAN_INTERVAL
+        self._fast_poll_until.pop(dsn, None)
+
+        if snapshot is None:
+            return SCAN_INTERVAL
+
+        operation_mode = snapshot.operation_mode
+        activity = (
+            operation_mode,
+            snapshot.current_temperature,
+            snapshot.target_temperature,
+        )
+        if self._activity.get(dsn) != activity:
+            self._activity[dsn] = activity
+            self._last_change[dsn] = now
+
+        if operation_mode == 0 or now - self._last_change[dsn] >= IDLE_THRESHOLD:
+            return IDLE_SCAN_INTERVAL
+        return SCAN_INTERVAL
+
+    def _next_update_interval(self, now: datetime) -> timedelta:
+        """Return the delay until the earliest device is due again."""
+        if not self._next_poll:
+            return SCAN_INTERVAL
+        return max(min(self._next_poll.values()) - now, FAST_SCAN_INTERVAL)
+
+    async def _async_fetch_device(self, dsn: str) -> DeviceSnapshot | None:
+        """Fetch a single device while holding a concurrency slot."""
+        async with self._semaphore:
+            return await self._async_fetch_device_snapshot(dsn)
+
+    async def _async_fetch_device_snapshot(self, dsn: str) -> DeviceSnapshot | None:
+        """Fetch the properties of a single device and build its snapshot."""
+        device = self.get_device(dsn)
+        previous = (self.data or {}).get(dsn)
+
+        try:
+            properties = await device.async_update_properties()
+        except CircuitOpenError:
+            # The breaker already warned once for the whole account
+            return None
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to update device %s: %s", dsn, ex)
+            return None
+
+        # Both temperatures are part of the payload. When the device does not
+        # report one its history is not fetched, the previous value is kept
+        current_temperature = device.display_temperature_degree()
+        target_temperature = device.adjust_temperature_degree()
+        if previous is not None:
+            if current_temperature is None:
+                current_temperature = previous.current_temperature
+            if target_temperature is None:
+                target_temperature = previous.target_temperature
+
+        return DeviceSnapshot.from_properties(
+            properties,
+            current_temperature=current_temperature,
+            target_temperature=target_temperature,
+        )
+
+    def _needs_refresh_request(
+        self, dsn: str, snapshot: DeviceSnapshot, now: datetime
+    ) -> bool:
+        """Return True when a device must be asked for fresh sensor data.
+
+        Sensor data older than ``REFRESH_MINUTES_INTERVAL`` is stale, or
+        ``UNCOMMANDED_REFRESH_INTERVAL`` for devices not commanded lately when
+        ``relax_uncommanded_refresh`` is set.
+        """
+        if snapshot.refresh_updated_at is None:
+            return False
+        interval = REFRESH_MINUTES_INTERVAL
+        if self._relax_uncommanded_refresh and now >= self._interaction_until.get(
+            dsn, now
+        ):
+            # Not commanded lately, its sensor data may be older
+            self._interaction_until.pop(dsn, None)
+            interval = UNCOMMANDED_REFRESH_INTERVAL
+
+        refreshed_at = datetime.strptime(
+            snapshot.refresh_updated_at, "%Y-%m-%dT%H:%M:%S%z"
+        )
+        if now <= refreshed_at + interval:
+            return False
+        # A request the device did not answer yet is not sent again
+        requested_at = self._refresh_requested.get(dsn)
+        return requested_at is None or now >= requested_at + interval
+
+    async def _async_send_refresh_requests(self, dsns: list[str]) -> None:
+        """Ask devices to upload fresh sensor data, all at once."""
+        await asyncio.gather(*(self._async_send_refresh_request(dsn) for dsn in dsns))
+
+    async def _async_send_refresh_request(self, dsn: str) -> None:
+        """Ask a single device to upload fresh sensor data."""
+        _LOGGER.debug("display_temperature of %s will be refreshed", dsn)
+        try:
+            async with self._semaphore:
+                await self.get_device(dsn).async_set_refresh(1)
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Failed to refresh display temperature for device %s: %s", dsn, ex
+            )
+            self._refresh_requested.pop(dsn, None)
@@ -0,0 +1,193 @@
+"""FGLair API client shared by the coordinator and the entities of an entry."""
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+import aiohttp
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util.dt import parse_datetime, utcnow
+from pyfujitsugeneral.client import FGLairApiClient
+from pyfujitsugeneral.exceptions import FGLairGeneralException
+
+from .breaker import CircuitBreaker
+from .const import (
+    DEFAULT_TOKEN_LIFETIME,
+    TOKEN_RENEWAL_MARGIN,
+    TOKEN_RENEWAL_RETRY_INTERVAL,
+    TOKEN_SAVE_DELAY,
+)
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+def _is_auth_error(response: Any) -> bool:
+    """Return True when the cloud rejected the request, e.g. expired token."""
+    return isinstance(response, dict) and "error" in response
+
+
+class FglairApiClient(FGLairApiClient):
+    """FGLairApiClient keeping the access token of its account in memory.
+
+    The client is built once per config entry and seeded with the token
+    acquired by the config flow, so no login is needed at startup while the
+    token is still valid. With a ``store`` the token is persisted per entry
+    instead of the shared token file of the library: it is loaded once by
+    ``async_load_token`` and written, delayed, only when a login changed it.
+
+    Tokens are validated by the requests themselves instead of a probe
+    request before every call. When a request is rejected the client logs in
+    again and retries it once. Logins are single-flight: every request
+    rejected while a login is running waits for that same login.
+
+    ``async_renew_token_before_expiry`` runs for the lifetime of the entry
+    and logs in shortly before the token expires, so foreground requests
+    normally never wait on a login.
+
+    Every request goes through the ``breaker`` of the account, which fails
+    them fast while the cloud is down.
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        username: str,
+        password: str,
+        region: str,
+        tokenpath: str,
+        session: aiohttp.ClientSession,
+        *,
+        access_token: str | None = None,
+        store: Store[dict[str, Any]] | None = None,
+    ) -> None:
+        """Initialize."""
+        super().__init__(username, password, region, tokenpath, session)
+        self._access_token = access_token
+        self._expires_at: datetime | None = None
+        self._store = store
+        self._login: asyncio.Task[str] | None = None
+        self.breaker = CircuitBreaker()
+
+    @property
+    def access_token(self) -> str | None:
+        """Return the access token currently in use."""
+        return self._access_token
+
+    @property
+    def expires_at(self) -> datetime | None:
+        """Return when the access token expires, None when unknown."""
+        return self._expires_at
+
+    async def async_load_token(self) -> None:
+        """Load the token persisted by a previous run, if any."""
+        if self._store is None or not (stored := await self._store.async_load()):
+            return
+        self._access_token = stored["access_token"]
+        self._expires_at = parse_datetime(stored["expires_at"])
+
+    @callback
+    def _token_data(self) -> dict[str, Any]:
+        """Return the token data to persist."""
+        return {
+            "access_token": self._access_token,
+            "expires_at": self._expires_at.isoformat() if self._expires_at else None,
+        }
+
+    async def async_renew_token_before_expiry(self) -> None:
+        """Keep renewing the access token shortly before it expires."""
+        while True:
+            await asyncio.sleep(self._renewal_delay().total_seconds())
+            try:
+                await self._async_renew_token(self._access_token)
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.warning("Failed to renew the FGLair access token: %s", ex)
+                await asyncio.sleep(TOKEN_RENEWAL_RETRY_INTERVAL.total_seconds())
+
+    def _renewal_delay(self) -> timedelta:
+        """Return how long to wait before renewing the access token."""
+        # The age of a token only seeded by the config flow is unknown
+        if self._expires_at is None:
+            return timedelta(0)
+        return max(self._expires_at - TOKEN_RENEWAL_MARGIN - utcnow(), timedelta(0))
+
+    async def async_authenticate(self) -> str:
+        """Log in, sharing the login with every concurrent caller."""
+        return await self._async_renew_token(self._access_token)
+
+    async def _async_renew_token(self, rejected_token: str | None) -> str:
+        """Replace a rejected token, unless another request already did."""
+        if self._access_token and self._access_token != rejected_token:
+            return self._access_token
+
+        if self._login is None:
+            self._login = asyncio.create_task(self._async_login())
+        return await asyncio.shield(self._login)
+
+    async def _async_login(self) -> str:
+        """Sign in and swap in the new token."""
+        try:
+            response = await self.api_wrapper(
+                "post",
+                url=self._API_GET_ACCESS_TOKEN_URL,
+                json_data=self._SIGNIN_BODY % (self._username, self._password),
+            )
+            if not isinstance(response, dict) or not response.get("access_token"):
+                raise FGLairGeneralException("FGLair login refused")
+
+            lifetime = DEFAULT_TOKEN_LIFETIME
+            if expires_in := response.get("expires_in"):
+                lifetime = timedelta(seconds=expires_in)
+            # Token and expiry are swapped together, callers never see a mix
+            self._access_token = response["access_token"]
+            self._expires_at = utcnow() + lifetime
+            _LOGGER.debug("FGLair access token renewed")
+
+            if self._store is not None:
+                self._store.async_delay_save(self._token_data, TOKEN_SAVE_DELAY)
+            return self._access_token
+        finally:
+            self._login = None
+
+    async def _async_read_token(self, access_token_file: str = "") -> str:
+        """Return the in-memory access token, logging in when there is none."""
+        if not self._access_token:
+            return await self.async_authenticate()
+        return self._access_token
+
+    async def _async_check_token_validity(
+        self, access_token: str | None = None
+    ) -> bool:
+        """Trust any known token, the request itself reports a rejection."""
+        return bool(access_token)
+
+    async def async_get_devices(self) -> list[dict[str, Any]]:
+        """Return the devices of the account, with their model and firmware."""
+        return [item["device"] for item in await self._async_get_devices()]
+
+    async def _async_get_devices(self, access_token: str | None = None) -> Any:
+        """List the devices reusing the in-memory access token."""
+        return await super()._async_get_devices(
+            access_token or await self._async_read_token()
+        )
+
+    async def api_wrapper(  # pylint: disable=R0913
+        self,
+        method: str,
+        url: str,
+        json_data: str = "",
+        access_token: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Get information from the API, logging in again on a rejected token."""
+        async with self.breaker:
+            response = await super().api_wrapper(
+                method, url, json_data, access_token, headers
+            )
+        if access_token is None or not _is_auth_error(response):
+            return response
+
+        _LOGGER.debug("FGLair rejected the access token: %s", response["error"])
+        access_token = await self._async_renew_token(access_token)
+        async with self.breaker:
+            return await super().api_wrapper(method, url, json_data, access_token)
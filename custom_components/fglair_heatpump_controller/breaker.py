@@ -0,0 +1,97 @@
+"""Circuit breaker around the FGLair cloud calls of an account."""
+
+from datetime import datetime, timedelta
+from enum import StrEnum
+import logging
+from types import TracebackType
+
+from homeassistant.util.dt import utcnow
+from pyfujitsugeneral.exceptions import FGLairGeneralException
+
+from .const import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class CircuitOpenError(FGLairGeneralException):
+    """Raised instead of calling the cloud while the circuit is open."""
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling the cloud of an account while it keeps failing.
+
+    The circuit opens after ``failure_threshold`` failed calls in a row.
+    While open every call fails fast with ``CircuitOpenError``. Once
+    ``reset_timeout`` elapsed a single call is let through as a probe, the
+    half-open state: its success closes the circuit, its failure opens it
+    again. Only ``FGLairGeneralException`` counts as a failure.
+
+    Calls are guarded with ``async with breaker:``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: timedelta = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: datetime | None = None
+        self.state = CircuitState.CLOSED
+
+    async def __aenter__(self) -> None:
+        """Let a call through, or fail fast while the circuit is open."""
+        if self.state is CircuitState.CLOSED:
+            return
+        if (
+            self.state is CircuitState.OPEN
+            and self._opened_at is not None
+            and utcnow() >= self._opened_at + self._reset_timeout
+        ):
+            _LOGGER.debug("Probing the FGLair cloud")
+            self.state = CircuitState.HALF_OPEN
+            return
+        # Open, or the single probe is still running
+        raise CircuitOpenError("FGLair cloud calls are suspended")
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Record the outcome of a call."""
+        if exc_type is None:
+            if self.state is not CircuitState.CLOSED:
+                _LOGGER.info("FGLair cloud reachable again")
+            self.state = CircuitState.CLOSED
+            self._failures = 0
+        elif issubclass(exc_type, FGLairGeneralException):
+            self._failures += 1
+            if (
+                self.state is CircuitState.HALF_OPEN
+                or self._failures >= self._failure_threshold
+            ):
+                self._open()
+        elif self.state is CircuitState.HALF_OPEN:
+            # The probe was cancelled, the next call probes again
+            self.state = CircuitState.OPEN
+
+    def _open(self) -> None:
+        """Open the circuit, failing calls fast from now on."""
+        if self.state is not CircuitState.OPEN:
+            _LOGGER.warning(
+                "FGLair cloud failing, calls suspended for %s", self._reset_timeout
+            )
+        self.state = CircuitState.OPEN
+        self._opened_at = utcnow()
@@ -0,0 +1,110 @@
+"""Capability profiles shared by the devices of the same model."""
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import logging
+from typing import Any
+
+from homeassistant.components.climate import ClimateEntityFeature
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import CAPABILITY_SAVE_DELAY
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+@dataclass(frozen=True, slots=True)
+class CapabilityProfile:
+    """Presets, swing positions and features supported by a device model.
+
+    A profile is shared by every device of the same model and firmware, the
+    lists it holds must never be modified.
+    """
+
+    preset_modes: list[str]
+    swing_modes: list[str] | None
+    swing_horizontal_modes: list[str] | None
+    supported_features: ClimateEntityFeature
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CapabilityProfile":
+        """Restore a profile from its persisted form."""
+        return cls(
+            preset_modes=data["preset_modes"],
+            swing_modes=data["swing_modes"],
+            swing_horizontal_modes=data["swing_horizontal_modes"],
+            supported_features=ClimateEntityFeature(data["supported_features"]),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the persisted form of the profile."""
+        return {**asdict(self), "supported_features": int(self.supported_features)}
+
+
+def capability_key(device: dict[str, Any]) -> str | None:
+    """Return the profile key of a device listed in the inventory.
+
+    Devices without a known model or firmware get no key, their capabilities
+    are worked out on their own.
+    """
+    model = device.get("oem_model") or device.get("model")
+    firmware = device.get("sw_version")
+    if not model or not firmware:
+        return None
+    return f"{model}/{firmware}"
+
+
+class CapabilityRegistry:
+    """Capability profiles keyed by model and firmware.
+
+    The registry is shared by every entry, each profile is worked out once
+    from the first device of its model and persisted with ``store``, so the
+    entities show their capabilities before their device was polled.
+    """
+
+    def __init__(self, store: Store[dict[str, Any]] | None = None) -> None:
+        """Initialize."""
+        self._store = store
+        self._profiles: dict[str, CapabilityProfile] = {}
+
+    async def async_load(self) -> None:
+        """Load the profiles persisted by a previous run, if any."""
+        if self._store is None or not (stored := await self._store.async_load()):
+            return
+        self._profiles = {
+            key: CapabilityProfile.from_dict(profile)
+            for key, profile in stored["profiles"].items()
+        }
+
+    @callback
+    def async_get(self, key: str | None) -> CapabilityProfile | None:
+        """Return the profile of a model, None when it is not known yet."""
+        if key is None:
+            return None
+        return self._profiles.get(key)
+
+    @callback
+    def async_get_or_create(
+        self, key: str | None, create: Callable[[], CapabilityProfile]
+    ) -> CapabilityProfile:
+        """Return the profile of a model, working it out when unknown."""
+        if (profile := self.async_get(key)) is not None:
+            return profile
+
+        profile = create()
+        if key is not None:
+            _LOGGER.debug("New capability profile for %s: %s", key, profile)
+            self._profiles[key] = profile
+            if self._store is not None:
+                self._store.async_delay_save(self._data_to_save, CAPABILITY_SAVE_DELAY)
+        return profile
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the profiles to persist."""
+        return {
+            "profiles": {
+                key: profile.as_dict() for key, profile in self._profiles.items()
+            }
+        }
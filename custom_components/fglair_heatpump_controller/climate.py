@@ -1,8 +1,9 @@
 """Support for the Fujitsu General Split A/C Wifi platform AKA FGLair ."""
 
 import asyncio
-from contextlib import suppress
-from datetime import datetime
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
@@ -13,6 +14,11 @@ from homeassistant.components.climate import (
     HVACAction,
 )
 from homeassistant.components.climate.const import (
+    ATTR_FAN_MODE,
+    ATTR_HVAC_MODE,
+    ATTR_PRESET_MODE,
+    ATTR_SWING_HORIZONTAL_MODE,
+    ATTR_SWING_MODE,
     FAN_AUTO,
     FAN_DIFFUSE,
     FAN_HIGH,
@@ -35,21 +41,24 @@ from homeassistant.const import (
     CONF_USERNAME,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import entity_platform, entity_registry as er
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import Throttle
 from homeassistant.util.dt import utcnow
-from pyfujitsugeneral.client import FGLairApiClient
 from pyfujitsugeneral.exceptions import FGLairGeneralException
-from pyfujitsugeneral.splitAC import SplitAC, get_prop_from_json
 import voluptuous as vol
 
 from . import FglairDataUpdateCoordinator
+from .api import FglairApiClient
+from .breaker import CircuitOpenError
+from .capabilities import CapabilityProfile
 from .const import (
+    ATTR_FORCE,
+    COMMAND_TIMEOUT,
     CONF_TEMPERATURE_OFFSET,
     CONF_TOKENPATH,
     DEFAULT_MIN_STEP,
@@ -59,22 +68,31 @@ from .const import (
     HORIZONTAL,
     MAX_TEMP,
     MIN_TEMP,
-    MIN_TIME_BETWEEN_UPDATES,
-    REFRESH_MINUTES_INTERVAL,
+    SERVICE_SET_FAN_MODE,
+    SERVICE_SET_HVAC_MODE,
+    SERVICE_SET_PRESET_MODE,
+    SERVICE_SET_SWING_HORIZONTAL_MODE,
+    SERVICE_SET_SWING_MODE,
+    SERVICE_SET_TEMPERATURE,
     VERTICAL,
 )
+from .device import DeviceSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def _async_retry_api_call(
-    api_call, max_retries: int = 3, delay: float = 1.0
+    api_call, max_retries: int = 3, delay: float = 1.0, timeout: float | None = None
 ) -> Any:
-    """Retry API calls with exponential backoff."""
+    """Retry API calls with exponential backoff, each attempt within timeout."""
     for attempt in range(max_retries):
         try:
-            return await api_call()
-        except FGLairGeneralException as ex:
+            async with asyncio.timeout(timeout):
+                return await api_call()
+        except CircuitOpenError as ex:
+            # Retrying would only fail fast again
+            raise HomeAssistantError(f"Device communication failed: {ex}") from ex
+        except (FGLairGeneralException, TimeoutError) as ex:
             if attempt == max_retries - 1:
                 _LOGGER.error("API call failed after %d attempts: %s", max_retries, ex)
                 raise HomeAssistantError(f"Device communication failed: {ex}") from ex
@@ -113,29 +131,41 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     }
 )
 
-DICT_FAN_MODE = {
-    FAN_AUTO: "Auto",
-    FAN_LOW: "Low",
-    FAN_MEDIUM: "Medium",
-    FAN_HIGH: "High",
-    FAN_DIFFUSE: "Quiet",
-    "Auto": FAN_AUTO,
-    "Low": FAN_LOW,
-    "Medium": FAN_MEDIUM,
-    "High": FAN_HIGH,
-    "Quiet": FAN_DIFFUSE,
+# Values of the operation_mode property, 1 is an unknown mode
+OPERATION_MODE_TO_HA = {
+    0: HVACMode.OFF,
+    2: HVACMode.AUTO,
+    3: HVACMode.COOL,
+    4: HVACMode.DRY,
+    5: HVACMode.FAN_ONLY,
+    6: HVACMode.HEAT,
 }
-
-FUJITSU_TO_HA_STATE = {
-    "off": HVACMode.OFF,
-    "auto": HVACMode.AUTO,
-    "cool": HVACMode.COOL,
-    "dry": HVACMode.DRY,
-    "fan_only": HVACMode.FAN_ONLY,
-    "heat": HVACMode.HEAT,
+HA_TO_OPERATION_MODE = {value: key for key, value in OPERATION_MODE_TO_HA.items()}
+# Mode the library turns a device on in when its history has no other
+OPERATION_MODE_AUTO = 2
+
+# Values of the fan_speed property, a few models report undocumented ones
+FAN_SPEED_TO_HA = {
+    0: FAN_DIFFUSE,
+    1: FAN_LOW,
+    2: FAN_MEDIUM,
+    3: FAN_HIGH,
+    4: FAN_AUTO,
+    5: FAN_LOW,
+    7: FAN_HIGH,
+    9: FAN_AUTO,
+}
+HA_TO_FAN_SPEED = {
+    FAN_DIFFUSE: 0,
+    FAN_LOW: 1,
+    FAN_MEDIUM: 2,
+    FAN_HIGH: 3,
+    FAN_AUTO: 4,
 }
 
-HA_STATE_TO_FUJITSU = {value: key for key, value in FUJITSU_TO_HA_STATE.items()}
+# Values of the op_status property
+OP_STATUS_NORMAL = 0
+OP_STATUS_DEFROST = 16777216
 
 SUPPORTED_MODES: list[HVACMode] = [
     HVACMode.OFF,
@@ -146,13 +176,35 @@ SUPPORTED_MODES: list[HVACMode] = [
     HVACMode.FAN_ONLY,
 ]
 
-FUJITSU_TO_ACTION_LOOKUP = {
-    "Normal": HVACAction.HEATING,
-    # Heat pump cannot heat in this mode, but will be ready soon
-    "Defrost": HVACAction.PREHEATING,
+# Device properties backing the presets
+PRESET_PROPERTIES = ("economy_mode", "powerful_mode", "min_heat")
+PRESET_TO_PROPERTY = {
+    PRESET_ECO: "economy_mode",
+    PRESET_BOOST: "powerful_mode",
+    PRESET_AWAY: "min_heat",
 }
 
 
+def _vane_positions(num_dir: int | None) -> list[int]:
+    """Return the vane positions of a direction, numbered from 1."""
+    if not isinstance(num_dir, int) or num_dir < 0:
+        return []
+    return list(range(1, num_dir + 1))
+
+
+@dataclass(frozen=True, slots=True)
+class _DerivedState:
+    """State of a device derived once from each snapshot of its properties."""
+
+    target_temperature: float | None
+    hvac_mode: Any
+    hvac_action: HVACAction | None
+    fan_mode: Any
+    swing_mode: str | None
+    swing_horizontal_mode: str | None
+    preset_mode: Any
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -163,36 +215,31 @@ async def async_setup_entry(
 
     coordinator: FglairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    username: str = entry.data[CONF_USERNAME]
-    password: str = entry.data[CONF_PASSWORD]
     region: str = entry.data[CONF_REGION]
     tokenpath: str = entry.data[CONF_TOKENPATH]
     temperature_offset: float = entry.data[CONF_TEMPERATURE_OFFSET]
 
-    fglair_api_client: FGLairApiClient = FGLairApiClient(
-        username, password, region, tokenpath, async_get_clientsession(hass)
-    )
-
-    auth_result = await fglair_api_client.async_authenticate()
-
-    if not auth_result:
-        _LOGGER.error("Unable to authenticate with Fujistsu General")
-        return
+    # The client is shared with the coordinator and already authenticated
+    fglair_api_client: FglairApiClient = coordinator.client
+    entities: dict[str, FujitsuClimate] = {}
 
-    devices = await fglair_api_client.async_get_devices_dsn()
-
-    entities = []
-
-    for dsn in devices:
-        _LOGGER.debug(
-            "async_setup_entry called with %s - %s - %s - %s  ",
-            dsn,
-            region,
-            tokenpath,
-            temperature_offset,
-        )
-        entities.append(
-            FujitsuClimate(
+    @callback
+    def _async_sync_entities() -> None:
+        """Add entities for new devices and remove those of removed ones."""
+        new_entities = []
+        for dsn in coordinator.devices_dsn:
+            # The name the entity is keyed by is only known once fetched
+            snapshot = (coordinator.data or {}).get(dsn)
+            if dsn in entities or snapshot is None or not snapshot.device_name:
+                continue
+            _LOGGER.debug(
+                "async_setup_entry called with %s - %s - %s - %s  ",
+                dsn,
+                region,
+                tokenpath,
+                temperature_offset,
+            )
+            entities[dsn] = FujitsuClimate(
                 fglair_api_client,
                 dsn,
                 region,
@@ -201,9 +248,54 @@ async def async_setup_entry(
                 hass,
                 coordinator,
             )
-        )
+            new_entities.append(entities[dsn])
 
-    async_add_entities(entities, update_before_add=True)
+        for dsn in set(entities) - set(coordinator.devices_dsn):
+            entity = entities.pop(dsn)
+            _LOGGER.debug("FujitsuClimate device [%s] removed from account", dsn)
+            if entity.registry_entry is not None:
+                er.async_get(hass).async_remove(entity.entity_id)
+            else:
+                hass.async_create_task(entity.async_remove(force_remove=True))
+
+        if new_entities:
+            async_add_entities(new_entities)
+
+    # The inventory is cached by the coordinator and refreshed on its own, the
+    # first refresh may still be running in the background
+    _async_sync_entities()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_entities))
+
+    # The climate services skip writes of values the entity already shows,
+    # these ones can send them anyway
+    platform = entity_platform.async_get_current_platform()
+    force = {vol.Optional(ATTR_FORCE, default=False): cv.boolean}
+    for service, field, validator, method in (
+        (
+            SERVICE_SET_TEMPERATURE,
+            ATTR_TEMPERATURE,
+            vol.Coerce(float),
+            "async_set_temperature",
+        ),
+        (
+            SERVICE_SET_HVAC_MODE,
+            ATTR_HVAC_MODE,
+            vol.Coerce(HVACMode),
+            "async_set_hvac_mode",
+        ),
+        (SERVICE_SET_FAN_MODE, ATTR_FAN_MODE, cv.string, "async_set_fan_mode"),
+        (SERVICE_SET_SWING_MODE, ATTR_SWING_MODE, cv.string, "async_set_swing_mode"),
+        (
+            SERVICE_SET_SWING_HORIZONTAL_MODE,
+            ATTR_SWING_HORIZONTAL_MODE,
+            cv.string,
+            "async_set_swing_horizontal_mode",
+        ),
+        (SERVICE_SET_PRESET_MODE, ATTR_PRESET_MODE, cv.string, "async_set_preset_mode"),
+    ):
+        platform.async_register_entity_service(
+            service, {vol.Required(field): validator, **force}, method
+        )
 
 
 class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEntity):
@@ -214,7 +306,7 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
 
     def __init__(
         self,
-        fglair_api_client: FGLairApiClient,
+        fglair_api_client: FglairApiClient,
         dsn: str,
         region: str,
         tokenpath: str,
@@ -224,24 +316,23 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
     ) -> None:  # pylint: disable=R0913
         """Initialize the thermostat."""
         _LOGGER.debug("FujitsuClimate init called for dsn: %s", dsn)
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=dsn)
         self._fglairapi_client = fglair_api_client
         self._dsn = dsn
         self._region = region
         self._temperature_offset = temperature_offset
         self._tokenpath = tokenpath
         self._hass = hass
-        self._fujitsu_device = SplitAC(
-            self._dsn, self._fglairapi_client, tokenpath, temperature_offset
-        )
+        self._fujitsu_device = coordinator.get_device(dsn)
 
         self._attr_supported_features = SUPPORT_FLAGS
 
-        self._properties = None
+        self._snapshot: DeviceSnapshot | None = None
         self._name = ""
         self._unique_id: str = ""
         self._aux_heat: bool = False
         self._current_temperature: float | None = None
+        self._temperature_published_at = utcnow()
         self._target_temperature: float | None = None
         self._fan_mode = None
         self._hvac_mode = None
@@ -257,46 +348,355 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
             FAN_DIFFUSE,
         ]
         self._hvac_modes: list[HVACMode] = SUPPORTED_MODES
+        # Operation mode the device was last seen on in, to turn it back on
+        self._last_operation_mode: int | None = None
+        # Requested values shown until a snapshot confirms them, and deadline
+        self._optimistic: dict[str, tuple[Any, datetime]] = {}
+        # Re-check of the shown values scheduled at their earliest deadline
+        self._unsub_recheck: CALLBACK_TYPE | None = None
+        # State reported by the device, derived once per snapshot
+        self._derived: _DerivedState | None = None
+        # Capabilities shared by the devices of the same model, when known
+        self._profile: CapabilityProfile | None = coordinator.capabilities.async_get(
+            coordinator.capability_key(dsn)
+        )
+
+        self._update_from_snapshot()
 
     def get_supported_presets(self) -> list[str]:
         """Return list of supported preset modes based on device properties."""
         supported = [PRESET_NONE]  # Always include 'none'
 
-        props: dict[str, Any] = self._properties or {}
+        snapshot = self._state
 
-        if get_prop_from_json("economy_mode", props):
+        if snapshot.economy_mode is not None:
             supported.append(PRESET_ECO)
-        if get_prop_from_json("powerful_mode", props):
+        if snapshot.powerful_mode is not None:
             supported.append(PRESET_BOOST)
-        if get_prop_from_json("min_heat", props):
+        if snapshot.min_heat is not None:
             supported.append(PRESET_AWAY)
 
         return supported
 
+    def _update_from_snapshot(self) -> None:
+        """Read the latest coordinator snapshot of this device."""
+        snapshot = (self.coordinator.data or {}).get(self._dsn)
+        if snapshot is None:
+            return
+
+        self._snapshot = snapshot
+        self._current_temperature = self._published_temperature(
+            snapshot.current_temperature
+        )
+        self._target_temperature = snapshot.target_temperature
+        if snapshot.operation_mode:
+            self._last_operation_mode = snapshot.operation_mode
+        self._name = self.name
+        # A payload without operation mode tells nothing about the model
+        if snapshot.operation_mode is not None:
+            self._profile = self.coordinator.capabilities.async_get_or_create(
+                self.coordinator.capability_key(self._dsn), self._device_profile
+            )
+        self._derived = self._derive_state()
+        self._reconcile_optimistic()
+        self._schedule_recheck()
+
+        self._unique_id = self.unique_id
+        self._aux_heat = self.is_aux_heat_on
+
+        _LOGGER.debug(
+            "FujitsuClimate device [%s] detected supported presets: %s",
+            self._name,
+            self.preset_modes,
+        )
+
+        self._fan_mode = self.fan_mode
+        self._hvac_mode = self.hvac_mode
+        self._swing_modes = self.swing_modes
+        self._swing_mode = self.swing_mode
+        self._swing_horizontal_modes = self.swing_horizontal_modes
+        self._swing_horizontal_mode = self.swing_horizontal_mode
+        self._preset_modes = [PRESET_NONE, PRESET_ECO, PRESET_BOOST, PRESET_AWAY]
+        self._on = self.is_on
+
+    def _published_temperature(self, temperature: float | None) -> float | None:
+        """Return the room temperature to show, holding back small changes.
+
+        A change is shown once it exceeds the publish deadband of the
+        coordinator or its minimum publish interval elapsed, so a jittering
+        sensor does not write a state on every poll.
+        """
+        shown = self._current_temperature
+        if temperature == shown:
+            return shown
+        now = utcnow()
+        if (
+            temperature is not None
+            and shown is not None
+            and abs(temperature - shown) <= self.coordinator.publish_deadband
+            and now
+            < self._temperature_published_at + self.coordinator.min_publish_interval
+        ):
+            return shown
+        self._temperature_published_at = now
+        return temperature
+
+    def _derive_state(self) -> _DerivedState:
+        """Compute the state reported by the device in the current snapshot."""
+        return _DerivedState(
+            target_temperature=self._target_temperature,
+            hvac_mode=self._device_hvac_mode(),
+            hvac_action=self._device_hvac_action(),
+            fan_mode=self._device_fan_mode(),
+            swing_mode=self._device_swing_mode(),
+            swing_horizontal_mode=self._device_swing_horizontal_mode(),
+            preset_mode=self._device_preset_mode(),
+        )
+
+    def _device_profile(self) -> CapabilityProfile:
+        """Work out the capabilities of the device from its properties."""
+        return CapabilityProfile(
+            preset_modes=self._device_preset_modes(),
+            swing_modes=self._device_swing_modes(),
+            swing_horizontal_modes=self._device_swing_horizontal_modes(),
+            supported_features=self._device_supported_features(),
+        )
+
+    def _capability(self, attr: str) -> Any:
+        """Return a capability from the profile of the device model."""
+        if self._profile is not None:
+            return getattr(self._profile, attr)
+        # Unknown model and no snapshot yet, nothing is supported
+        return getattr(self, f"_device_{attr}")()
+
+    def _reported(self, attr: str) -> Any:
+        """Return an attribute as reported by the device."""
+        if self._derived is not None:
+            return getattr(self._derived, attr)
+        # No snapshot yet, nothing is reported
+        return getattr(self, f"_device_{attr}")()
+
+    @property
+    def _state(self) -> DeviceSnapshot:
+        """Return the latest snapshot of the device, empty before the first."""
+        return self._snapshot or DeviceSnapshot()
+
+    def _supported_swings(self) -> tuple[bool, bool]:
+        """Return whether the vertical and horizontal vanes can be directed."""
+        snapshot = self._state
+        return (
+            snapshot.af_vertical_direction is not None,
+            snapshot.af_horizontal_direction is not None,
+        )
+
+    def _shown(self, attr: str) -> Any:
+        """Return an attribute, preferring a value requested but not confirmed."""
+        if attr in self._optimistic:
+            return self._optimistic[attr][0]
+        return self._reported(attr)
+
+    def _device_target_temperature(self) -> float | None:
+        """Return the target temperature reported by the device."""
+        return self._target_temperature
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update attributes when the coordinator updates."""
+        self._update_from_snapshot()
         super()._handle_coordinator_update()
 
+    async def async_update(self) -> None:
+        """Fetch the device now, its state was asked for."""
+        self.coordinator.async_note_interaction(self._dsn)
+        await super().async_update()
+
+    @property
+    def available(self) -> bool:
+        """Return True when the coordinator holds a snapshot of this device."""
+        return super().available and self._dsn in (self.coordinator.data or {})
+
+    async def _async_send_command(
+        self,
+        prop: str,
+        api_call: Callable[[], Awaitable[Any]],
+        optimistic: dict[str, Any] | None = None,
+        *,
+        force: bool = False,
+    ) -> None:
+        """Send a write through the command queue of the device, with retries.
+
+        The ``optimistic`` attribute values are shown right away and dropped
+        again when the write fails. Unless ``force`` is set, nothing is sent
+        when the entity already shows all of them.
+        """
+        optimistic = optimistic or {}
+        if not force and self._already_shown(optimistic):
+            _LOGGER.debug(
+                "FujitsuClimate device [%s] already reports %s, write skipped",
+                self._dsn,
+                optimistic,
+            )
+            return
+
+        if optimistic:
+            expires = utcnow() + self.coordinator.optimistic_grace_period
+            self._optimistic.update(
+                (attr, (value, expires)) for attr, value in optimistic.items()
+            )
+            self._schedule_recheck()
+            self.async_write_ha_state()
+
+        try:
+            await self.coordinator.async_send_command(
+                self._dsn, prop, lambda: _async_retry_api_call(api_call)
+            )
+        except Exception:
+            for attr, value in optimistic.items():
+                if self._optimistic.get(attr, (None,))[0] == value:
+                    del self._optimistic[attr]
+            if optimistic:
+                self.async_write_ha_state()
+            raise
+
+        # Poll fast until the device reports the new value
+        self.coordinator.async_note_command(self._dsn)
+
+    def _already_shown(self, values: dict[str, Any]) -> bool:
+        """Return True when the entity already shows all the given values.
+
+        A value is shown when a pending write requested it, or when the
+        device reported it in a snapshot this run fetched lately. Restored
+        and seldom polled snapshots may be stale, they are not trusted.
+        """
+        if not values:
+            return False
+        fresh = self.coordinator.is_fresh(self._dsn)
+        for attr, value in values.items():
+            if attr in self._optimistic:
+                if self._optimistic[attr][0] != value:
+                    return False
+            elif not fresh or self._reported(attr) != value:
+                return False
+        return True
+
+    def _property_key(self, name: str) -> Any:
+        """Return the key a device property is written with."""
+        prop = getattr(self._fujitsu_device, f"get_{name}")()
+        if not isinstance(prop, dict) or prop.get("key") is None:
+            raise HomeAssistantError(f"Device does not report {name}")
+        return prop["key"]
+
+    def _write(self, *values: tuple[str, int]) -> Callable[[], Awaitable[None]]:
+        """Return a call writing property values in order.
+
+        The device is not read back, the coordinator polls it fast after a
+        command until it reports the new values.
+        """
+        writes = [(self._property_key(name), value) for name, value in values]
+
+        async def write() -> None:
+            for key, value in writes:
+                await self._fglairapi_client.async_set_device_property(key, value)
+
+        return write
+
+    async def _async_last_operation_mode(self, key: Any) -> int:
+        """Return the mode to turn the device on in.
+
+        That is the last mode a snapshot showed the device on in or, when it
+        was off since the start, the last one in the history of the property.
+        """
+        if self._last_operation_mode is not None:
+            return self._last_operation_mode
+        datapoints = await self._fglairapi_client.async_get_device_property(key)
+        for datapoint in reversed(datapoints if isinstance(datapoints, list) else []):
+            if value := datapoint.get("datapoint", {}).get("value"):
+                return int(value)
+        return OPERATION_MODE_AUTO
+
+    def _vane_write(
+        self, direction: str, position: int
+    ) -> Callable[[], Awaitable[None]]:
+        """Return a call stopping the swing of a vane and directing it."""
+        num_dir = getattr(self._state, f"af_{direction}_num_dir")
+        if position not in _vane_positions(num_dir):
+            raise HomeAssistantError(f"Unsupported {direction} position: {position}")
+        return self._write(
+            (f"af_{direction}_swing", 0), (f"af_{direction}_direction", position)
+        )
+
+    def _reconcile_optimistic(self) -> None:
+        """Keep the requested values the device did not report yet."""
+        now = utcnow()
+        pending = self._optimistic
+        self._optimistic = {}
+        for attr, (value, expires) in pending.items():
+            if (reported := self._reported(attr)) == value:
+                continue
+            if now < expires:
+                self._optimistic[attr] = (value, expires)
+            else:
+                _LOGGER.debug(
+                    "FujitsuClimate device [%s] rolled back %s to [%s]",
+                    self._dsn,
+                    attr,
+                    reported,
+                )
+
+    def _schedule_recheck(self) -> None:
+        """Read the snapshot again once a shown value may have to change.
+
+        Listeners are only called when the snapshot changed, so a device
+        ignoring a write would otherwise keep its requested value shown, and
+        a held back room temperature would never be shown once steady.
+        """
+        self._cancel_recheck()
+        deadlines = [expires for _, expires in self._optimistic.values()]
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and snapshot.current_temperature != self._current_temperature
+        ):
+            deadlines.append(
+                self._temperature_published_at + self.coordinator.min_publish_interval
+            )
+        if deadlines:
+            self._unsub_recheck = async_call_later(
+                self._hass,
+                max(min(deadlines) - utcnow(), timedelta(0)),
+                self._async_recheck,
+            )
+
+    @callback
+    def _async_recheck(self, _now: datetime) -> None:
+        """Re-check the shown values against the unchanged snapshot."""
+        self._unsub_recheck = None
+        self._handle_coordinator_update()
+
+    @callback
+    def _cancel_recheck(self) -> None:
+        """Cancel the scheduled re-check."""
+        if self._unsub_recheck is not None:
+            self._unsub_recheck()
+            self._unsub_recheck = None
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_recheck)
         self._handle_coordinator_update()
 
     @property
     def name(self) -> str:
         """Return the name of the thermostat."""
-        data: str = self._fujitsu_device.get_device_name()["value"]
+        data: str = self._state.device_name or self._name
         _LOGGER.debug("FujitsuClimate return device name [%s]", data)
         return data
 
     @property
     def is_aux_heat_on(self) -> bool:
         """Reusing is for Powerfull mode."""
-        if not hasattr(self._fujitsu_device.get_powerful_mode(), "value"):
-            return False
-
-        return bool(self._fujitsu_device.get_powerful_mode()["value"])
+        return bool(self._state.powerful_mode)
 
     @property
     def current_temperature(self) -> float | None:
@@ -305,6 +705,7 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
+        force: bool = kwargs.get(ATTR_FORCE, False)
         if (target_temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
             rounded_temperature = self.round_off_temperature(target_temperature)
             _LOGGER.debug(
@@ -314,10 +715,15 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
                 target_temperature,
                 rounded_temperature,
             )
-            await _async_retry_api_call(
-                lambda: self._fujitsu_device.async_change_temperature(
-                    rounded_temperature
+            if not MIN_TEMP <= rounded_temperature <= MAX_TEMP:
+                raise ServiceValidationError(
+                    f"Temperature out of range: {rounded_temperature}"
                 )
+            await self._async_send_command(
+                "adjust_temperature",
+                self._write(("adjust_temperature", int(rounded_temperature * 10))),
+                {"target_temperature": rounded_temperature},
+                force=force,
             )
         else:
             _LOGGER.error(
@@ -329,22 +735,10 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
         """Round temperature to the closest half."""
         return round(temperature * 2) / 2
 
-    async def async_target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
-        try:
-            data = await _async_retry_api_call(
-                self._fujitsu_device.async_get_adjust_temperature_degree
-            )
-        except HomeAssistantError:
-            # Return None if API fails - retry logic already logged the error
-            return None
-        else:
-            return data
-
     @property
     def target_temperature(self) -> float | None:
         """Getter for the temperature we try to reach."""
-        return self._target_temperature
+        return self._shown("target_temperature")
 
     @property
     def target_temperature_step(self) -> float:
@@ -354,24 +748,23 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
     @property
     def is_on(self) -> bool:
         """Return true if on."""
-        return self._fujitsu_device.get_operation_mode()["value"] != 0
+        return bool(self._state.operation_mode)
 
     @property
     def hvac_mode(self) -> Any:
         """Return current operation ie. heat, cool, idle."""
-        operation_mode_desc = self._fujitsu_device.get_operation_mode_desc()
-        label_state = FUJITSU_TO_HA_STATE.get(operation_mode_desc)
+        return self._shown("hvac_mode")
 
-        operation_mode_value = self._fujitsu_device.get_operation_mode().get(
-            "value", "Unknown"
-        )
+    def _device_hvac_mode(self) -> Any:
+        """Return the operation reported by the device."""
+        operation_mode_value = self._state.operation_mode
+        label_state = OPERATION_MODE_TO_HA.get(operation_mode_value)
 
         _LOGGER.debug(
             "FujitsuClimate device [%s] return current operation_mode [%s] ;"
-            " operation_mode_desc [%s] ; translated into [%s]",
+            " translated into [%s]",
             self._name,
             operation_mode_value,
-            operation_mode_desc,
             label_state,
         )
         return label_state
@@ -386,7 +779,9 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
         )
         return self._hvac_modes
 
-    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(
+        self, hvac_mode: HVACMode, *, force: bool = False
+    ) -> None:
         """Set new target hvac mode."""
         _LOGGER.debug(
             "FujitsuClimate device [%s] set_hvac_mode called. Current"
@@ -395,17 +790,15 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
             self._hvac_mode,
             hvac_mode,
         )
-        if hvac_mode not in HA_STATE_TO_FUJITSU:
+        if hvac_mode not in HA_TO_OPERATION_MODE:
             raise ServiceValidationError(f"Unsupported HVAC mode: {hvac_mode}")
 
-        if hvac_mode == HVACMode.OFF:
-            await _async_retry_api_call(self._fujitsu_device.async_turnOff)
-        else:
-            await _async_retry_api_call(
-                lambda: self._fujitsu_device.async_change_operation_mode(
-                    HA_STATE_TO_FUJITSU.get(hvac_mode)
-                )
-            )
+        await self._async_send_command(
+            "operation_mode",
+            self._write(("operation_mode", HA_TO_OPERATION_MODE[hvac_mode])),
+            {"hvac_mode": hvac_mode},
+            force=force,
+        )
 
         _LOGGER.debug(
             "FujitsuClimate device [%s] set_hvac_mode called. Current mode"
@@ -418,30 +811,31 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current running hvac operation."""
+        return self._reported("hvac_action")
+
+    def _device_hvac_action(self) -> HVACAction | None:
+        """Return the running hvac operation reported by the device."""
         # HVACAction.IDLE is not (yet) managed by underlying pyfujitsugeneral library
         if not self.is_on:
             return HVACAction.OFF
 
-        op_status_desc = self._fujitsu_device.get_op_status_desc()
+        op_status = self._state.op_status
 
         _LOGGER.debug(
             "Getting hvac_action on FujitsuClimate device [%s]: [%s]",
             self._name,
-            op_status_desc,
+            op_status,
         )
 
-        if op_status_desc == "Normal":
-            operation_mode = self._fujitsu_device.get_operation_mode_desc()
-            label_state = FUJITSU_TO_HA_STATE.get(operation_mode)
-
+        if op_status == OP_STATUS_NORMAL:
             return {
                 HVACMode.HEAT: HVACAction.HEATING,
                 HVACMode.COOL: HVACAction.COOLING,
                 HVACMode.DRY: HVACAction.DRYING,
                 HVACMode.FAN_ONLY: HVACAction.FAN,
-            }.get(label_state)
+            }.get(self._device_hvac_mode())
 
-        if op_status_desc == "Defrost":
+        if op_status == OP_STATUS_DEFROST:
             return HVACAction.PREHEATING
 
         return None
@@ -449,191 +843,121 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
     async def async_turn_on(self) -> None:
         """Set the HVAC State to on."""
         _LOGGER.debug("Turning on FujitsuClimate device [%s]", self._name)
-        await _async_retry_api_call(self._fujitsu_device.async_turnOn)
-
-    async def async_turn_off(self) -> None:
-        """Set the HVAC State to off."""
-        _LOGGER.debug("Turning off FujitsuClimate device [%s]", self._name)
-        await _async_retry_api_call(self._fujitsu_device.async_turnOff)
-
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    async def async_update(self) -> None:
-        """Retrieve latest state."""
-        _LOGGER.debug("Update FujitsuClimate device by async_update")
-
-        try:
-            self._properties = await _async_retry_api_call(
-                self._fujitsu_device.async_update_properties
-            )
-        except HomeAssistantError:
-            # Skip update if API fails - retry logic already logged the error
-            return
+        key = self._property_key("operation_mode")
 
-        self._name = self.name  # ensure name is current
+        async def turn_on() -> None:
+            mode = await self._async_last_operation_mode(key)
+            await self._fglairapi_client.async_set_device_property(key, mode)
 
-        _LOGGER.debug(
-            "FujitsuClimate device [%s] detected supported presets: %s",
-            self._name,
-            self.get_supported_presets(),
-        )
+        await self._async_send_command("operation_mode", turn_on)
 
-        self._name = self.name
-        self._unique_id = self.unique_id
-        self._aux_heat = self.is_aux_heat_on
-
-        with suppress(HomeAssistantError):
-            self._current_temperature = await _async_retry_api_call(
-                self._fujitsu_device.async_get_display_temperature_degree
-            )
-
-        try:
-            await self._async_refresh_display_temperature_request(
-                self._fujitsu_device.get_refresh()["data_updated_at"]
-            )
-        except (HomeAssistantError, KeyError) as ex:
-            _LOGGER.warning(
-                "Failed to refresh display temperature for device %s: %s",
-                self._name,
-                ex,
-            )
-
-        self._target_temperature = await self.async_target_temperature()
-        self._fan_mode = self.fan_mode
-        self._hvac_mode = self.hvac_mode
-        self._swing_modes = self.swing_modes
-        self._swing_mode = self.swing_mode
-        self._swing_horizontal_modes = self.swing_horizontal_modes
-        self._swing_horizontal_mode = self.swing_horizontal_mode
-        self._fan_modes = [
-            FAN_AUTO,
-            FAN_LOW,
-            FAN_MEDIUM,
-            FAN_HIGH,
-            FAN_DIFFUSE,
-        ]
-        self._hvac_modes = SUPPORTED_MODES
-        self._preset_modes = [PRESET_NONE, PRESET_ECO, PRESET_BOOST, PRESET_AWAY]
-        self._on = self.is_on
-
-        _LOGGER.debug(
-            "FujitsuClimate finish async_update for device [%s]",
-            self.name,
-        )
-
-    async def _async_refresh_display_temperature_request(
-        self, refreshed_data_updated_at_str: str
-    ) -> None:
-        refreshed_data_updated_at = datetime.strptime(
-            refreshed_data_updated_at_str, "%Y-%m-%dT%H:%M:%S%z"
-        )
-        _LOGGER.debug("Last refreshed update date [%s]", refreshed_data_updated_at)
-        must_be_refreshed = utcnow() > (
-            refreshed_data_updated_at + REFRESH_MINUTES_INTERVAL
+    async def async_turn_off(self, *, force: bool = False) -> None:
+        """Set the HVAC State to off."""
+        _LOGGER.debug("Turning off FujitsuClimate device [%s]", self._name)
+        await self._async_send_command(
+            "operation_mode",
+            self._write(("operation_mode", 0)),
+            {"hvac_mode": HVACMode.OFF},
+            force=force,
         )
 
-        if must_be_refreshed:
-            _LOGGER.debug("display_temperature will be refreshed in async mode")
-            await self._fujitsu_device.async_set_refresh(1)
-
     @property
     def fan_mode(self) -> Any:
         """Return the fan setting."""
+        return self._shown("fan_mode")
+
+    def _device_fan_mode(self) -> Any:
+        """Return the fan setting reported by the device."""
+        fan_mode = FAN_SPEED_TO_HA.get(self._state.fan_speed)
         _LOGGER.debug(
-            "FujitsuClimate device [%s] return fan_mode [%s]",
-            self._name,
-            DICT_FAN_MODE[self._fujitsu_device.get_fan_speed_desc()],
+            "FujitsuClimate device [%s] return fan_mode [%s]", self._name, fan_mode
         )
-        return DICT_FAN_MODE[self._fujitsu_device.get_fan_speed_desc()]
+        return fan_mode
 
     @property
     def fan_modes(self) -> list[Any]:
         """Return the list of available fan modes."""
         return self._fan_modes
 
-    async def async_set_fan_mode(self, fan_mode: Any) -> None:
+    async def async_set_fan_mode(self, fan_mode: Any, *, force: bool = False) -> None:
         """Set new target fan mode."""
-        new_fan_speed = DICT_FAN_MODE[fan_mode]
+        if fan_mode not in HA_TO_FAN_SPEED:
+            raise ServiceValidationError(f"Unsupported fan mode: {fan_mode}")
+        new_fan_speed = HA_TO_FAN_SPEED[fan_mode]
         _LOGGER.debug(
             "FujitsuClimate device [%s] set fan mode [%s], fan speed [%s]",
             self._name,
             fan_mode,
             new_fan_speed,
         )
-        await _async_retry_api_call(
-            lambda: self._fujitsu_device.async_changeFanSpeed(new_fan_speed)
+        await self._async_send_command(
+            "fan_speed",
+            self._write(("fan_speed", new_fan_speed)),
+            {"fan_mode": fan_mode},
+            force=force,
         )
 
     @property
     def swing_mode(self) -> str | None:
         """Return the swing setting."""
-        try:
-            # Returns vertical settings, horizontal setting except for swing ignored
-            vane_vertical_value = self._fujitsu_device.vane_vertical()
-
-            # Use helper methods for safer access to swing values
-            swing_vertical = self._fujitsu_device.get_swing_vertical_value()
-            swing_horizontal = self._fujitsu_device.get_swing_horizontal_value()
-
-            _LOGGER.debug(
-                "FujitsuClimate device [%s] vertical swing value: %s, horizontal swing"
-                " value: %s",
-                self._name,
-                swing_vertical,
-                swing_horizontal,
-            )
+        return self._shown("swing_mode")
 
-            if swing_vertical and swing_horizontal:
-                mode = SWING_BOTH
-            elif swing_vertical:
-                mode = SWING_VERTICAL
-            else:
-                mode = VERTICAL + str(vane_vertical_value)
+    def _device_swing_mode(self) -> str | None:
+        """Return the swing setting reported by the device."""
+        snapshot = self._state
+        # Returns vertical settings, horizontal setting except for swing ignored
+        swing_vertical = snapshot.af_vertical_swing
+        swing_horizontal = snapshot.af_horizontal_swing
 
-            self._swing_mode = mode
+        _LOGGER.debug(
+            "FujitsuClimate device [%s] vertical swing value: %s, horizontal swing"
+            " value: %s",
+            self._name,
+            swing_vertical,
+            swing_horizontal,
+        )
 
-        except Exception as e:
-            _LOGGER.error(
-                "Error occurred while getting swing mode for device [%s]: %s",
-                self._name,
-                str(e),
-            )
-            return None
+        if swing_vertical and swing_horizontal:
+            mode = SWING_BOTH
+        elif swing_vertical:
+            mode = SWING_VERTICAL
         else:
-            _LOGGER.debug(
-                "FujitsuClimate device [%s] mode value: %s",
-                self._name,
-                self._swing_mode,
+            vane_vertical_value = snapshot.af_vertical_direction
+            mode = VERTICAL + str(
+                -1 if vane_vertical_value is None else vane_vertical_value
             )
-            return self._swing_mode
+
+        _LOGGER.debug("FujitsuClimate device [%s] mode value: %s", self._name, mode)
+        return mode
 
     @property
     def swing_modes(self) -> list[str] | None:
         """List of available swing modes."""
+        return self._capability("swing_modes")
 
-        vert_pos_list = self._fujitsu_device.vane_vertical_positions()
-        hori_pos_list = self._fujitsu_device.vane_horizontal_positions()
+    def _device_swing_modes(self) -> list[str] | None:
+        """Return the swing modes supported by the device."""
+        snapshot = self._state
+        vert_pos_list = _vane_positions(snapshot.af_vertical_num_dir)
+        hori_pos_list = _vane_positions(snapshot.af_horizontal_num_dir)
 
         pos_list: list[str] = []
 
         # Add swing modes to the list if supported
-        modes_list = self._fujitsu_device.get_swing_modes_supported()
+        vertical, horizontal = self._supported_swings()
 
-        if modes_list == "Both":
+        if vertical and horizontal:
             pos_list.append(SWING_VERTICAL)
             pos_list.append(SWING_HORIZONTAL)
             pos_list.append(SWING_BOTH)
-            if vert_pos_list:
-                pos_list += [VERTICAL + str(itm) for itm in vert_pos_list]
-            if hori_pos_list:
-                pos_list += [HORIZONTAL + str(itm) for itm in hori_pos_list]
-        elif modes_list == "Vertical":
+            pos_list += [VERTICAL + str(itm) for itm in vert_pos_list]
+            pos_list += [HORIZONTAL + str(itm) for itm in hori_pos_list]
+        elif vertical:
             pos_list.append(SWING_VERTICAL)
-            if vert_pos_list:
-                pos_list += [VERTICAL + str(itm) for itm in vert_pos_list]
-        elif modes_list == "Horizontal":
+            pos_list += [VERTICAL + str(itm) for itm in vert_pos_list]
+        elif horizontal:
             pos_list.append(SWING_HORIZONTAL)
-            if hori_pos_list:
-                pos_list += [HORIZONTAL + str(itm) for itm in hori_pos_list]
+            pos_list += [HORIZONTAL + str(itm) for itm in hori_pos_list]
 
         # If pos_list is empty, return None instead of an empty list
         if not pos_list:
@@ -642,143 +966,88 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
             )
             return None
 
-        self._swing_modes = pos_list
-
         _LOGGER.debug(
             "FujitsuClimate device [%s] returning swing modes [%s]",
             self._name,
-            self._swing_modes,
+            pos_list,
         )
-
-        return self._swing_modes
+        return pos_list
 
     @property
     def swing_horizontal_mode(self) -> str | None:
         """Return the horizontal swing setting."""
-        try:
-            # First check if the device supports horizontal swing at all
-            modes_list = self._fujitsu_device.get_swing_modes_supported()
-            # Handle both string and list return types
-            if isinstance(modes_list, list):
-                modes_str = " ".join(modes_list).lower()
-            else:
-                modes_str = str(modes_list).lower() if modes_list else ""
-
-            # If device doesn't support horizontal swing, return None
-            if not modes_list or "horizontal" not in modes_str:
-                _LOGGER.debug(
-                    "FujitsuClimate device [%s] does not support horizontal swing",
-                    self._name,
-                )
-                return None
+        return self._shown("swing_horizontal_mode")
 
-            swing_horizontal = self._fujitsu_device.get_swing_horizontal_value()
+    def _device_swing_horizontal_mode(self) -> str | None:
+        """Return the horizontal swing setting reported by the device."""
+        # If device doesn't support horizontal swing, return None
+        if not self._supported_swings()[1]:
             _LOGGER.debug(
-                "FujitsuClimate device [%s] horizontal swing value: %s",
+                "FujitsuClimate device [%s] does not support horizontal swing",
                 self._name,
-                swing_horizontal,
-            )
-            if swing_horizontal:
-                mode = SWING_HORIZONTAL
-            else:
-                # When horizontal swing is off, try to get the current horizontal
-                # position. This is consistent with how swing_mode handles vertical
-                # positions
-                try:
-                    # Try to get current horizontal position if available
-                    # Note: This assumes there's a method to get current horizontal
-                    # position. If not available, we'll fall back to None
-                    if hasattr(self._fujitsu_device, "vane_horizontal"):
-                        vane_horizontal_value = self._fujitsu_device.vane_horizontal()
-                        mode = HORIZONTAL + str(vane_horizontal_value)
-                    else:
-                        # Fallback: return None if no method to get current position
-                        mode = None
-                except Exception:
-                    # If we can't get the current position, return None
-                    mode = None
-            self._swing_horizontal_mode = mode
-            _LOGGER.debug(
-                "FujitsuClimate device [%s] horizontal swing mode: %s",
-                self._name,
-                self._swing_horizontal_mode,
-            )
-        except Exception as ex:
-            _LOGGER.error(
-                "Error getting horizontal swing mode for device [%s]: %s",
-                self._name,
-                ex,
             )
             return None
+
+        snapshot = self._state
+        _LOGGER.debug(
+            "FujitsuClimate device [%s] horizontal swing value: %s",
+            self._name,
+            snapshot.af_horizontal_swing,
+        )
+        if snapshot.af_horizontal_swing:
+            mode = SWING_HORIZONTAL
         else:
-            return self._swing_horizontal_mode
+            # Consistent with how swing_mode handles vertical positions
+            mode = HORIZONTAL + str(snapshot.af_horizontal_direction)
+        _LOGGER.debug(
+            "FujitsuClimate device [%s] horizontal swing mode: %s",
+            self._name,
+            mode,
+        )
+        return mode
 
     @property
     def swing_horizontal_modes(self) -> list[str] | None:
         """List of available horizontal swing modes."""
-        try:
-            pos_list: list[str] = []
-            modes_list = self._fujitsu_device.get_swing_modes_supported()
-            # Handle both string and list return types
-            if isinstance(modes_list, list):
-                modes_str = " ".join(modes_list).lower()
-            else:
-                modes_str = str(modes_list).lower() if modes_list else ""
+        return self._capability("swing_horizontal_modes")
 
-            if modes_list and "horizontal" in modes_str:
-                pos_list.append(SWING_HORIZONTAL)
-                try:
-                    horizontal_positions = (
-                        self._fujitsu_device.get_horizontal_positions()
-                    )
-                    if horizontal_positions:
-                        # PERF401: usare una list comprehension
-                        pos_list.extend(
-                            [f"{HORIZONTAL}{pos}" for pos in horizontal_positions]
-                        )
-                except Exception:
-                    pass
-            if not pos_list:
-                _LOGGER.debug(
-                    "Device [%s] does not support horizontal swing modes",
-                    self._name,
-                )
-                return None
-            self._swing_horizontal_modes = pos_list
+    def _device_swing_horizontal_modes(self) -> list[str] | None:
+        """Return the horizontal swing modes supported by the device."""
+        if not self._supported_swings()[1]:
             _LOGGER.debug(
-                "FujitsuClimate device [%s] returning horizontal swing modes [%s]",
-                self._name,
-                self._swing_horizontal_modes,
-            )
-        except Exception as ex:
-            _LOGGER.error(
-                "Error getting horizontal swing modes for device [%s]: %s",
+                "Device [%s] does not support horizontal swing modes",
                 self._name,
-                ex,
             )
             return None
-        else:
-            return self._swing_horizontal_modes
 
-    async def async_set_swing_horizontal_mode(self, swing_horizontal_mode: Any) -> None:
+        pos_list = [SWING_HORIZONTAL] + [
+            f"{HORIZONTAL}{pos}"
+            for pos in _vane_positions(self._state.af_horizontal_num_dir)
+        ]
+        _LOGGER.debug(
+            "FujitsuClimate device [%s] returning horizontal swing modes [%s]",
+            self._name,
+            pos_list,
+        )
+        return pos_list
+
+    async def async_set_swing_horizontal_mode(
+        self, swing_horizontal_mode: Any, *, force: bool = False
+    ) -> None:
         """Set new target horizontal swing."""
         try:
-            modes_list = self._fujitsu_device.get_swing_modes_supported()
-            # Handle both string and list return types
-            if isinstance(modes_list, list):
-                modes_str = " ".join(modes_list).lower()
-            else:
-                modes_str = str(modes_list).lower() if modes_list else ""
-
-            if not modes_list or "horizontal" not in modes_str:
+            if not self._supported_swings()[1]:
                 _LOGGER.warning(
                     "FujitsuClimate device [%s] does not support horizontal swing mode",
                     self._name,
                 )
                 return
             if swing_horizontal_mode == SWING_HORIZONTAL:
-                await _async_retry_api_call(
-                    lambda: self._fujitsu_device.async_set_af_horizontal_swing(1)
+                await self._async_send_command(
+                    "af_horizontal_swing",
+                    self._write(("af_horizontal_swing", 1)),
+                    {"swing_horizontal_mode": swing_horizontal_mode},
+                    force=force,
                 )
             elif isinstance(
                 swing_horizontal_mode, str
@@ -787,10 +1056,11 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
                 position_str = swing_horizontal_mode[len(HORIZONTAL) :]
                 try:
                     position = int(position_str)
-                    await _async_retry_api_call(
-                        lambda: self._fujitsu_device.async_set_vane_horizontal_position(
-                            position
-                        )
+                    await self._async_send_command(
+                        "vane_horizontal_position",
+                        self._vane_write("horizontal", position),
+                        {"swing_horizontal_mode": swing_horizontal_mode},
+                        force=force,
                     )
                 except ValueError as ex:
                     _LOGGER.error(
@@ -826,23 +1096,40 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
                 f"Failed to set horizontal swing mode: {ex}"
             ) from ex
 
-    async def async_set_swing_mode(self, swing_mode: Any) -> None:
+    async def async_set_swing_mode(
+        self, swing_mode: Any, *, force: bool = False
+    ) -> None:
         """Set new target swing."""
         # Note setting one direction will not affect other, except swing both
         if swing_mode == SWING_VERTICAL:
-            await _async_retry_api_call(
-                lambda: self._fujitsu_device.async_set_af_vertical_swing(1)
+            await self._async_send_command(
+                "af_vertical_swing",
+                self._write(("af_vertical_swing", 1)),
+                {"swing_mode": swing_mode},
+                force=force,
             )
         elif swing_mode == SWING_HORIZONTAL:
-            await _async_retry_api_call(
-                lambda: self._fujitsu_device.async_set_af_horizontal_swing(1)
+            # swing_mode only reports vertical settings
+            await self._async_send_command(
+                "af_horizontal_swing",
+                self._write(("af_horizontal_swing", 1)),
+                {"swing_horizontal_mode": swing_mode},
+                force=force,
             )
         elif swing_mode == SWING_BOTH:
-            await _async_retry_api_call(
-                lambda: self._fujitsu_device.async_set_af_vertical_swing(1)
-            )
-            await _async_retry_api_call(
-                lambda: self._fujitsu_device.async_set_af_horizontal_swing(1)
+            await asyncio.gather(
+                self._async_send_command(
+                    "af_vertical_swing",
+                    self._write(("af_vertical_swing", 1)),
+                    {"swing_mode": swing_mode},
+                    force=force,
+                ),
+                self._async_send_command(
+                    "af_horizontal_swing",
+                    self._write(("af_horizontal_swing", 1)),
+                    {"swing_horizontal_mode": SWING_HORIZONTAL},
+                    force=force,
+                ),
             )
         elif isinstance(swing_mode, str) and swing_mode.startswith(VERTICAL):
             # Extract the position number after "Vertical"
@@ -851,10 +1138,11 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
                 raise HomeAssistantError("Empty vertical position")
             try:
                 position = int(position_str)
-                await _async_retry_api_call(
-                    lambda: self._fujitsu_device.async_set_vane_vertical_position(
-                        position
-                    )
+                await self._async_send_command(
+                    "vane_vertical_position",
+                    self._vane_write("vertical", position),
+                    {"swing_mode": swing_mode},
+                    force=force,
                 )
             except ValueError as ex:
                 _LOGGER.error(
@@ -873,10 +1161,11 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
                 raise HomeAssistantError("Empty horizontal position")
             try:
                 position = int(position_str)
-                await _async_retry_api_call(
-                    lambda: self._fujitsu_device.async_set_vane_horizontal_position(
-                        position
-                    )
+                await self._async_send_command(
+                    "vane_horizontal_position",
+                    self._vane_write("horizontal", position),
+                    {"swing_horizontal_mode": swing_mode},
+                    force=force,
                 )
             except ValueError as ex:
                 _LOGGER.error(
@@ -897,24 +1186,23 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
     @property
     def preset_mode(self) -> Any:
         """Return the preset setting."""
-        properties = self._fujitsu_device.get_properties()
+        return self._reported("preset_mode")
+
+    def _device_preset_mode(self) -> Any:
+        """Return the preset reported by the device."""
+        snapshot = self._state
 
         # Check if all preset props are missing
-        if (
-            not get_prop_from_json("economy_mode", properties)
-            and not get_prop_from_json("powerful_mode", properties)
-            and not get_prop_from_json("min_heat", properties)
-        ):
+        if all(getattr(snapshot, name) is None for name in PRESET_PROPERTIES):
             _LOGGER.debug(
                 "FujitsuClimate device [%s] has no preset props",
                 self._name,
             )
             return PRESET_NONE
 
-        # Use helper methods for safer access to preset values
-        eco_value = self._fujitsu_device.get_economy_mode_value()
-        boost_value = self._fujitsu_device.get_powerful_mode_value()
-        min_heat_value = self._fujitsu_device.get_min_heat_value()
+        eco_value = snapshot.economy_mode
+        boost_value = snapshot.powerful_mode
+        min_heat_value = snapshot.min_heat
 
         if eco_value:
             _LOGGER.debug(
@@ -945,9 +1233,15 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
     @property
     def preset_modes(self) -> list[str]:
         """Return the supported preset modes for this device."""
+        return self._capability("preset_modes")
+
+    def _device_preset_modes(self) -> list[str]:
+        """Return the preset modes supported by the device."""
         return self.get_supported_presets()
 
-    async def async_set_preset_mode(self, preset_mode: Any) -> None:
+    async def async_set_preset_mode(
+        self, preset_mode: Any, *, force: bool = False
+    ) -> None:
         """Set preset mode."""
         _LOGGER.debug(
             "FujitsuClimate device [%s] preset choice: %s",
@@ -955,47 +1249,65 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
             str(preset_mode).upper(),
         )
 
-        def has_valid_key(prop):
-            return isinstance(prop, dict) and "key" in prop and prop["key"] is not None
-
-        if preset_mode == PRESET_NONE:
-            if has_valid_key(self._fujitsu_device.get_economy_mode()):
-                await self._fujitsu_device.async_economy_mode_off()
-            if has_valid_key(self._fujitsu_device.get_powerful_mode()):
-                await self._fujitsu_device.async_powerful_mode_off()
-            if has_valid_key(self._fujitsu_device.get_min_heat()):
-                await self._fujitsu_device.async_min_heat_mode_off()
-
-        elif preset_mode == PRESET_ECO:
-            if has_valid_key(self._fujitsu_device.get_powerful_mode()):
-                await self._fujitsu_device.async_powerful_mode_off()
-            if has_valid_key(self._fujitsu_device.get_min_heat()):
-                await self._fujitsu_device.async_min_heat_mode_off()
-            if has_valid_key(self._fujitsu_device.get_economy_mode()):
-                await self._fujitsu_device.async_economy_mode_on()
-
-        elif preset_mode == PRESET_BOOST:
-            if has_valid_key(self._fujitsu_device.get_economy_mode()):
-                await self._fujitsu_device.async_economy_mode_off()
-            if has_valid_key(self._fujitsu_device.get_min_heat()):
-                await self._fujitsu_device.async_min_heat_mode_off()
-            if has_valid_key(self._fujitsu_device.get_powerful_mode()):
-                await self._fujitsu_device.async_powerful_mode_on()
-
-        elif preset_mode == PRESET_AWAY:
-            if has_valid_key(self._fujitsu_device.get_economy_mode()):
-                await self._fujitsu_device.async_economy_mode_off()
-            if has_valid_key(self._fujitsu_device.get_powerful_mode()):
-                await self._fujitsu_device.async_powerful_mode_off()
-            if has_valid_key(self._fujitsu_device.get_min_heat()):
-                await self._fujitsu_device.async_min_heat_mode_on()
-
-        # Refresh device properties (to reflect latest mode)
-        await self._fujitsu_device.async_update_properties()
-        self._properties = self._fujitsu_device.get_properties()
-
-        # Also update entity internal state cache and Home Assistant UI
-        await self.async_update()
+        # Presets are exclusive: every preset property is off but the target
+        target_property = PRESET_TO_PROPERTY.get(preset_mode)
+        # Only a snapshot fetched lately tells which ones are already set
+        skip_matching = not force and self.coordinator.is_fresh(self._dsn)
+        off_writes: list[Callable[[], Awaitable[Any]]] = []
+        on_write: Callable[[], Awaitable[Any]] | None = None
+        for name in PRESET_PROPERTIES:
+            target = int(name == target_property)
+            reported = getattr(self._state, name)
+            if reported is None or (skip_matching and reported == target):
+                continue
+
+            write = self._write((name, target))
+            if target:
+                on_write = write
+            else:
+                off_writes.append(write)
+
+        if not off_writes and on_write is None:
+            _LOGGER.debug(
+                "FujitsuClimate device [%s] already in preset %s",
+                self._name,
+                preset_mode,
+            )
+            return
+
+        # The independent "off" writes go together, the "on" write last so
+        # that two presets are never on at the same time
+        await asyncio.gather(
+            *(
+                _async_retry_api_call(write, timeout=COMMAND_TIMEOUT)
+                for write in off_writes
+            )
+        )
+        if on_write is not None:
+            await _async_retry_api_call(on_write, timeout=COMMAND_TIMEOUT)
+
+        # Confirm the new mode re-reading only the preset properties. The
+        # writes went through, a failed read is left to the fast polls
+        try:
+            async with asyncio.timeout(COMMAND_TIMEOUT):
+                await self.coordinator.async_refresh_properties(
+                    self._dsn, PRESET_PROPERTIES
+                )
+        except (
+            FGLairGeneralException,
+            CircuitOpenError,
+            TimeoutError,
+            KeyError,
+            TypeError,
+        ) as ex:
+            _LOGGER.warning(
+                "FujitsuClimate device [%s] preset not confirmed yet: %s",
+                self._name,
+                ex,
+            )
+
+        # Let the coordinator poll fast until the new mode shows up
+        self.coordinator.async_note_command(self._dsn)
 
         _LOGGER.debug(
             "FujitsuClimate device [%s] preset mode set and updated",
@@ -1009,11 +1321,6 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
         """Return the unique ID for this thermostat."""
         return "_".join([self._name, "climate"])
 
-    @property
-    def should_poll(self) -> bool:
-        """Polling is required."""
-        return True
-
     @property
     def min_temp(self) -> int:
         """Return the minimum temperature."""
@@ -1032,30 +1339,20 @@ class FujitsuClimate(CoordinatorEntity[FglairDataUpdateCoordinator], ClimateEnti
     @property
     def supported_features(self) -> Any:
         """Return the list of supported features."""
-        features = SUPPORT_FLAGS
-        try:
-            modes_list = self._fujitsu_device.get_swing_modes_supported()
-            # Handle both string and list return types
-            if isinstance(modes_list, list):
-                modes_str = " ".join(modes_list).lower()
-            else:
-                modes_str = str(modes_list).lower() if modes_list else ""
+        return self._capability("supported_features")
 
-            if modes_list and "horizontal" in modes_str:
-                features |= ClimateEntityFeature.SWING_HORIZONTAL_MODE
-                _LOGGER.debug(
-                    "FujitsuClimate device [%s] supports horizontal swing mode",
-                    self._name,
-                )
-            else:
-                _LOGGER.debug(
-                    "FujitsuClimate device [%s] does not support horizontal swing mode",
-                    self._name,
-                )
-        except Exception as ex:
+    def _device_supported_features(self) -> Any:
+        """Return the features supported by the device."""
+        features = SUPPORT_FLAGS
+        if self._supported_swings()[1]:
+            features |= ClimateEntityFeature.SWING_HORIZONTAL_MODE
             _LOGGER.debug(
-                "Device [%s] error checking horizontal swing support: %s",
+                "FujitsuClimate device [%s] supports horizontal swing mode",
+                self._name,
+            )
+        else:
+            _LOGGER.debug(
+                "FujitsuClimate device [%s] does not support horizontal swing mode",
                 self._name,
-                ex,
             )
         return features
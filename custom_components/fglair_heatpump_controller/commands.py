@@ -0,0 +1,74 @@
+"""Per-device queue of the commands sent to the FGLair cloud."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+from typing import Any
+
+from .const import COMMAND_MERGE_WINDOW
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+@dataclass
+class _PendingWrite:
+    """Latest write requested for a property and the callers waiting on it."""
+
+    write: Callable[[], Awaitable[Any]]
+    future: asyncio.Future[Any]
+    merged: int = 0
+    task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+
+class DeviceCommandQueue:
+    """Send the writes of one device in order, merging rapid writes.
+
+    A write waits ``merge_window`` before it is sent. A newer write for the
+    same property within that window replaces it, last writer wins, and every
+    caller is released when the merged write lands. Writes of a device are
+    sent one at a time, in the order they were first requested.
+    """
+
+    def __init__(self, merge_window: timedelta = COMMAND_MERGE_WINDOW) -> None:
+        """Initialize."""
+        self._merge_window = merge_window
+        self._pending: dict[str, _PendingWrite] = {}
+        self._lock = asyncio.Lock()
+
+    async def async_write(self, prop: str, write: Callable[[], Awaitable[Any]]) -> Any:
+        """Queue a write of a property and wait until it landed."""
+        if (pending := self._pending.get(prop)) is None:
+            pending = _PendingWrite(write, asyncio.get_running_loop().create_future())
+            self._pending[prop] = pending
+            pending.task = asyncio.create_task(self._async_flush(prop))
+        else:
+            pending.write = write
+            pending.merged += 1
+
+        # A cancelled caller must not cancel the write the others wait for
+        return await asyncio.shield(pending.future)
+
+    def async_shutdown(self) -> None:
+        """Drop the writes not sent yet, their callers are cancelled."""
+        for pending in self._pending.values():
+            if pending.task is not None:
+                pending.task.cancel()
+            pending.future.cancel()
+        self._pending.clear()
+
+    async def _async_flush(self, prop: str) -> None:
+        """Send the latest write of a property once the window elapsed."""
+        await asyncio.sleep(self._merge_window.total_seconds())
+        async with self._lock:
+            # Writes queued from now on wait for the next flush
+            pending = self._pending.pop(prop)
+            if pending.merged:
+                _LOGGER.debug("Merged %d writes of %s", pending.merged, prop)
+            try:
+                result = await pending.write()
+            except Exception as ex:  # pylint: disable=broad-except
+                pending.future.set_exception(ex)
+            else:
+                pending.future.set_result(result)
@@ -6,16 +6,33 @@ import asyncio
 import logging
 
 from aiohttp import ClientError
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlowWithReload,
+)
 from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from pyfujitsugeneral.client import FGLairApiClient
+from pyfujitsugeneral.exceptions import FGLairGeneralException
 from pyfujitsugeneral.utils import isBlank
 import voluptuous as vol
 
+from .api import FglairApiClient
 from .const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_OPTIMISTIC_GRACE_PERIOD,
+    CONF_PUBLISH_DEADBAND,
+    CONF_RELAX_UNCOMMANDED_REFRESH,
     CONF_TEMPERATURE_OFFSET,
     CONF_TOKENPATH,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_OPTIMISTIC_GRACE_PERIOD,
+    DEFAULT_PUBLISH_DEADBAND,
+    DEFAULT_RELAX_UNCOMMANDED_REFRESH,
     DEFAULT_TEMPERATURE_OFFSET,
     DEFAULT_TOKEN_PATH,
     DOMAIN,
@@ -28,19 +45,44 @@ DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_USERNAME, default=""): str,
         vol.Required(CONF_PASSWORD, default=""): str,
         vol.Required(CONF_REGION, default="eu"): str,
-        vol.Required(CONF_TOKENPATH, default=DEFAULT_TOKEN_PATH): str,
         vol.Required(
             CONF_TEMPERATURE_OFFSET, default=DEFAULT_TEMPERATURE_OFFSET
         ): vol.Coerce(float),
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Required(
+            CONF_OPTIMISTIC_GRACE_PERIOD, default=DEFAULT_OPTIMISTIC_GRACE_PERIOD
+        ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(CONF_PUBLISH_DEADBAND, default=DEFAULT_PUBLISH_DEADBAND): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Required(
+            CONF_MIN_PUBLISH_INTERVAL, default=DEFAULT_MIN_PUBLISH_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(
+            CONF_RELAX_UNCOMMANDED_REFRESH, default=DEFAULT_RELAX_UNCOMMANDED_REFRESH
+        ): bool,
+    }
+)
+
 
 class FGLairIntegrationFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Handle a config flow."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> FGLairOptionsFlowHandler:
+        """Return the options flow of an entry."""
+        return FGLairOptionsFlowHandler()
+
     async def _create_entry(  # pylint: disable=R0913
         self,
         username: str,
@@ -83,7 +125,8 @@ class FGLairIntegrationFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[c
 
         try:
             async with asyncio.timeout(10):
-                _client = FGLairApiClient(
+                # The token only lives in memory, the shared file stays untouched
+                _client = FglairApiClient(
                     username,
                     password,
                     region,
@@ -95,6 +138,8 @@ class FGLairIntegrationFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[c
                 _LOGGER.debug("authentication token %s", acquired_token)
         except (TimeoutError, ClientError, ConnectionError):
             return self.async_abort(reason="cannot_connect")
+        except FGLairGeneralException:
+            return self.async_abort(reason="invalid_auth")
 
         return await self._create_entry(
             username,
@@ -120,6 +165,24 @@ class FGLairIntegrationFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[c
             username=username,
             password=user_input[CONF_PASSWORD],
             region=user_input[CONF_REGION],
-            tokenpath=user_input[CONF_TOKENPATH],
+            tokenpath=DEFAULT_TOKEN_PATH,
             temperature_offset=user_input[CONF_TEMPERATURE_OFFSET],
         )
+
+
+class FGLairOptionsFlowHandler(OptionsFlowWithReload):
+    """Handle the options of an entry, reloading it when they change."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,  # type: ignore[type-arg]
+    ) -> ConfigFlowResult:
+        """Show or store the tuning options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
@@ -23,12 +23,36 @@ BINARY_SENSOR_DEVICE_CLASS = "connectivity"
 # Platforms
 PLATFORMS = [Platform.CLIMATE]
 
+# Services
+ATTR_FORCE = "force"
+SERVICE_REFRESH_DEVICES = "refresh_devices"
+SERVICE_SET_TEMPERATURE = "set_temperature"
+SERVICE_SET_HVAC_MODE = "set_hvac_mode"
+SERVICE_SET_FAN_MODE = "set_fan_mode"
+SERVICE_SET_SWING_MODE = "set_swing_mode"
+SERVICE_SET_SWING_HORIZONTAL_MODE = "set_swing_horizontal_mode"
+SERVICE_SET_PRESET_MODE = "set_preset_mode"
+
 # Configuration and options
 CONF_TOKENPATH = "tokenpath"
 CONF_TEMPERATURE_OFFSET = "temperature_offset"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_OPTIMISTIC_GRACE_PERIOD = "optimistic_grace_period"
+CONF_PUBLISH_DEADBAND = "publish_deadband"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_RELAX_UNCOMMANDED_REFRESH = "relax_uncommanded_refresh"
 
 DEFAULT_TEMPERATURE_OFFSET: float = 0.0
 DEFAULT_TOKEN_PATH = "token.txt"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+# Seconds a requested value is shown before the device must report it
+DEFAULT_OPTIMISTIC_GRACE_PERIOD = 30
+# Room temperature changes within the deadband (degrees Celsius) are only
+# shown once the minimum publish interval (seconds) elapsed
+DEFAULT_PUBLISH_DEADBAND = 0.5
+DEFAULT_MIN_PUBLISH_INTERVAL = 300
+# Opt-in: refresh the sensor data of devices not commanded lately rarely
+DEFAULT_RELAX_UNCOMMANDED_REFRESH = False
 
 MIN_TEMP = 16
 MAX_TEMP = 30
@@ -40,9 +64,47 @@ HORIZONTAL = "Horizontal_"
 
 SCAN_INTERVAL = timedelta(seconds=60)
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=60)
+FAST_SCAN_INTERVAL = timedelta(seconds=5)
+FAST_SCAN_DURATION = timedelta(seconds=60)
+IDLE_SCAN_INTERVAL = timedelta(minutes=5)
+IDLE_THRESHOLD = timedelta(minutes=30)
 REFRESH_MINUTES_INTERVAL = timedelta(minutes=3)
+# With relax_uncommanded_refresh, sensor data is only refreshed every
+# REFRESH_MINUTES_INTERVAL that long after a command or a requested update
+INTERACTION_DURATION = timedelta(minutes=15)
+UNCOMMANDED_REFRESH_INTERVAL = timedelta(minutes=30)
+INVENTORY_REFRESH_INTERVAL = timedelta(hours=1)
+# Writes of the values a device shows are only skipped when its snapshot was
+# fetched by this run that recently
+FRESH_SNAPSHOT_AGE = timedelta(seconds=60)
+COMMAND_MERGE_WINDOW = timedelta(milliseconds=500)
 
 DEFAULT_TIMEOUT = 60
+# Seconds a single write may take before it is retried
+COMMAND_TIMEOUT = 10
+
+# Cloud calls fail fast for a while after that many failures in a row
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = timedelta(seconds=60)
+
+# Tokens are renewed in the background shortly before they expire
+DEFAULT_TOKEN_LIFETIME = timedelta(hours=24)
+TOKEN_RENEWAL_MARGIN = timedelta(minutes=10)
+TOKEN_RENEWAL_RETRY_INTERVAL = timedelta(minutes=1)
+
+# The token of every entry is persisted in its own store
+TOKEN_STORAGE_VERSION = 1
+TOKEN_SAVE_DELAY = 10
+
+# Capability profiles are shared by every entry and persisted in one store
+DATA_CAPABILITIES = f"{DOMAIN}_capabilities"
+CAPABILITY_STORAGE_VERSION = 1
+CAPABILITY_SAVE_DELAY = 10
+
+# The last known state of the devices of every entry is persisted in its own
+# store, so entities are rendered at startup before the cloud answered
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 30
 
 # Defaults
 DEFAULT_NAME = DOMAIN
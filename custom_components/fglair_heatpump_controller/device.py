@@ -0,0 +1,200 @@
+"""Devices of the FGLair cloud and the snapshots of their state."""
+
+from dataclasses import dataclass, field, fields, replace
+from typing import Any
+
+from pyfujitsugeneral.client import FGLairApiClient
+from pyfujitsugeneral.const import CAPABILITY_NOT_AVAILABLE, DEVICE_CAPABILITIES
+from pyfujitsugeneral.splitAC import SplitAC, get_prop_from_json
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceSnapshot:
+    """Values of a device the integration uses, parsed once from its payload.
+
+    Every property value is None when the device does not report it. The
+    raw payload, with the metadata of every property, is not kept.
+    """
+
+    current_temperature: float | None = None
+    target_temperature: float | None = None
+    device_name: str | None = None
+    device_capabilities: int | None = None
+    operation_mode: int | None = None
+    op_status: int | None = None
+    fan_speed: int | None = None
+    adjust_temperature: int | None = None
+    display_temperature: int | None = None
+    outdoor_temperature: int | None = None
+    economy_mode: int | None = None
+    powerful_mode: int | None = None
+    min_heat: int | None = None
+    outdoor_low_noise: int | None = None
+    af_vertical_swing: int | None = None
+    af_vertical_direction: int | None = None
+    af_vertical_num_dir: int | None = None
+    af_horizontal_swing: int | None = None
+    af_horizontal_direction: int | None = None
+    af_horizontal_num_dir: int | None = None
+    refresh: int | None = None
+    refresh_updated_at: str | None = field(default=None, compare=False)
+    # Cheap hash of the values, listeners are only called when it changed
+    fingerprint: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the fingerprint of the values."""
+        object.__setattr__(
+            self,
+            "fingerprint",
+            hash(tuple(getattr(self, name) for name in _FINGERPRINT_FIELDS)),
+        )
+
+    @classmethod
+    def from_properties(cls, properties: Any, **values: Any) -> "DeviceSnapshot":
+        """Parse the snapshot out of the property payload of a device."""
+        by_name = index_properties(properties)
+        if (refresh := by_name.get("refresh")) is not None:
+            values.setdefault("refresh_updated_at", refresh.get("data_updated_at"))
+        return cls(
+            **{
+                name: by_name[name].get("value")
+                for name in PROPERTY_FIELDS
+                if name in by_name
+            },
+            **values,
+        )
+
+    def with_values(self, **values: Any) -> "DeviceSnapshot":
+        """Return a copy of the snapshot holding the given values."""
+        return replace(self, **values)
+
+
+def index_properties(properties: Any) -> dict[str, dict[str, Any]]:
+    """Return the properties of a payload by their name."""
+    return {
+        item["property"]["name"]: item["property"]
+        for item in properties or ()
+        if isinstance(item, dict) and "property" in item
+    }
+
+
+# Snapshot fields holding the value of the device property of the same name
+PROPERTY_FIELDS = frozenset(
+    item.name
+    for item in fields(DeviceSnapshot)
+    if item.name
+    not in {
+        "current_temperature",
+        "target_temperature",
+        "refresh_updated_at",
+        "fingerprint",
+    }
+)
+_FINGERPRINT_FIELDS = tuple(
+    item.name
+    for item in fields(DeviceSnapshot)
+    if item.name not in {"refresh_updated_at", "fingerprint"}
+)
+
+
+class FglairSplitAC(SplitAC):
+    """SplitAC keeping the parsed values of its properties only.
+
+    The library keeps the whole property payload of the device next to the
+    values it parses out of it. This device drops the payload once parsed,
+    ``compact_properties`` rebuilds the few properties it uses so they can be
+    persisted and parsed again by the next run.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        client: FGLairApiClient,
+        tokenpath: str,
+        temperature_offset: float,
+    ) -> None:
+        """Initialize."""
+        super().__init__(dsn, client, tokenpath, temperature_offset)
+        self._op_status: dict[str, Any] = {}
+
+    async def async_update_properties(self) -> Any:
+        """Fetch and parse the properties of the device, then drop them."""
+        properties = await self._client.async_get_device_properties(self._dsn)
+        await self.async_parse_properties(properties)
+        return properties
+
+    async def async_parse_properties(self, properties: Any) -> None:
+        """Parse the values of the used properties out of a payload.
+
+        The payload is indexed once, each library setter then only scans the
+        property it parses instead of the whole payload.
+        """
+        by_name = index_properties(properties)
+
+        def only(name: str) -> list[dict[str, Any]]:
+            return [{"property": by_name[name]}] if name in by_name else []
+
+        self.set_device_name(only("device_name"))
+        self.set_device_capability(only(DEVICE_CAPABILITIES))
+        self.set_af_vertical_num_dir(only("af_vertical_num_dir"))
+        self.set_af_horizontal_num_dir(only("af_horizontal_num_dir"))
+        for name in _PARSED_PROPERTIES:
+            await getattr(self, f"async_set_{name}")(only(name))
+        # The library reads the operation status out of the payload
+        self._op_status = get_prop_from_json("op_status", only("op_status"))
+
+    def compact_properties(self) -> list[dict[str, Any]]:
+        """Return the parsed properties as a payload holding nothing else."""
+        return [
+            {"property": {"name": name, **prop}}
+            for name in sorted(PROPERTY_FIELDS)
+            if (prop := self._get_parsed(name))
+        ]
+
+    def get_op_status(self) -> dict[str, int]:
+        """Return the operation status parsed by the last update."""
+        return self._op_status
+
+    def display_temperature_degree(self) -> float | None:
+        """Return the room temperature, with the temperature offset applied.
+
+        None when the device does not report it at the moment. Unlike the
+        library, the history of the property is not fetched.
+        """
+        value = self.get_display_temperature().get("value")
+        if value is None or value == CAPABILITY_NOT_AVAILABLE:
+            return None
+        return round((value - 5000) / 100, 1) - self._temperature_offset
+
+    def adjust_temperature_degree(self) -> float | None:
+        """Return the target temperature, None when not reported."""
+        value = self.get_adjust_temperature().get("value")
+        if value is None or value == CAPABILITY_NOT_AVAILABLE:
+            return None
+        return round(value / 10, 1)
+
+    def _get_parsed(self, name: str) -> dict[str, Any]:
+        """Return the parsed value and key of a property, empty when unknown."""
+        if name == "device_capabilities":
+            return self.get_device_capability()
+        prop: dict[str, Any] = getattr(self, f"get_{name}")()
+        return prop
+
+
+# Properties parsed by the async setters of the library
+_PARSED_PROPERTIES = (
+    "af_vertical_swing",
+    "af_vertical_direction",
+    "af_horizontal_swing",
+    "af_horizontal_direction",
+    "economy_mode",
+    "fan_speed",
+    "powerful_mode",
+    "min_heat",
+    "outdoor_low_noise",
+    "refresh",
+    "operation_mode",
+    "adjust_temperature",
+    "display_temperature",
+    "outdoor_temperature",
+)
@@ -0,0 +1,348 @@
+"""Test the shared FGLair API client."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pyfujitsugeneral.exceptions import FGLairGeneralException
+import pytest
+
+from custom_components.fglair_heatpump_controller.api import FglairApiClient
+from custom_components.fglair_heatpump_controller.breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from custom_components.fglair_heatpump_controller.const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_TOKEN_PATH,
+    TOKEN_RENEWAL_MARGIN,
+    TOKEN_RENEWAL_RETRY_INTERVAL,
+    TOKEN_SAVE_DELAY,
+)
+
+LIBRARY_API_WRAPPER = "pyfujitsugeneral.client.FGLairApiClient.api_wrapper"
+SIGN_IN_RESPONSE = {"access_token": "renewed", "expires_in": 3600}
+
+
+def _client(
+    access_token: str | None = None, store: MagicMock | None = None
+) -> FglairApiClient:
+    """Return a client with a mocked session."""
+    return FglairApiClient(
+        "user",
+        "pass",
+        "eu",
+        DEFAULT_TOKEN_PATH,
+        MagicMock(),
+        access_token=access_token,
+        store=store,
+    )
+
+
+def test_client_keeps_seeded_token() -> None:
+    """Test the client exposes the token it was seeded with."""
+    assert _client("seeded").access_token == "seeded"
+    assert _client().access_token is None
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_read_token_uses_memory_without_login() -> None:
+    """Test a seeded token is used without reading the file or logging in."""
+    client = _client("seeded")
+
+    with patch(LIBRARY_API_WRAPPER, AsyncMock()) as mock_api_wrapper:
+        assert await client._async_read_token() == "seeded"
+
+    mock_api_wrapper.assert_not_called()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_read_token_logs_in_without_token_file() -> None:
+    """Test a missing token triggers a login instead of a token file read."""
+    client = _client()
+
+    with (
+        patch(
+            "pyfujitsugeneral.client.FGLairApiClient._async_read_token", AsyncMock()
+        ) as mock_read_token_file,
+        patch(
+            LIBRARY_API_WRAPPER, AsyncMock(return_value=SIGN_IN_RESPONSE)
+        ) as mock_api_wrapper,
+    ):
+        assert await client._async_read_token() == "renewed"
+        assert await client._async_read_token() == "renewed"
+
+    mock_read_token_file.assert_not_called()
+    mock_api_wrapper.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_authenticate_keeps_new_token() -> None:
+    """Test a login replaces the in-memory token."""
+    client = _client("expired")
+
+    with patch(LIBRARY_API_WRAPPER, AsyncMock(return_value=SIGN_IN_RESPONSE)):
+        assert await client.async_authenticate() == "renewed"
+
+    assert client.access_token == "renewed"
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_get_devices_reuses_token() -> None:
+    """Test listing devices hands the in-memory token to the library."""
+    client = _client("seeded")
+
+    with patch(
+        "pyfujitsugeneral.client.FGLairApiClient._async_get_devices",
+        AsyncMock(return_value=[{"device": {"dsn": "dsn1"}}]),
+    ) as mock_get_devices:
+        assert await client.async_get_devices_dsn() == ["dsn1"]
+
+    mock_get_devices.assert_called_once_with("seeded")
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_get_devices_lists_model_and_firmware() -> None:
+    """Test the inventory keeps the details of every device."""
+    client = _client("seeded")
+    device = {"dsn": "dsn1", "oem_model": "AP-WD2E", "sw_version": "1.0"}
+
+    with patch(
+        "pyfujitsugeneral.client.FGLairApiClient._async_get_devices",
+        AsyncMock(return_value=[{"device": device}]),
+    ):
+        assert await client.async_get_devices() == [device]
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_check_token_validity_does_not_probe() -> None:
+    """Test tokens are not validated with an extra request."""
+    client = _client("seeded")
+
+    with patch(
+        "pyfujitsugeneral.client.FGLairApiClient.api_wrapper", AsyncMock()
+    ) as mock_api_wrapper:
+        assert await client._async_check_token_validity("seeded") is True
+        assert await client._async_check_token_validity(None) is False
+
+    mock_api_wrapper.assert_not_called()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_api_wrapper_passes_through_accepted_requests() -> None:
+    """Test accepted requests are returned without logging in."""
+    client = _client("seeded")
+
+    with patch(
+        LIBRARY_API_WRAPPER, AsyncMock(return_value=[{"property": {}}])
+    ) as mock_api_wrapper:
+        response = await client.api_wrapper("get", "url", access_token="seeded")
+
+    assert response == [{"property": {}}]
+    mock_api_wrapper.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_api_wrapper_fails_fast_while_cloud_is_down() -> None:
+    """Test requests are not sent once the circuit of the account opened."""
+    client = _client("seeded")
+
+    with patch(
+        LIBRARY_API_WRAPPER, AsyncMock(side_effect=FGLairGeneralException("down"))
+    ) as mock_api_wrapper:
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(FGLairGeneralException):
+                await client.api_wrapper("get", "url", access_token="seeded")
+        with pytest.raises(CircuitOpenError):
+            await client.api_wrapper("get", "url", access_token="seeded")
+
+    assert mock_api_wrapper.call_count == CIRCUIT_FAILURE_THRESHOLD
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_rejected_token_does_not_count_as_failure() -> None:
+    """Test an expired token is not taken for a cloud outage."""
+    client = _client("seeded")
+    client.breaker = CircuitBreaker(failure_threshold=1)
+
+    with (
+        patch(LIBRARY_API_WRAPPER, AsyncMock(return_value={"error": "expired"})),
+        patch.object(client, "_async_renew_token", AsyncMock(return_value="new")),
+    ):
+        await client.api_wrapper("get", "url", access_token="seeded")
+
+    assert client.breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_rejected_requests_share_a_single_login() -> None:
+    """Test concurrent rejected requests trigger one login and are retried."""
+    client = _client("expired")
+    login_started = asyncio.Event()
+    release_login = asyncio.Event()
+    logins = 0
+
+    async def api_wrapper(
+        method: str,
+        url: str,
+        json_data: str = "",
+        access_token: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        nonlocal logins
+        if url == client._API_GET_ACCESS_TOKEN_URL:
+            logins += 1
+            login_started.set()
+            await release_login.wait()
+            return SIGN_IN_RESPONSE
+        if access_token == "expired":
+            return {"error": "Your access token is invalid or expired."}
+        return {"token": access_token}
+
+    with patch(LIBRARY_API_WRAPPER, AsyncMock(side_effect=api_wrapper)):
+        requests = [
+            asyncio.create_task(
+                client.api_wrapper("get", f"url{index}", access_token="expired")
+            )
+            for index in range(5)
+        ]
+        await login_started.wait()
+        release_login.set()
+        responses = await asyncio.gather(*requests)
+
+        # A request still holding the old token reuses the renewed one
+        late = await client.api_wrapper("get", "late", access_token="expired")
+
+    assert logins == 1
+    assert responses == [{"token": "renewed"}] * 5
+    assert late == {"token": "renewed"}
+    assert client.access_token == "renewed"
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_refused_login_raises() -> None:
+    """Test a refused login is reported to every waiting request."""
+    client = _client("expired")
+
+    with (
+        patch(
+            LIBRARY_API_WRAPPER,
+            AsyncMock(return_value={"error": "Invalid email or password."}),
+        ),
+        pytest.raises(FGLairGeneralException),
+    ):
+        await client.async_authenticate()
+
+    assert client.access_token == "expired"
+    assert client._login is None
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_login_records_token_expiry() -> None:
+    """Test a login records when the new token expires and persists it."""
+    store = MagicMock()
+    client = _client(store=store)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+
+    with (
+        patch(LIBRARY_API_WRAPPER, AsyncMock(return_value=SIGN_IN_RESPONSE)),
+        patch(
+            "custom_components.fglair_heatpump_controller.api.utcnow",
+            return_value=now,
+        ),
+    ):
+        assert await client.async_authenticate() == "renewed"
+
+    assert client.expires_at == now + timedelta(hours=1)
+    store.async_delay_save.assert_called_once()
+    data_func, delay = store.async_delay_save.call_args.args
+    assert delay == TOKEN_SAVE_DELAY
+    assert data_func() == {
+        "access_token": "renewed",
+        "expires_at": (now + timedelta(hours=1)).isoformat(),
+    }
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_load_token_from_store() -> None:
+    """Test a persisted token replaces the token seeded by the config flow."""
+    store = MagicMock()
+    store.async_load = AsyncMock(
+        return_value={
+            "access_token": "persisted",
+            "expires_at": "2026-01-01T00:00:00+00:00",
+        }
+    )
+    client = _client("seeded", store)
+
+    await client.async_load_token()
+
+    assert client.access_token == "persisted"
+    assert client.expires_at == datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_load_token_keeps_seeded_token_without_store_data() -> None:
+    """Test the seeded token is kept when nothing was persisted yet."""
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    client = _client("seeded", store)
+
+    await client.async_load_token()
+
+    assert client.access_token == "seeded"
+    assert client.expires_at is None
+
+
+def test_renewal_delay() -> None:
+    """Test the token is renewed shortly before it expires."""
+    client = _client("seeded")
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+
+    # The age of a seeded token is unknown, renew it right away
+    assert client._renewal_delay() == timedelta(0)
+
+    client._expires_at = now + timedelta(hours=1)
+    with patch(
+        "custom_components.fglair_heatpump_controller.api.utcnow",
+        return_value=now,
+    ):
+        assert client._renewal_delay() == timedelta(hours=1) - TOKEN_RENEWAL_MARGIN
+
+    with patch(
+        "custom_components.fglair_heatpump_controller.api.utcnow",
+        return_value=now + timedelta(hours=2),
+    ):
+        assert client._renewal_delay() == timedelta(0)
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_renew_token_before_expiry() -> None:
+    """Test the renewal loop logs in again and retries after a failure."""
+    client = _client("seeded")
+    sleeps: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        sleeps.append(delay)
+        if len(sleeps) == 4:
+            raise asyncio.CancelledError
+
+    with (
+        patch(
+            "custom_components.fglair_heatpump_controller.api.asyncio.sleep",
+            side_effect=sleep,
+        ),
+        patch(
+            LIBRARY_API_WRAPPER,
+            AsyncMock(side_effect=[FGLairGeneralException("down"), SIGN_IN_RESPONSE]),
+        ) as mock_api_wrapper,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await client.async_renew_token_before_expiry()
+
+    assert mock_api_wrapper.call_count == 2
+    assert client.access_token == "renewed"
+    assert sleeps[1] == TOKEN_RENEWAL_RETRY_INTERVAL.total_seconds()
+    assert sleeps[3] > 0
@@ -0,0 +1,131 @@
+"""Test the circuit breaker around the FGLair cloud calls."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from pyfujitsugeneral.exceptions import FGLairGeneralException
+import pytest
+
+from custom_components.fglair_heatpump_controller.breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+async def _call(
+    breaker: CircuitBreaker, now: datetime, error: BaseException | None = None
+) -> None:
+    """Run one guarded call at the given time."""
+    with patch(
+        "custom_components.fglair_heatpump_controller.breaker.utcnow",
+        return_value=now,
+    ):
+        async with breaker:
+            if error is not None:
+                raise error
+
+
+async def _open(breaker: CircuitBreaker) -> None:
+    """Fail enough calls in a row to open the circuit."""
+    for _ in range(2):
+        with pytest.raises(FGLairGeneralException):
+            await _call(breaker, START, FGLairGeneralException("down"))
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_opens_after_failures_in_a_row() -> None:
+    """Test the circuit opens after the threshold and then fails fast."""
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    with pytest.raises(FGLairGeneralException):
+        await _call(breaker, START, FGLairGeneralException("down"))
+    # A success in between resets the count
+    await _call(breaker, START)
+    with pytest.raises(FGLairGeneralException):
+        await _call(breaker, START, FGLairGeneralException("down"))
+    assert breaker.state is CircuitState.CLOSED
+
+    with pytest.raises(FGLairGeneralException):
+        await _call(breaker, START, FGLairGeneralException("down"))
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        await _call(breaker, START + timedelta(seconds=59))
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_other_errors_do_not_count() -> None:
+    """Test only cloud failures open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    with pytest.raises(ValueError):
+        await _call(breaker, START, ValueError("bug"))
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_single_probe_closes_the_circuit() -> None:
+    """Test one probe is let through once the timeout elapsed."""
+    breaker = CircuitBreaker(failure_threshold=2)
+    await _open(breaker)
+    probe_started = asyncio.Event()
+    release_probe = asyncio.Event()
+
+    async def probe() -> None:
+        with patch(
+            "custom_components.fglair_heatpump_controller.breaker.utcnow",
+            return_value=START + timedelta(seconds=60),
+        ):
+            async with breaker:
+                probe_started.set()
+                await release_probe.wait()
+
+    task = asyncio.create_task(probe())
+    await probe_started.wait()
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    # Other calls fail fast while the probe is running
+    with pytest.raises(CircuitOpenError):
+        await _call(breaker, START + timedelta(seconds=61))
+
+    release_probe.set()
+    await task
+    assert breaker.state is CircuitState.CLOSED
+    await _call(breaker, START + timedelta(seconds=62))
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_failed_probe_opens_the_circuit_again() -> None:
+    """Test a failed probe suspends the calls for another timeout."""
+    breaker = CircuitBreaker(failure_threshold=2)
+    await _open(breaker)
+    probe_at = START + timedelta(seconds=60)
+
+    with pytest.raises(FGLairGeneralException):
+        await _call(breaker, probe_at, FGLairGeneralException("still down"))
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        await _call(breaker, probe_at + timedelta(seconds=59))
+    await _call(breaker, probe_at + timedelta(seconds=60))
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_cancelled_probe_lets_the_next_call_probe() -> None:
+    """Test a cancelled probe does not leave the circuit half open."""
+    breaker = CircuitBreaker(failure_threshold=2)
+    await _open(breaker)
+    probe_at = START + timedelta(seconds=60)
+
+    with pytest.raises(asyncio.CancelledError):
+        await _call(breaker, probe_at, asyncio.CancelledError())
+
+    assert breaker.state is CircuitState.OPEN
+    await _call(breaker, probe_at)
+    assert breaker.state is CircuitState.CLOSED
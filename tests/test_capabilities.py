@@ -0,0 +1,83 @@
+"""Test the capability profiles shared by the devices of a model."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.components.climate import ClimateEntityFeature
+import pytest
+
+from custom_components.fglair_heatpump_controller.capabilities import (
+    CapabilityProfile,
+    CapabilityRegistry,
+    capability_key,
+)
+
+PROFILE = CapabilityProfile(
+    preset_modes=["none", "eco"],
+    swing_modes=["vertical", "Vertical_1"],
+    swing_horizontal_modes=None,
+    supported_features=ClimateEntityFeature.SWING_MODE,
+)
+
+
+def test_capability_key() -> None:
+    """Test devices are keyed by model and firmware."""
+    assert capability_key({"oem_model": "AP-WD2E", "sw_version": "1.0"}) == (
+        "AP-WD2E/1.0"
+    )
+    assert capability_key({"model": "AY001", "sw_version": "1.0"}) == "AY001/1.0"
+    assert capability_key({"oem_model": "AP-WD2E"}) is None
+
+
+def test_profile_is_shared_by_a_model() -> None:
+    """Test a profile is worked out once and shared by every device."""
+    registry = CapabilityRegistry()
+    create = MagicMock(return_value=PROFILE)
+
+    first = registry.async_get_or_create("AP-WD2E/1.0", create)
+    second = registry.async_get_or_create("AP-WD2E/1.0", create)
+
+    assert first is second is PROFILE
+    create.assert_called_once()
+    assert registry.async_get("AP-WD2E/1.0") is PROFILE
+
+
+def test_profile_without_key_is_not_shared() -> None:
+    """Test devices of unknown model work out their own capabilities."""
+    registry = CapabilityRegistry()
+    create = MagicMock(return_value=PROFILE)
+
+    registry.async_get_or_create(None, create)
+    registry.async_get_or_create(None, create)
+
+    assert create.call_count == 2
+    assert registry.async_get(None) is None
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_profiles_are_persisted() -> None:
+    """Test new profiles are saved and restored by the next run."""
+    store = MagicMock()
+    registry = CapabilityRegistry(store)
+
+    registry.async_get_or_create("AP-WD2E/1.0", lambda: PROFILE)
+
+    store.async_delay_save.assert_called_once()
+    data = store.async_delay_save.call_args.args[0]()
+
+    store.async_load = AsyncMock(return_value=data)
+    restored = CapabilityRegistry(store)
+    await restored.async_load()
+
+    assert restored.async_get("AP-WD2E/1.0") == PROFILE
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_load_empty_store() -> None:
+    """Test nothing is restored from an empty store."""
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    registry = CapabilityRegistry(store)
+
+    await registry.async_load()
+
+    assert registry.async_get("AP-WD2E/1.0") is None
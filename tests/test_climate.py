@@ -1,7 +1,11 @@
 """Test climate entity."""
 
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 import inspect
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from homeassistant.components.climate import ClimateEntityFeature
 from homeassistant.components.climate.const import (
@@ -25,8 +29,19 @@ from homeassistant.const import (
 )
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from pyfujitsugeneral.exceptions import FGLairGeneralException
+from pyfujitsugeneral.splitAC import SplitAC, get_prop_from_json
 import pytest
+import voluptuous as vol
 
+from custom_components.fglair_heatpump_controller import FglairDataUpdateCoordinator
+from custom_components.fglair_heatpump_controller.breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from custom_components.fglair_heatpump_controller.capabilities import (
+    CapabilityProfile,
+    CapabilityRegistry,
+)
 from custom_components.fglair_heatpump_controller.climate import (
     FujitsuClimate,
     _async_retry_api_call,
@@ -41,12 +56,77 @@ from custom_components.fglair_heatpump_controller.const import (
     HORIZONTAL,
     VERTICAL,
 )
+from custom_components.fglair_heatpump_controller.device import DeviceSnapshot
+
+
+@pytest.fixture(autouse=True)
+def _mock_platform() -> Iterator[MagicMock]:
+    """Platform setup runs outside of an entity platform here."""
+    with patch(
+        "custom_components.fglair_heatpump_controller.climate.entity_platform"
+        ".async_get_current_platform"
+    ) as mock_get_platform:
+        yield mock_get_platform.return_value
+
+
+@pytest.fixture(autouse=True)
+def _no_state_writes() -> Iterator[MagicMock]:
+    """Entities are not added to hass here, optimistic updates write no state."""
+    with patch.object(FujitsuClimate, "async_write_ha_state") as mock_write:
+        yield mock_write
+
+
+def _mock_coordinator(mock_client: MagicMock) -> MagicMock:
+    """Return a coordinator mock handing out real SplitAC devices."""
+    coordinator = MagicMock()
+    coordinator.data = {}
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator.optimistic_grace_period = timedelta(seconds=30)
+    coordinator.publish_deadband = 0.5
+    coordinator.min_publish_interval = timedelta(minutes=5)
+    coordinator.capabilities = CapabilityRegistry()
+    coordinator.capability_key.return_value = None
+    # The snapshots of the tests were fetched live, and lately
+    coordinator.is_fresh.return_value = True
+
+    async def send_command(dsn: str, prop: str, write: Any) -> Any:
+        return await write()
+
+    coordinator.async_send_command = AsyncMock(side_effect=send_command)
+    coordinator.async_refresh_properties = AsyncMock()
+    coordinator.get_device.side_effect = lambda dsn: _writable_device(dsn, mock_client)
+    if not isinstance(mock_client.async_set_device_property, AsyncMock):
+        mock_client.async_set_device_property = AsyncMock()
+    return coordinator
+
+
+# Properties the entity writes, the device knows each by its name as key
+WRITTEN_PROPERTIES = (
+    "adjust_temperature",
+    "operation_mode",
+    "fan_speed",
+    "af_vertical_swing",
+    "af_vertical_direction",
+    "af_horizontal_swing",
+    "af_horizontal_direction",
+    "economy_mode",
+    "powerful_mode",
+    "min_heat",
+)
+
+
+def _writable_device(dsn: str, mock_client: MagicMock) -> SplitAC:
+    """Return a device holding the key of every property the entity writes."""
+    device = SplitAC(dsn, mock_client, DEFAULT_TOKEN_PATH, DEFAULT_TEMPERATURE_OFFSET)
+    for name in WRITTEN_PROPERTIES:
+        setattr(device, f"_{name}", {"key": name, "value": None})
+    return device
 
 
 def test_climate_entity() -> None:
     """Test that climate entity can be instantiated."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -72,7 +152,7 @@ def test_climate_constants() -> None:
 def test_climate_unique_id() -> None:
     """Test climate entity unique ID."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -93,34 +173,28 @@ def test_climate_unique_id() -> None:
 def test_climate_name() -> None:
     """Test climate entity name."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-
-    with patch(
-        "pyfujitsugeneral.splitAC.SplitAC.get_device_name"
-    ) as mock_get_device_name:
-        # Mock the device name response
-        mock_get_device_name.return_value = {"value": "Test Device"}
+    mock_coordinator = _mock_coordinator(mock_client)
+    mock_coordinator.data = {"test-dsn": DeviceSnapshot(device_name="Test Device")}
 
-        climate = FujitsuClimate(
-            fglair_api_client=mock_client,
-            dsn="test-dsn",
-            region="eu",
-            tokenpath=DEFAULT_TOKEN_PATH,
-            temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-            hass=None,
-            coordinator=mock_coordinator,
-        )
+    climate = FujitsuClimate(
+        fglair_api_client=mock_client,
+        dsn="test-dsn",
+        region="eu",
+        tokenpath=DEFAULT_TOKEN_PATH,
+        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
+        hass=None,
+        coordinator=mock_coordinator,
+    )
 
-        # Test that name exists and is a string
-        assert hasattr(climate, "name")
-        assert isinstance(climate.name, str)
-        assert len(climate.name) > 0
+    name = climate.name
+    assert isinstance(name, str)
+    assert name == "Test Device"
 
 
 def test_climate_should_poll() -> None:
     """Test climate entity should_poll property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -132,13 +206,13 @@ def test_climate_should_poll() -> None:
         coordinator=mock_coordinator,
     )
 
-    assert climate.should_poll is True
+    assert climate.should_poll is False
 
 
 def test_climate_hvac_modes() -> None:
     """Test climate entity HVAC modes."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -158,7 +232,7 @@ def test_climate_hvac_modes() -> None:
 def test_climate_fan_modes() -> None:
     """Test climate entity fan modes."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -178,7 +252,7 @@ def test_climate_fan_modes() -> None:
 def test_climate_swing_modes() -> None:
     """Test climate entity swing modes."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     # Mock the swing mode responses
     mock_client.get_af_vertical_num_dir.return_value = {"value": 3}
@@ -202,7 +276,7 @@ def test_climate_swing_modes() -> None:
 def test_climate_preset_modes() -> None:
     """Test climate entity preset modes."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -222,7 +296,7 @@ def test_climate_preset_modes() -> None:
 def test_climate_temperature_unit() -> None:
     """Test climate entity temperature unit."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -240,7 +314,7 @@ def test_climate_temperature_unit() -> None:
 def test_climate_min_temp() -> None:
     """Test climate entity minimum temperature."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -261,7 +335,7 @@ def test_climate_min_temp() -> None:
 def test_climate_max_temp() -> None:
     """Test climate entity maximum temperature."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -282,7 +356,7 @@ def test_climate_max_temp() -> None:
 def test_climate_target_temperature_step() -> None:
     """Test climate entity target temperature step."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -302,7 +376,7 @@ def test_climate_target_temperature_step() -> None:
 async def test_handle_coordinator_update() -> None:
     """Test _handle_coordinator_update callback."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -334,7 +408,7 @@ async def test_handle_coordinator_update() -> None:
 async def test_async_added_to_hass() -> None:
     """Test async_added_to_hass method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -374,7 +448,7 @@ async def test_async_added_to_hass() -> None:
 async def test_async_set_hvac_mode_invalid_mode() -> None:
     """Test async_set_hvac_mode with invalid HVAC mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -400,7 +474,7 @@ async def test_async_set_hvac_mode_invalid_mode() -> None:
 async def test_hvac_action_when_off() -> None:
     """Test hvac_action when device is off."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -429,7 +503,7 @@ async def test_hvac_action_when_off() -> None:
 async def test_hvac_action_defrost_mode() -> None:
     """Test hvac_action for Defrost mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -441,17 +515,11 @@ async def test_hvac_action_defrost_mode() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
+    # The device is on and defrosting
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device", operation_mode=6, op_status=16777216
     )
 
-    # Mock is_on to return True
-    climate._fujitsu_device.get_operation_mode = MagicMock(return_value={"value": 1})
-
-    # Mock get_op_status_desc to return "Defrost"
-    climate._fujitsu_device.get_op_status_desc = MagicMock(return_value="Defrost")
-
     # Test hvac_action for Defrost mode
     action = climate.hvac_action
     assert action == HVACAction.PREHEATING
@@ -459,9 +527,9 @@ async def test_hvac_action_defrost_mode() -> None:
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_swing_mode_exception_handling() -> None:
-    """Test swing mode exception handling."""
+    """Test swing mode when the device reports no vertical direction."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -472,27 +540,18 @@ async def test_swing_mode_exception_handling() -> None:
         hass=MagicMock(),
         coordinator=mock_coordinator,
     )
+    climate._snapshot = DeviceSnapshot(device_name="Test Device")
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock vane_vertical to raise exception inside try block
-    climate._fujitsu_device.vane_vertical = MagicMock(
-        side_effect=Exception("Test exception")
-    )
-
-    # Test swing mode with exception - should return None
+    # No position is known, as the library reports it
     swing_mode = climate.swing_mode
-    assert swing_mode is None
+    assert swing_mode == VERTICAL + "-1"
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_swing_modes_vertical_mode() -> None:
     """Test swing modes for Vertical mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -504,16 +563,10 @@ async def test_swing_modes_vertical_mode() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock swing modes to return "Vertical"
-    climate._fujitsu_device.get_swing_modes_supported = MagicMock(
-        return_value="Vertical"
+    # Only the vertical vane can be directed, in three positions
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device", af_vertical_direction=1, af_vertical_num_dir=3
     )
-    climate._fujitsu_device.vane_vertical_positions = MagicMock(return_value=[1, 2, 3])
 
     # Test swing modes for Vertical mode
     swing_modes = climate.swing_modes
@@ -528,7 +581,7 @@ async def test_swing_modes_vertical_mode() -> None:
 async def test_swing_modes_horizontal_mode() -> None:
     """Test swing modes for Horizontal mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -540,16 +593,10 @@ async def test_swing_modes_horizontal_mode() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock swing modes to return "Horizontal"
-    climate._fujitsu_device.get_swing_modes_supported = MagicMock(
-        return_value="Horizontal"
+    # Only the horizontal vane can be directed, in two positions
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device", af_horizontal_direction=1, af_horizontal_num_dir=2
     )
-    climate._fujitsu_device.vane_horizontal_positions = MagicMock(return_value=[1, 2])
 
     # Test swing modes for Horizontal mode
     swing_modes = climate.swing_modes
@@ -563,7 +610,7 @@ async def test_swing_modes_horizontal_mode() -> None:
 async def test_swing_modes_empty_list() -> None:
     """Test swing modes when pos_list is empty."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -580,11 +627,6 @@ async def test_swing_modes_empty_list() -> None:
         return_value={"value": "Test Device"}
     )
 
-    # Mock swing modes to return empty lists
-    climate._fujitsu_device.get_swing_modes_supported = MagicMock(return_value="None")
-    climate._fujitsu_device.vane_vertical_positions = MagicMock(return_value=[])
-    climate._fujitsu_device.vane_horizontal_positions = MagicMock(return_value=[])
-
     # Test swing modes when empty
     swing_modes = climate.swing_modes
     assert swing_modes is None
@@ -594,7 +636,7 @@ async def test_swing_modes_empty_list() -> None:
 async def test_async_set_swing_mode_vertical_horizontal() -> None:
     """Test async_set_swing_mode for VERTICAL and HORIZONTAL."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -606,29 +648,22 @@ async def test_async_set_swing_mode_vertical_horizontal() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock async methods
-    climate._fujitsu_device.async_set_af_vertical_swing = AsyncMock()
-    climate._fujitsu_device.async_set_af_horizontal_swing = AsyncMock()
-
     # Test VERTICAL swing mode
     await climate.async_set_swing_mode(SWING_VERTICAL)
-    climate._fujitsu_device.async_set_af_vertical_swing.assert_called_once_with(1)
+    mock_client.async_set_device_property.assert_called_once_with(
+        "af_vertical_swing", 1
+    )
 
     # Test HORIZONTAL swing mode
     await climate.async_set_swing_mode(SWING_HORIZONTAL)
-    climate._fujitsu_device.async_set_af_horizontal_swing.assert_called_once_with(1)
+    mock_client.async_set_device_property.assert_called_with("af_horizontal_swing", 1)
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_swing_mode_specific_positions() -> None:
     """Test async_set_swing_mode for specific positions."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -640,31 +675,34 @@ async def test_async_set_swing_mode_specific_positions() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock async methods
-    climate._fujitsu_device.async_set_vane_vertical_position = AsyncMock()
-    climate._fujitsu_device.async_set_vane_horizontal_position = AsyncMock()
+    climate._snapshot = DeviceSnapshot(af_vertical_num_dir=4, af_horizontal_num_dir=3)
 
     # Test VERTICAL position
     await climate.async_set_swing_mode(VERTICAL + "3")
-    climate._fujitsu_device.async_set_vane_vertical_position.assert_called_once_with(3)
+    # The swing is stopped before the vane is directed
+    assert mock_client.async_set_device_property.call_args_list == [
+        call("af_vertical_swing", 0),
+        call("af_vertical_direction", 3),
+    ]
 
     # Test HORIZONTAL position
     await climate.async_set_swing_mode(HORIZONTAL + "2")
-    climate._fujitsu_device.async_set_vane_horizontal_position.assert_called_once_with(
-        2
-    )
+    assert mock_client.async_set_device_property.call_args_list[2:] == [
+        call("af_horizontal_swing", 0),
+        call("af_horizontal_direction", 2),
+    ]
+
+    # Positions beyond the ones the device reports are not written
+    with pytest.raises(HomeAssistantError, match="Unsupported vertical position: 5"):
+        await climate.async_set_swing_mode(VERTICAL + "5")
+    assert mock_client.async_set_device_property.call_count == 4
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_current_preset_mode_eco() -> None:
     """Test preset_mode for eco mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -676,35 +714,21 @@ async def test_current_preset_mode_eco() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
+    # The device reports every preset property
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device", economy_mode=1, powerful_mode=0, min_heat=0
     )
 
-    # Mock economy mode to be active
-    climate._fujitsu_device.get_economy_mode = MagicMock(return_value={"value": True})
-    climate._fujitsu_device.get_powerful_mode = MagicMock(return_value={"value": False})
-    climate._fujitsu_device.get_min_heat = MagicMock(return_value={"value": False})
-    climate._fujitsu_device.get_economy_mode_value = MagicMock(return_value=True)
-    climate._fujitsu_device.get_powerful_mode_value = MagicMock(return_value=False)
-    climate._fujitsu_device.get_min_heat_value = MagicMock(return_value=False)
-
-    # Mock get_prop_from_json to return True for economy_mode
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = True
-
-        # Test current preset mode
-        preset_mode = climate.preset_mode
-        assert preset_mode == PRESET_ECO
+    # Test current preset mode
+    preset_mode = climate.preset_mode
+    assert preset_mode == PRESET_ECO
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_current_preset_mode_boost() -> None:
     """Test preset_mode for boost mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -716,35 +740,21 @@ async def test_current_preset_mode_boost() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
+    # The device reports every preset property
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device", economy_mode=0, powerful_mode=1, min_heat=0
     )
 
-    # Mock powerful mode to be active
-    climate._fujitsu_device.get_economy_mode = MagicMock(return_value={"value": False})
-    climate._fujitsu_device.get_powerful_mode = MagicMock(return_value={"value": True})
-    climate._fujitsu_device.get_min_heat = MagicMock(return_value={"value": False})
-    climate._fujitsu_device.get_economy_mode_value = MagicMock(return_value=False)
-    climate._fujitsu_device.get_powerful_mode_value = MagicMock(return_value=True)
-    climate._fujitsu_device.get_min_heat_value = MagicMock(return_value=False)
-
-    # Mock get_prop_from_json to return True for powerful_mode
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = True
-
-        # Test current preset mode
-        preset_mode = climate.preset_mode
-        assert preset_mode == PRESET_BOOST
+    # Test current preset mode
+    preset_mode = climate.preset_mode
+    assert preset_mode == PRESET_BOOST
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_current_preset_mode_away() -> None:
     """Test preset_mode for away mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -756,35 +766,21 @@ async def test_current_preset_mode_away() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
+    # The device reports every preset property
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device", economy_mode=0, powerful_mode=0, min_heat=1
     )
 
-    # Mock min heat mode to be active
-    climate._fujitsu_device.get_economy_mode = MagicMock(return_value={"value": False})
-    climate._fujitsu_device.get_powerful_mode = MagicMock(return_value={"value": False})
-    climate._fujitsu_device.get_min_heat = MagicMock(return_value={"value": True})
-    climate._fujitsu_device.get_economy_mode_value = MagicMock(return_value=False)
-    climate._fujitsu_device.get_powerful_mode_value = MagicMock(return_value=False)
-    climate._fujitsu_device.get_min_heat_value = MagicMock(return_value=True)
-
-    # Mock get_prop_from_json to return True for min_heat
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = True
-
-        # Test current preset mode
-        preset_mode = climate.preset_mode
-        assert preset_mode == PRESET_AWAY
+    # Test current preset mode
+    preset_mode = climate.preset_mode
+    assert preset_mode == PRESET_AWAY
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_hvac_action_return_none() -> None:
     """Test hvac_action returns None for unknown op_status_desc."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -796,17 +792,11 @@ async def test_hvac_action_return_none() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
+    # The device is on with an unknown status
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device", operation_mode=6, op_status=42
     )
 
-    # Mock is_on to return True
-    climate._fujitsu_device.get_operation_mode = MagicMock(return_value={"value": 1})
-
-    # Mock get_op_status_desc to return unknown status
-    climate._fujitsu_device.get_op_status_desc = MagicMock(return_value="Unknown")
-
     # Test hvac_action for unknown status
     action = climate.hvac_action
     assert action is None
@@ -816,7 +806,7 @@ async def test_hvac_action_return_none() -> None:
 async def test_swing_mode_vertical_only() -> None:
     """Test swing mode when only vertical swing is active."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -828,21 +818,13 @@ async def test_swing_mode_vertical_only() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock swing mode methods
-    climate._fujitsu_device.vane_vertical = MagicMock(return_value=2)
-    climate._fujitsu_device.get_af_vertical_swing = MagicMock(
-        return_value={"value": True}
+    # Only the vertical swing is active
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device",
+        af_vertical_direction=2,
+        af_vertical_swing=1,
+        af_horizontal_swing=0,
     )
-    climate._fujitsu_device.get_af_horizontal_swing = MagicMock(
-        return_value={"value": False}
-    )
-    climate._fujitsu_device.get_swing_vertical_value = MagicMock(return_value=True)
-    climate._fujitsu_device.get_swing_horizontal_value = MagicMock(return_value=False)
 
     # Test swing mode for vertical only
     swing_mode = climate.swing_mode
@@ -853,7 +835,7 @@ async def test_swing_mode_vertical_only() -> None:
 async def test_swing_mode_vertical_position() -> None:
     """Test swing mode when vertical position is set."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -865,21 +847,13 @@ async def test_swing_mode_vertical_position() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock swing mode methods
-    climate._fujitsu_device.vane_vertical = MagicMock(return_value=3)
-    climate._fujitsu_device.get_af_vertical_swing = MagicMock(
-        return_value={"value": False}
-    )
-    climate._fujitsu_device.get_af_horizontal_swing = MagicMock(
-        return_value={"value": False}
+    # The vertical vane is held in a position
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device",
+        af_vertical_direction=3,
+        af_vertical_swing=0,
+        af_horizontal_swing=0,
     )
-    climate._fujitsu_device.get_swing_vertical_value = MagicMock(return_value=False)
-    climate._fujitsu_device.get_swing_horizontal_value = MagicMock(return_value=False)
 
     # Test swing mode for vertical position
     swing_mode = climate.swing_mode
@@ -890,7 +864,7 @@ async def test_swing_mode_vertical_position() -> None:
 async def test_swing_modes_both_mode() -> None:
     """Test swing modes for Both mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -902,16 +876,15 @@ async def test_swing_modes_both_mode() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
+    # Both vanes can be directed, in two positions each
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device",
+        af_vertical_direction=1,
+        af_vertical_num_dir=2,
+        af_horizontal_direction=1,
+        af_horizontal_num_dir=2,
     )
 
-    # Mock swing modes to return "Both"
-    climate._fujitsu_device.get_swing_modes_supported = MagicMock(return_value="Both")
-    climate._fujitsu_device.vane_vertical_positions = MagicMock(return_value=[1, 2])
-    climate._fujitsu_device.vane_horizontal_positions = MagicMock(return_value=[1, 2])
-
     # Test swing modes for Both mode
     swing_modes = climate.swing_modes
     assert swing_modes is not None
@@ -928,7 +901,7 @@ async def test_swing_modes_both_mode() -> None:
 async def test_preset_mode_return_none() -> None:
     """Test preset_mode returns PRESET_NONE when no modes are active."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -950,22 +923,19 @@ async def test_preset_mode_return_none() -> None:
     climate._fujitsu_device.get_powerful_mode = MagicMock(return_value={"value": False})
     climate._fujitsu_device.get_min_heat = MagicMock(return_value={"value": False})
 
-    # Mock get_prop_from_json to return False for all modes
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = False
+    # The device reports no preset property
+    climate._snapshot = DeviceSnapshot()
 
-        # Test current preset mode
-        preset_mode = climate.preset_mode
-        assert preset_mode == PRESET_NONE
+    # Test current preset mode
+    preset_mode = climate.preset_mode
+    assert preset_mode == PRESET_NONE
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_swing_mode_both_active() -> None:
     """Test swing mode when both vertical and horizontal swing are active."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -977,21 +947,13 @@ async def test_swing_mode_both_active() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock swing mode methods - both active
-    climate._fujitsu_device.vane_vertical = MagicMock(return_value=2)
-    climate._fujitsu_device.get_af_vertical_swing = MagicMock(
-        return_value={"value": True}
-    )
-    climate._fujitsu_device.get_af_horizontal_swing = MagicMock(
-        return_value={"value": True}
+    # Both swings are active
+    climate._snapshot = DeviceSnapshot(
+        device_name="Test Device",
+        af_vertical_direction=2,
+        af_vertical_swing=1,
+        af_horizontal_swing=1,
     )
-    climate._fujitsu_device.get_swing_vertical_value = MagicMock(return_value=True)
-    climate._fujitsu_device.get_swing_horizontal_value = MagicMock(return_value=True)
 
     # Test swing mode for both active
     swing_mode = climate.swing_mode
@@ -1002,7 +964,7 @@ async def test_swing_mode_both_active() -> None:
 async def test_preset_mode_min_heat_active() -> None:
     """Test preset_mode returns PRESET_AWAY when min_heat is active."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1027,22 +989,19 @@ async def test_preset_mode_min_heat_active() -> None:
     climate._fujitsu_device.get_powerful_mode_value = MagicMock(return_value=False)
     climate._fujitsu_device.get_min_heat_value = MagicMock(return_value=True)
 
-    # Mock get_prop_from_json to return True for min_heat
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.side_effect = lambda prop, props: prop == "min_heat"
+    # The device only reports min_heat
+    climate._snapshot = DeviceSnapshot(min_heat=1)
 
-        # Test current preset mode
-        preset_mode = climate.preset_mode
-        assert preset_mode == PRESET_AWAY
+    # Test current preset mode
+    preset_mode = climate.preset_mode
+    assert preset_mode == PRESET_AWAY
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_preset_mode_final_return_none() -> None:
     """Test preset_mode returns PRESET_NONE at the final return statement."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1067,21 +1026,18 @@ async def test_preset_mode_final_return_none() -> None:
     climate._fujitsu_device.get_powerful_mode_value = MagicMock(return_value=False)
     climate._fujitsu_device.get_min_heat_value = MagicMock(return_value=False)
 
-    # Mock get_prop_from_json to return True for all properties (so they exist)
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = True
+    # The device reports every preset property
+    climate._snapshot = DeviceSnapshot(economy_mode=0, powerful_mode=0, min_heat=0)
 
-        # Test current preset mode - should reach the final return PRESET_NONE
-        preset_mode = climate.preset_mode
-        assert preset_mode == PRESET_NONE
+    # Test current preset mode - should reach the final return PRESET_NONE
+    preset_mode = climate.preset_mode
+    assert preset_mode == PRESET_NONE
 
 
 def test_climate_initialization_with_all_parameters() -> None:
     """Test climate initialization with all parameters."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1103,7 +1059,7 @@ def test_climate_initialization_with_all_parameters() -> None:
 def test_climate_initialization_with_minimal_parameters() -> None:
     """Test climate initialization with minimal parameters."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1125,7 +1081,7 @@ def test_climate_initialization_with_minimal_parameters() -> None:
 def test_climate_unique_id_format() -> None:
     """Test climate unique ID format."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1146,33 +1102,30 @@ def test_climate_unique_id_format() -> None:
 def test_climate_name_with_mock_device_name() -> None:
     """Test climate name with mocked device name."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-
-    with patch(
-        "pyfujitsugeneral.splitAC.SplitAC.get_device_name"
-    ) as mock_get_device_name:
-        # Mock the device name response
-        mock_get_device_name.return_value = {"value": "Test Device Name"}
+    mock_coordinator = _mock_coordinator(mock_client)
+    mock_coordinator.data = {
+        "test-dsn-name": DeviceSnapshot(device_name="Test Device Name")
+    }
 
-        climate = FujitsuClimate(
-            fglair_api_client=mock_client,
-            dsn="test-dsn-name",
-            region="eu",
-            tokenpath=DEFAULT_TOKEN_PATH,
-            temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-            hass=MagicMock(),
-            coordinator=mock_coordinator,
-        )
+    climate = FujitsuClimate(
+        fglair_api_client=mock_client,
+        dsn="test-dsn-name",
+        region="eu",
+        tokenpath=DEFAULT_TOKEN_PATH,
+        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
+        hass=MagicMock(),
+        coordinator=mock_coordinator,
+    )
 
-        name = climate.name
-        assert isinstance(name, str)
-        assert len(name) > 0
+    name = climate.name
+    assert isinstance(name, str)
+    assert name == "Test Device Name"
 
 
 def test_climate_temperature_properties() -> None:
     """Test climate temperature properties."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1200,7 +1153,7 @@ def test_climate_temperature_properties() -> None:
 def test_climate_mode_properties() -> None:
     """Test climate mode properties."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1231,7 +1184,7 @@ def test_climate_mode_properties() -> None:
 def test_climate_swing_modes_with_mock() -> None:
     """Test climate swing modes with mocked responses."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     # Mock the swing mode responses
     mock_client.get_af_vertical_num_dir.return_value = {"value": 5}
@@ -1255,7 +1208,7 @@ def test_climate_swing_modes_with_mock() -> None:
 def test_climate_supported_features() -> None:
     """Test climate supported features."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1275,7 +1228,7 @@ def test_climate_supported_features() -> None:
 def test_climate_device_info() -> None:
     """Test climate device info."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1295,7 +1248,7 @@ def test_climate_device_info() -> None:
 def test_climate_entity_registry_enabled_default() -> None:
     """Test that climate entity registry is enabled by default."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1313,7 +1266,7 @@ def test_climate_entity_registry_enabled_default() -> None:
 def test_climate_methods_exist() -> None:
     """Test that climate methods exist and are callable."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1343,10 +1296,10 @@ def test_climate_methods_exist() -> None:
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
-async def test_async_target_temperature_api_failure() -> None:
-    """Test async_target_temperature with API failure."""
+async def test_async_update_requests_coordinator_refresh() -> None:
+    """Test async_update delegates to the coordinator instead of the cloud."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1357,27 +1310,19 @@ async def test_async_target_temperature_api_failure() -> None:
         hass=MagicMock(),
         coordinator=mock_coordinator,
     )
+    climate._fujitsu_device.async_update_properties = AsyncMock()
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock API failure
-    climate._fujitsu_device.async_get_adjust_temperature_degree = AsyncMock(
-        side_effect=Exception("API Error")
-    )
+    with patch.object(FujitsuClimate, "enabled", True):
+        await climate.async_update()
 
-    result = await climate.async_target_temperature()
-    assert result is None
+    mock_coordinator.async_request_refresh.assert_called_once()
+    climate._fujitsu_device.async_update_properties.assert_not_called()
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_async_update_api_failure() -> None:
-    """Test async_update with API failure."""
+def _optimistic_climate() -> tuple[FujitsuClimate, MagicMock]:
+    """Return an entity reporting a target temperature of 20."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-
+    mock_coordinator = _mock_coordinator(mock_client)
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
         dsn="test-dsn",
@@ -1387,27 +1332,27 @@ async def test_async_update_api_failure() -> None:
         hass=MagicMock(),
         coordinator=mock_coordinator,
     )
+    climate._target_temperature = 20.0
+    return climate, mock_coordinator
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-
-    # Mock API failure for update_properties
-    climate._fujitsu_device.async_update_properties = AsyncMock(
-        side_effect=Exception("API Error")
-    )
-
-    # Should return early without raising exception
-    await climate.async_update()
-
-
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_async_update_current_temperature_failure() -> None:
-    """Test async_update with current temperature API failure."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
 
+def _coordinator_climate() -> tuple[FujitsuClimate, FglairDataUpdateCoordinator]:
+    """Return an entity listening to a real coordinator, heating to 22."""
+    mock_client = AsyncMock()
+    mock_client.breaker = CircuitBreaker()
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(hass=MagicMock(), client=mock_client)
+    device = MagicMock()
+    device.get_device_name.return_value = {"value": "Living"}
+    device.get_operation_mode_desc.return_value = "heat"
+    device.get_fan_speed_desc.return_value = "Auto"
+    device.get_adjust_temperature.return_value = {"key": "adjust_temperature"}
+    coordinator.devices["test-dsn"] = device
+    coordinator.data = {
+        "test-dsn": DeviceSnapshot(
+            current_temperature=21.0, target_temperature=22.0, operation_mode=6
+        )
+    }
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
         dsn="test-dsn",
@@ -1415,47 +1360,194 @@ async def test_async_update_current_temperature_failure() -> None:
         tokenpath=DEFAULT_TOKEN_PATH,
         temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
         hass=MagicMock(),
-        coordinator=mock_coordinator,
+        coordinator=coordinator,
     )
+    coordinator.async_add_listener(climate._handle_coordinator_update, "test-dsn")
+    return climate, coordinator
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
 
-    # Mock successful update_properties
-    climate._fujitsu_device.async_update_properties = AsyncMock(return_value={})
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_ignored_write_is_rolled_back_at_deadline() -> None:
+    """Test a write the device ignored is rolled back without a new snapshot."""
+    climate, coordinator = _coordinator_climate()
+    coordinator.async_send_command = AsyncMock()  # type: ignore[method-assign]
+    coordinator._schedule_refresh = MagicMock()  # type: ignore[method-assign]
+    start = datetime(2025, 1, 1, tzinfo=UTC)
 
-    # Mock failure for current temperature
-    climate._fujitsu_device.async_get_display_temperature_degree = AsyncMock(
-        side_effect=Exception("API Error")
-    )
+    with (
+        patch(
+            "custom_components.fglair_heatpump_controller.climate.async_call_later"
+        ) as mock_call_later,
+        patch(
+            "custom_components.fglair_heatpump_controller.climate.utcnow",
+            return_value=start,
+        ),
+    ):
+        await climate.async_set_temperature(temperature=25.0)
 
-    # Mock other required methods to prevent KeyError
-    climate._fujitsu_device.get_fan_speed = MagicMock(return_value={"value": 1})
-    climate._fujitsu_device.get_operation_mode = MagicMock(
-        return_value={"value": "heat"}
-    )
-    climate._fujitsu_device.get_refresh = MagicMock(
-        return_value={"data_updated_at": "2023-01-01"}
-    )
-    # Mock the refresh method using patch to avoid method assignment error
-    with patch.object(
-        climate, "_async_refresh_display_temperature_request", new_callable=AsyncMock
+    # The device keeps reporting 22, its listener is never called again
+    coordinator._changed_dsn = set()
+    coordinator.async_update_listeners()
+    assert climate.target_temperature == 25.0
+
+    # The re-check scheduled at the deadline rolls the value back
+    assert mock_call_later.call_args.args[1] == coordinator.optimistic_grace_period
+    recheck = mock_call_later.call_args.args[2]
+    with patch(
+        "custom_components.fglair_heatpump_controller.climate.utcnow",
+        return_value=start + coordinator.optimistic_grace_period,
     ):
-        # Should continue without raising exception
-        await climate.async_update()
+        recheck(start + coordinator.optimistic_grace_period)
+    assert climate.target_temperature == 22.0
+    assert climate._unsub_recheck is None
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
-async def test_async_update_refresh_temperature_failure() -> None:
-    """Test async_update with refresh temperature failure."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+async def test_set_temperature_is_shown_optimistically(
+    _no_state_writes: MagicMock,
+) -> None:
+    """Test the requested temperature is shown before the write lands."""
+    climate, mock_coordinator = _optimistic_climate()
+    shown_while_sending: list[float | None] = []
 
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
+    async def send_command(dsn: str, prop: str, write: Any) -> None:
+        shown_while_sending.append(climate.target_temperature)
+
+    mock_coordinator.async_send_command.side_effect = send_command
+    await climate.async_set_temperature(temperature=22.4)
+
+    assert shown_while_sending == [22.5]
+    assert climate.target_temperature == 22.5
+    _no_state_writes.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_failed_write_drops_optimistic_value(
+    _no_state_writes: MagicMock,
+) -> None:
+    """Test a failed write shows the device value again."""
+    climate, mock_coordinator = _optimistic_climate()
+    mock_coordinator.async_send_command.side_effect = HomeAssistantError("down")
+
+    with pytest.raises(HomeAssistantError):
+        await climate.async_set_temperature(temperature=22.0)
+
+    assert climate.target_temperature == 20.0
+    assert _no_state_writes.call_count == 2
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_snapshot_reconciles_optimistic_value() -> None:
+    """Test snapshots confirm the requested value or roll it back late."""
+    climate, mock_coordinator = _optimistic_climate()
+    mock_coordinator.async_send_command.side_effect = AsyncMock()
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    utcnow = "custom_components.fglair_heatpump_controller.climate.utcnow"
+
+    with patch(utcnow, return_value=start):
+        await climate.async_set_temperature(temperature=22.0)
+
+    # The device did not report the new value yet, keep showing it
+    with patch(utcnow, return_value=start + timedelta(seconds=10)):
+        climate._reconcile_optimistic()
+    assert climate.target_temperature == 22.0
+
+    # The grace period elapsed without confirmation, roll back
+    with patch(utcnow, return_value=start + timedelta(seconds=30)):
+        climate._reconcile_optimistic()
+    assert climate.target_temperature == 20.0
+
+    # A snapshot reporting the requested value confirms it
+    with patch(utcnow, return_value=start):
+        await climate.async_set_temperature(temperature=23.0)
+    climate._target_temperature = 23.0
+    with patch(utcnow, return_value=start + timedelta(seconds=5)):
+        climate._reconcile_optimistic()
+    assert climate._optimistic == {}
+    assert climate.target_temperature == 23.0
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_update_notes_interaction() -> None:
+    """Test asking for the state of the entity keeps its data fresh."""
+    climate, mock_coordinator = _optimistic_climate()
+    mock_coordinator.async_request_refresh = AsyncMock()
+
+    await climate.async_update()
+
+    mock_coordinator.async_note_interaction.assert_called_once_with("test-dsn")
+    mock_coordinator.async_request_refresh.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_write_matching_device_state_is_skipped() -> None:
+    """Test re-asserting the shown value sends nothing."""
+    climate, mock_coordinator = _optimistic_climate()
+
+    await climate.async_set_temperature(temperature=20.0)
+    mock_coordinator.async_send_command.assert_not_called()
+    mock_coordinator.async_note_command.assert_not_called()
+
+    await climate.async_set_temperature(temperature=21.0)
+    mock_coordinator.async_send_command.assert_called_once()
+    mock_coordinator.async_note_command.assert_called_once_with("test-dsn")
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_write_matching_pending_value_is_skipped() -> None:
+    """Test a value already requested is not sent twice."""
+    climate, mock_coordinator = _optimistic_climate()
+    mock_coordinator.async_send_command.side_effect = AsyncMock()
+
+    await climate.async_set_temperature(temperature=22.0)
+    await climate.async_set_temperature(temperature=22.0)
+    # Going back to the device value must still be sent
+    await climate.async_set_temperature(temperature=20.0)
+
+    assert mock_coordinator.async_send_command.call_count == 2
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_write_matching_stale_state_is_sent() -> None:
+    """Test a snapshot not fetched lately by this run is not trusted."""
+    climate, mock_coordinator = _optimistic_climate()
+    mock_coordinator.is_fresh.return_value = False
+
+    await climate.async_set_temperature(temperature=20.0)
+    mock_coordinator.async_send_command.assert_called_once()
+    mock_coordinator.is_fresh.assert_called_with("test-dsn")
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_forced_write_is_sent() -> None:
+    """Test force sends a value the entity already shows."""
+    climate, mock_coordinator = _optimistic_climate()
+
+    await climate.async_set_temperature(temperature=20.0, force=True)
+    mock_coordinator.async_send_command.assert_called_once()
+
+    await climate.async_set_hvac_mode(HVACMode.OFF, force=True)
+    await climate.async_set_hvac_mode(HVACMode.OFF)
+    assert mock_coordinator.async_send_command.call_count == 2
+
+
+def test_update_from_snapshot() -> None:
+    """Test the entity reads its state from the coordinator snapshot."""
+    mock_client = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
+    mock_coordinator.data = {
+        "test-dsn": DeviceSnapshot(
+            current_temperature=21.5,
+            target_temperature=23.0,
+            device_name="Living",
+            fan_speed=4,
+            operation_mode=6,
+        )
+    }
+
+    climate = FujitsuClimate(
+        fglair_api_client=mock_client,
+        dsn="test-dsn",
         region="eu",
         tokenpath=DEFAULT_TOKEN_PATH,
         temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
@@ -1463,36 +1555,241 @@ async def test_async_update_refresh_temperature_failure() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
+    assert climate.current_temperature == 21.5
+    assert climate.target_temperature == 23.0
+    assert climate.unique_id == "Living_climate"
+    assert climate._hvac_mode == HVACMode.HEAT
+    assert climate._fan_mode == FAN_AUTO
+
+
+def test_room_temperature_deadband() -> None:
+    """Test small room temperature changes wait for the publish interval."""
+    climate, mock_coordinator = _optimistic_climate()
+    device = MagicMock()
+    device.get_device_name.return_value = {"value": "Living"}
+    device.get_operation_mode_desc.return_value = "heat"
+    device.get_fan_speed_desc.return_value = "Auto"
+    climate._fujitsu_device = device
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def update_at(now: datetime, current: float, target: float = 22.0) -> None:
+        mock_coordinator.data = {
+            "test-dsn": DeviceSnapshot(
+                current_temperature=current, target_temperature=target
+            )
+        }
+        with patch(
+            "custom_components.fglair_heatpump_controller.climate.utcnow",
+            return_value=now,
+        ):
+            climate._update_from_snapshot()
+
+    update_at(start, 21.0)
+    assert climate.current_temperature == 21.0
+
+    # Jitter within the deadband is held back, the setpoint is not
+    update_at(start + timedelta(minutes=1), 21.5, target=23.0)
+    assert climate.current_temperature == 21.0
+    assert climate.target_temperature == 23.0
+
+    # A larger change is shown right away
+    update_at(start + timedelta(minutes=2), 22.0)
+    assert climate.current_temperature == 22.0
+
+    # A small change is shown once the interval elapsed
+    update_at(start + timedelta(minutes=3), 21.5)
+    assert climate.current_temperature == 22.0
+    update_at(start + timedelta(minutes=7), 21.5)
+    assert climate.current_temperature == 21.5
+
+
+def test_held_back_temperature_shown_once_steady() -> None:
+    """Test a steady held back temperature is shown after the interval."""
+    climate, coordinator = _coordinator_climate()
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    climate._temperature_published_at = start
+
+    coordinator.data = {
+        "test-dsn": DeviceSnapshot(
+            current_temperature=21.5, target_temperature=22.0, operation_mode=6
+        )
+    }
+    coordinator._changed_dsn = {"test-dsn"}
+    with (
+        patch(
+            "custom_components.fglair_heatpump_controller.climate.async_call_later"
+        ) as mock_call_later,
+        patch(
+            "custom_components.fglair_heatpump_controller.climate.utcnow",
+            return_value=start + timedelta(minutes=1),
+        ),
+    ):
+        coordinator.async_update_listeners()
+    assert climate.current_temperature == 21.0
+
+    # The device keeps reporting 21.5, its listener is never called again
+    coordinator._changed_dsn = set()
+    coordinator.async_update_listeners()
+    assert climate.current_temperature == 21.0
+
+    assert mock_call_later.call_args.args[1] == timedelta(minutes=4)
+    recheck_at = start + coordinator.min_publish_interval
+    with patch(
+        "custom_components.fglair_heatpump_controller.climate.utcnow",
+        return_value=recheck_at,
+    ):
+        mock_call_later.call_args.args[2](recheck_at)
+    assert climate.current_temperature == 21.5
+    assert climate._unsub_recheck is None
+
+
+def test_state_derived_once_per_snapshot() -> None:
+    """Test the properties read the state derived from the last snapshot."""
+    mock_client = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
+    climate = FujitsuClimate(
+        fglair_api_client=mock_client,
+        dsn="test-dsn",
+        region="eu",
+        tokenpath=DEFAULT_TOKEN_PATH,
+        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
+        hass=MagicMock(),
+        coordinator=mock_coordinator,
     )
+    device = MagicMock()
+    climate._fujitsu_device = device
+    mock_coordinator.data = {
+        "test-dsn": DeviceSnapshot(
+            current_temperature=21.5,
+            target_temperature=23.0,
+            device_name="Living",
+            operation_mode=6,
+            fan_speed=4,
+            af_vertical_direction=1,
+        )
+    }
+    climate._update_from_snapshot()
+
+    assert climate.hvac_mode == HVACMode.HEAT
+    assert climate.fan_mode == FAN_AUTO
+    assert climate.swing_modes is not None
+    assert climate.preset_mode == PRESET_NONE
+    assert ClimateEntityFeature.SWING_HORIZONTAL_MODE not in climate.supported_features
+    # The state is only read from the snapshot, never from the device
+    assert device.method_calls == []
+
+    # The device object changing behind the snapshot changes nothing
+    device.get_operation_mode.return_value = {"value": 3}
+    assert climate.hvac_mode == HVACMode.HEAT
+
+    mock_coordinator.data = {
+        "test-dsn": DeviceSnapshot(
+            current_temperature=21.5,
+            target_temperature=23.0,
+            device_name="Living",
+            operation_mode=3,
+            fan_speed=4,
+            af_horizontal_direction=1,
+        )
+    }
+    climate._update_from_snapshot()
+
+    assert climate.hvac_mode == HVACMode.COOL
+    assert ClimateEntityFeature.SWING_HORIZONTAL_MODE in climate.supported_features
+
 
-    # Mock successful update_properties and current temperature
-    climate._fujitsu_device.async_update_properties = AsyncMock(return_value={})
-    climate._fujitsu_device.async_get_display_temperature_degree = AsyncMock(
-        return_value=20.0
+def test_capabilities_known_before_first_snapshot() -> None:
+    """Test an entity shows the capabilities of its model before any poll."""
+    mock_client = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
+    mock_coordinator.capability_key.return_value = "AP-WD2E/1.0"
+    profile = CapabilityProfile(
+        preset_modes=[PRESET_NONE, PRESET_ECO],
+        swing_modes=["vertical"],
+        swing_horizontal_modes=None,
+        supported_features=ClimateEntityFeature.SWING_MODE,
     )
+    mock_coordinator.capabilities.async_get_or_create("AP-WD2E/1.0", lambda: profile)
 
-    # Mock other required methods to prevent KeyError
-    climate._fujitsu_device.get_fan_speed = MagicMock(return_value={"value": 1})
-    climate._fujitsu_device.get_operation_mode = MagicMock(
-        return_value={"value": "heat"}
+    climate = FujitsuClimate(
+        fglair_api_client=mock_client,
+        dsn="test-dsn",
+        region="eu",
+        tokenpath=DEFAULT_TOKEN_PATH,
+        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
+        hass=MagicMock(),
+        coordinator=mock_coordinator,
     )
 
-    # Mock failure for refresh temperature
-    climate._fujitsu_device.get_refresh = MagicMock(
-        return_value={"data_updated_at": "2023-01-01"}
+    assert climate.preset_modes is profile.preset_modes
+    assert climate.swing_modes is profile.swing_modes
+    assert climate.supported_features == ClimateEntityFeature.SWING_MODE
+
+
+def test_capabilities_shared_by_a_model() -> None:
+    """Test devices of the same model share one capability profile."""
+    mock_client = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
+    mock_coordinator.capability_key.return_value = "AP-WD2E/1.0"
+    climates = [
+        FujitsuClimate(
+            fglair_api_client=mock_client,
+            dsn=dsn,
+            region="eu",
+            tokenpath=DEFAULT_TOKEN_PATH,
+            temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
+            hass=MagicMock(),
+            coordinator=mock_coordinator,
+        )
+        for dsn in ("dsn1", "dsn2")
+    ]
+    snapshot = DeviceSnapshot(
+        current_temperature=21.5,
+        target_temperature=23.0,
+        operation_mode=6,
+        fan_speed=4,
+        economy_mode=0,
+        af_vertical_direction=1,
+        af_vertical_num_dir=2,
     )
+    mock_coordinator.data = {"dsn1": snapshot, "dsn2": snapshot}
 
-    # Mock the method using patch to avoid method assignment error
     with patch.object(
-        climate,
-        "_async_refresh_display_temperature_request",
-        side_effect=HomeAssistantError("Refresh Error"),
-    ):
-        # Should continue without raising exception
-        await climate.async_update()
+        FujitsuClimate,
+        "_device_profile",
+        autospec=True,
+        side_effect=FujitsuClimate._device_profile,
+    ) as device_profile:
+        for climate in climates:
+            climate._update_from_snapshot()
+
+    assert climates[0].swing_modes is climates[1].swing_modes
+    assert climates[1].swing_modes == [SWING_VERTICAL, VERTICAL + "1", VERTICAL + "2"]
+    assert climates[1].preset_modes == [PRESET_NONE, PRESET_ECO]
+    # Only the first device of the model is inspected
+    device_profile.assert_called_once_with(climates[0])
+
+
+def test_available_requires_snapshot() -> None:
+    """Test the entity is only available when a snapshot exists."""
+    mock_client = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
+    mock_coordinator.last_update_success = True
+
+    climate = FujitsuClimate(
+        fglair_api_client=mock_client,
+        dsn="test-dsn",
+        region="eu",
+        tokenpath=DEFAULT_TOKEN_PATH,
+        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
+        hass=MagicMock(),
+        coordinator=mock_coordinator,
+    )
+
+    assert climate.available is False
+
+    mock_coordinator.data = {"test-dsn": {}}
+    assert climate.available is True
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
@@ -1522,6 +1819,17 @@ async def test_async_retry_api_call_failure_max_retries() -> None:
     assert call_count == 2  # Should have been called max_retries times
 
 
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_retry_api_call_does_not_retry_open_circuit() -> None:
+    """Test calls failing fast on an open circuit are not retried."""
+    api_call = AsyncMock(side_effect=CircuitOpenError("suspended"))
+
+    with pytest.raises(HomeAssistantError, match="Device communication failed"):
+        await _async_retry_api_call(api_call)
+
+    api_call.assert_called_once()
+
+
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_retry_api_call_success_after_retry() -> None:
     """Test _async_retry_api_call with success after retry."""
@@ -1553,7 +1861,7 @@ async def test_async_retry_api_call_unexpected_error() -> None:
 def test_name_property() -> None:
     """Test name property returns expected value."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1565,10 +1873,7 @@ def test_name_property() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device name response correctly
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
+    climate._snapshot = DeviceSnapshot(device_name="Test Device")
 
     name = climate.name
     assert name == "Test Device"
@@ -1577,7 +1882,7 @@ def test_name_property() -> None:
 def test_is_aux_heat_on_property_true() -> None:
     """Test is_aux_heat_on property when true."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1589,10 +1894,8 @@ def test_is_aux_heat_on_property_true() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the powerful mode response - create a mock object with value attribute
-    mock_response = MagicMock()
-    mock_response.value = True
-    climate._fujitsu_device.get_powerful_mode = MagicMock(return_value=mock_response)
+    # Powerful mode is on
+    climate._snapshot = DeviceSnapshot(powerful_mode=1)
 
     is_aux_heat = climate.is_aux_heat_on
     assert is_aux_heat is True
@@ -1601,7 +1904,7 @@ def test_is_aux_heat_on_property_true() -> None:
 def test_is_aux_heat_on_property_false() -> None:
     """Test is_aux_heat_on property when false."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1613,8 +1916,8 @@ def test_is_aux_heat_on_property_false() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the powerful mode response
-    climate._fujitsu_device.get_powerful_mode = MagicMock(return_value={"value": False})
+    # Powerful mode is off
+    climate._snapshot = DeviceSnapshot(powerful_mode=0)
 
     is_aux_heat = climate.is_aux_heat_on
     assert is_aux_heat is False
@@ -1623,7 +1926,7 @@ def test_is_aux_heat_on_property_false() -> None:
 def test_is_aux_heat_on_property_no_value() -> None:
     """Test is_aux_heat_on property when no value attribute."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1635,8 +1938,8 @@ def test_is_aux_heat_on_property_no_value() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the powerful mode response without value attribute
-    climate._fujitsu_device.get_powerful_mode = MagicMock(return_value={})
+    # The device does not report powerful mode
+    climate._snapshot = DeviceSnapshot()
 
     is_aux_heat = climate.is_aux_heat_on
     assert is_aux_heat is False
@@ -1645,7 +1948,7 @@ def test_is_aux_heat_on_property_no_value() -> None:
 def test_current_temperature_property() -> None:
     """Test current_temperature property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1667,7 +1970,7 @@ def test_current_temperature_property() -> None:
 def test_current_temperature_property_none() -> None:
     """Test current_temperature property when None."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1690,7 +1993,7 @@ def test_current_temperature_property_none() -> None:
 async def test_async_set_temperature() -> None:
     """Test async_set_temperature method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1702,22 +2005,20 @@ async def test_async_set_temperature() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_change_temperature = AsyncMock()
-
-    # Test setting temperature
-    kwargs = {ATTR_TEMPERATURE: 22.0}
-    await climate.async_set_temperature(**kwargs)
+    await climate.async_set_temperature(**{ATTR_TEMPERATURE: 22.0})
 
     # Verify that the temperature was set
-    climate._fujitsu_device.async_change_temperature.assert_called_once()
+    mock_client.async_set_device_property.assert_called_once_with(
+        "adjust_temperature", 220
+    )
+    mock_coordinator.async_note_command.assert_called_once_with("test-dsn")
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_temperature_none() -> None:
     """Test async_set_temperature with None temperature."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1744,7 +2045,7 @@ async def test_async_set_temperature_none() -> None:
 async def test_async_set_hvac_mode_heat() -> None:
     """Test async_set_hvac_mode for heat mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1756,20 +2057,17 @@ async def test_async_set_hvac_mode_heat() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_change_operation_mode = AsyncMock()
-
     await climate.async_set_hvac_mode(HVACMode.HEAT)
 
     # Verify that the HVAC mode was set
-    climate._fujitsu_device.async_change_operation_mode.assert_called_once()
+    mock_client.async_set_device_property.assert_called_once_with("operation_mode", 6)
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_hvac_mode_cool() -> None:
     """Test async_set_hvac_mode for cool mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1781,20 +2079,17 @@ async def test_async_set_hvac_mode_cool() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_change_operation_mode = AsyncMock()
-
     await climate.async_set_hvac_mode(HVACMode.COOL)
 
     # Verify that the HVAC mode was set
-    climate._fujitsu_device.async_change_operation_mode.assert_called_once()
+    mock_client.async_set_device_property.assert_called_once_with("operation_mode", 3)
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_hvac_mode_off() -> None:
     """Test async_set_hvac_mode for off mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1806,20 +2101,23 @@ async def test_async_set_hvac_mode_off() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_turnOff = AsyncMock()
-
     await climate.async_set_hvac_mode(HVACMode.OFF)
 
     # Verify that the device was turned off
-    climate._fujitsu_device.async_turnOff.assert_called_once()
+    mock_client.async_set_device_property.assert_called_once_with("operation_mode", 0)
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_turn_on() -> None:
     """Test async_turn_on method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_client.async_get_device_property = AsyncMock(
+        return_value=[
+            {"datapoint": {"value": 3}},
+            {"datapoint": {"value": 0}},
+        ]
+    )
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1831,20 +2129,26 @@ async def test_async_turn_on() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_turnOn = AsyncMock()
-
+    # Off since the start, the mode comes from the history of the property
     await climate.async_turn_on()
-
-    # Verify that the device was turned on
-    climate._fujitsu_device.async_turnOn.assert_called_once()
+    mock_client.async_get_device_property.assert_called_once_with("operation_mode")
+    mock_client.async_set_device_property.assert_called_once_with("operation_mode", 3)
+
+    # A snapshot showed the device on in heat mode, no history is fetched
+    mock_coordinator.data = {"test-dsn": DeviceSnapshot(operation_mode=6)}
+    climate._update_from_snapshot()
+    mock_coordinator.data = {"test-dsn": DeviceSnapshot(operation_mode=0)}
+    climate._update_from_snapshot()
+    await climate.async_turn_on()
+    mock_client.async_get_device_property.assert_called_once()
+    mock_client.async_set_device_property.assert_called_with("operation_mode", 6)
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_turn_off() -> None:
     """Test async_turn_off method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1856,20 +2160,17 @@ async def test_async_turn_off() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_turnOff = AsyncMock()
-
     await climate.async_turn_off()
 
     # Verify that the device was turned off
-    climate._fujitsu_device.async_turnOff.assert_called_once()
+    mock_client.async_set_device_property.assert_called_once_with("operation_mode", 0)
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_fan_mode_high() -> None:
     """Test async_set_fan_mode for high speed."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1881,20 +2182,17 @@ async def test_async_set_fan_mode_high() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_changeFanSpeed = AsyncMock()
-
     await climate.async_set_fan_mode(FAN_HIGH)
 
     # Verify that the fan mode was set
-    climate._fujitsu_device.async_changeFanSpeed.assert_called_once()
+    mock_client.async_set_device_property.assert_called_once_with("fan_speed", 3)
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_fan_mode_auto() -> None:
     """Test async_set_fan_mode for auto speed."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1906,20 +2204,17 @@ async def test_async_set_fan_mode_auto() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_changeFanSpeed = AsyncMock()
-
     await climate.async_set_fan_mode(FAN_AUTO)
 
     # Verify that the fan mode was set
-    climate._fujitsu_device.async_changeFanSpeed.assert_called_once()
+    mock_client.async_set_device_property.assert_called_once_with("fan_speed", 4)
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_swing_mode_both() -> None:
     """Test async_set_swing_mode for both directions."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1931,22 +2226,21 @@ async def test_async_set_swing_mode_both() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly
-    climate._fujitsu_device.async_set_af_vertical_swing = AsyncMock()
-    climate._fujitsu_device.async_set_af_horizontal_swing = AsyncMock()
-
     await climate.async_set_swing_mode(SWING_BOTH)
 
     # Verify that the swing modes were set
-    climate._fujitsu_device.async_set_af_vertical_swing.assert_called_once()
-    climate._fujitsu_device.async_set_af_horizontal_swing.assert_called_once()
+    assert sorted(mock_client.async_set_device_property.call_args_list) == [
+        call("af_horizontal_swing", 1),
+        call("af_vertical_swing", 1),
+    ]
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_preset_mode_eco() -> None:
     """Test async_set_preset_mode for eco mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_client.async_set_device_property = AsyncMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -1958,63 +2252,27 @@ async def test_async_set_preset_mode_eco() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly based on pyfujitsugeneral structure
-    climate._fujitsu_device.async_set_economy_mode = AsyncMock()
-    climate._fujitsu_device.async_economy_mode_on = AsyncMock()
-    climate._fujitsu_device.async_economy_mode_off = AsyncMock()
-    climate._fujitsu_device.async_powerful_mode_off = AsyncMock()
-    climate._fujitsu_device.async_min_heat_mode_off = AsyncMock()
-    climate._fujitsu_device.get_economy_mode = MagicMock(
-        return_value={"key": "economy_key"}
-    )
-    climate._fujitsu_device.get_powerful_mode = MagicMock(
-        return_value={"key": "powerful_key"}
-    )
-    climate._fujitsu_device.get_min_heat = MagicMock(
-        return_value={"key": "min_heat_key"}
-    )
-    climate._fujitsu_device.async_update_properties = AsyncMock(
-        return_value={"economy_mode": True}
-    )
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-    climate._fujitsu_device.get_refresh = MagicMock(
-        return_value={"data_updated_at": "2024-01-01T00:00:00Z", "key": "refresh_key"}
-    )
-    climate._fujitsu_device.async_get_display_temperature_degree = AsyncMock(
-        return_value=22.0
-    )
-
-    # Mock the internal client properly - this is the key!
-    climate._fujitsu_device._client = AsyncMock()
-    climate._fujitsu_device._client.async_set_device_property = AsyncMock()
-
-    # Mock internal attributes that async_update needs
-    climate._fujitsu_device._adjust_temperature = {"value": 22}
-    climate._fujitsu_device.async_get_adjust_temperature_degree = AsyncMock(
-        return_value=22.0
-    )
-    climate._fujitsu_device.get_fan_speed = MagicMock(
-        return_value={"value": 2}
-    )  # Medium speed
-    climate._fujitsu_device.get_fan_speed_desc = MagicMock(return_value="Medium")
-    climate._fujitsu_device.get_operation_mode = MagicMock(
-        return_value={"value": 1}
-    )  # Heat mode
-    climate._fujitsu_device.get_operation_mode_desc = MagicMock(return_value="Heat")
+    # Every preset but the target one is on
+    climate._snapshot = DeviceSnapshot(economy_mode=0, powerful_mode=1, min_heat=1)
 
     await climate.async_set_preset_mode(PRESET_ECO)
 
     # Verify that the preset mode was set
-    climate._fujitsu_device.async_economy_mode_on.assert_called_once()
+    # Both other presets are switched off before eco is switched on
+    assert mock_client.async_set_device_property.call_args_list == [
+        call("powerful_mode", 0),
+        call("min_heat", 0),
+        call("economy_mode", 1),
+    ]
+    mock_coordinator.async_refresh_properties.assert_called_once()
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_preset_mode_boost() -> None:
     """Test async_set_preset_mode for boost mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_client.async_set_device_property = AsyncMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2026,63 +2284,27 @@ async def test_async_set_preset_mode_boost() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly based on pyfujitsugeneral structure
-    climate._fujitsu_device.async_set_powerful_mode = AsyncMock()
-    climate._fujitsu_device.async_powerful_mode_on = AsyncMock()
-    climate._fujitsu_device.async_powerful_mode_off = AsyncMock()
-    climate._fujitsu_device.async_economy_mode_off = AsyncMock()
-    climate._fujitsu_device.async_min_heat_mode_off = AsyncMock()
-    climate._fujitsu_device.get_economy_mode = MagicMock(
-        return_value={"key": "economy_key"}
-    )
-    climate._fujitsu_device.get_powerful_mode = MagicMock(
-        return_value={"key": "powerful_key"}
-    )
-    climate._fujitsu_device.get_min_heat = MagicMock(
-        return_value={"key": "min_heat_key"}
-    )
-    climate._fujitsu_device.async_update_properties = AsyncMock(
-        return_value={"powerful_mode": True}
-    )
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-    climate._fujitsu_device.get_refresh = MagicMock(
-        return_value={"data_updated_at": "2024-01-01T00:00:00Z", "key": "refresh_key"}
-    )
-    climate._fujitsu_device.async_get_display_temperature_degree = AsyncMock(
-        return_value=22.0
-    )
-
-    # Mock the internal client properly - this is the key!
-    climate._fujitsu_device._client = AsyncMock()
-    climate._fujitsu_device._client.async_set_device_property = AsyncMock()
-
-    # Mock internal attributes that async_update needs
-    climate._fujitsu_device._adjust_temperature = {"value": 22}
-    climate._fujitsu_device.async_get_adjust_temperature_degree = AsyncMock(
-        return_value=22.0
-    )
-    climate._fujitsu_device.get_fan_speed = MagicMock(
-        return_value={"value": 2}
-    )  # Medium speed
-    climate._fujitsu_device.get_fan_speed_desc = MagicMock(return_value="Medium")
-    climate._fujitsu_device.get_operation_mode = MagicMock(
-        return_value={"value": 1}
-    )  # Heat mode
-    climate._fujitsu_device.get_operation_mode_desc = MagicMock(return_value="Heat")
+    # Every preset but the target one is on
+    climate._snapshot = DeviceSnapshot(economy_mode=1, powerful_mode=0, min_heat=1)
 
     await climate.async_set_preset_mode(PRESET_BOOST)
 
     # Verify that the preset mode was set
-    climate._fujitsu_device.async_powerful_mode_on.assert_called_once()
+    # Both other presets are switched off before boost is switched on
+    assert mock_client.async_set_device_property.call_args_list == [
+        call("economy_mode", 0),
+        call("min_heat", 0),
+        call("powerful_mode", 1),
+    ]
+    mock_coordinator.async_refresh_properties.assert_called_once()
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_preset_mode_away() -> None:
     """Test async_set_preset_mode for away mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_client.async_set_device_property = AsyncMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2094,63 +2316,27 @@ async def test_async_set_preset_mode_away() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly based on pyfujitsugeneral structure
-    climate._fujitsu_device.async_set_min_heat = AsyncMock()
-    climate._fujitsu_device.async_min_heat_mode_on = AsyncMock()
-    climate._fujitsu_device.async_min_heat_mode_off = AsyncMock()
-    climate._fujitsu_device.async_economy_mode_off = AsyncMock()
-    climate._fujitsu_device.async_powerful_mode_off = AsyncMock()
-    climate._fujitsu_device.get_economy_mode = MagicMock(
-        return_value={"key": "economy_key"}
-    )
-    climate._fujitsu_device.get_powerful_mode = MagicMock(
-        return_value={"key": "powerful_key"}
-    )
-    climate._fujitsu_device.get_min_heat = MagicMock(
-        return_value={"key": "min_heat_key"}
-    )
-    climate._fujitsu_device.async_update_properties = AsyncMock(
-        return_value={"min_heat": True}
-    )
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
-    )
-    climate._fujitsu_device.get_refresh = MagicMock(
-        return_value={"data_updated_at": "2024-01-01T00:00:00Z", "key": "refresh_key"}
-    )
-    climate._fujitsu_device.async_get_display_temperature_degree = AsyncMock(
-        return_value=22.0
-    )
-
-    # Mock the internal client properly - this is the key!
-    climate._fujitsu_device._client = AsyncMock()
-    climate._fujitsu_device._client.async_set_device_property = AsyncMock()
-
-    # Mock internal attributes that async_update needs
-    climate._fujitsu_device._adjust_temperature = {"value": 22}
-    climate._fujitsu_device.async_get_adjust_temperature_degree = AsyncMock(
-        return_value=22.0
-    )
-    climate._fujitsu_device.get_fan_speed = MagicMock(
-        return_value={"value": 2}
-    )  # Medium speed
-    climate._fujitsu_device.get_fan_speed_desc = MagicMock(return_value="Medium")
-    climate._fujitsu_device.get_operation_mode = MagicMock(
-        return_value={"value": 1}
-    )  # Heat mode
-    climate._fujitsu_device.get_operation_mode_desc = MagicMock(return_value="Heat")
+    # Every preset but the target one is on
+    climate._snapshot = DeviceSnapshot(economy_mode=1, powerful_mode=1, min_heat=0)
 
     await climate.async_set_preset_mode(PRESET_AWAY)
 
     # Verify that the preset mode was set
-    climate._fujitsu_device.async_min_heat_mode_on.assert_called_once()
+    # Both other presets are switched off before away is switched on
+    assert mock_client.async_set_device_property.call_args_list == [
+        call("economy_mode", 0),
+        call("powerful_mode", 0),
+        call("min_heat", 1),
+    ]
+    mock_coordinator.async_refresh_properties.assert_called_once()
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_preset_mode_none() -> None:
     """Test async_set_preset_mode for none mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_client.async_set_device_property = AsyncMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2162,65 +2348,147 @@ async def test_async_set_preset_mode_none() -> None:
         coordinator=mock_coordinator,
     )
 
-    # Mock the device methods correctly based on pyfujitsugeneral structure
-    climate._fujitsu_device.async_set_economy_mode = AsyncMock()
-    climate._fujitsu_device.async_set_powerful_mode = AsyncMock()
-    climate._fujitsu_device.async_set_min_heat = AsyncMock()
-    climate._fujitsu_device.async_economy_mode_off = AsyncMock()
-    climate._fujitsu_device.async_powerful_mode_off = AsyncMock()
-    climate._fujitsu_device.async_min_heat_mode_off = AsyncMock()
-    climate._fujitsu_device.get_economy_mode = MagicMock(
-        return_value={"key": "economy_key"}
-    )
-    climate._fujitsu_device.get_powerful_mode = MagicMock(
-        return_value={"key": "powerful_key"}
-    )
-    climate._fujitsu_device.get_min_heat = MagicMock(
-        return_value={"key": "min_heat_key"}
+    # Every preset but the target one is on
+    climate._snapshot = DeviceSnapshot(economy_mode=1, powerful_mode=1, min_heat=1)
+
+    await climate.async_set_preset_mode(PRESET_NONE)
+
+    # Verify that all preset modes were turned off
+    # Every preset is switched off
+    assert mock_client.async_set_device_property.call_args_list == [
+        call("economy_mode", 0),
+        call("powerful_mode", 0),
+        call("min_heat", 0),
+    ]
+    mock_coordinator.async_refresh_properties.assert_called_once()
+
+
+def _preset_climate(
+    economy: int, powerful: int, min_heat: int
+) -> tuple[FujitsuClimate, MagicMock, MagicMock]:
+    """Return an entity whose device reports the given preset values."""
+    mock_client = MagicMock()
+    mock_client.async_set_device_property = AsyncMock()
+    mock_coordinator = _mock_coordinator(mock_client)
+    climate = FujitsuClimate(
+        fglair_api_client=mock_client,
+        dsn="test-dsn",
+        region="eu",
+        tokenpath=DEFAULT_TOKEN_PATH,
+        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
+        hass=MagicMock(),
+        coordinator=mock_coordinator,
     )
-    climate._fujitsu_device.async_update_properties = AsyncMock(
-        return_value={"economy_mode": True, "powerful_mode": True, "min_heat": True}
+    climate._fujitsu_device.set_properties(
+        [
+            {"property": {"name": "economy_mode", "key": "eco", "value": economy}},
+            {"property": {"name": "powerful_mode", "key": "boost", "value": powerful}},
+            {"property": {"name": "min_heat", "key": "away", "value": min_heat}},
+        ]
     )
-    climate._fujitsu_device.get_device_name = MagicMock(
-        return_value={"value": "Test Device"}
+    properties = climate._fujitsu_device.get_properties()
+    climate._fujitsu_device._economy_mode = get_prop_from_json(
+        "economy_mode", properties
     )
-    climate._fujitsu_device.get_refresh = MagicMock(
-        return_value={"data_updated_at": "2024-01-01T00:00:00Z", "key": "refresh_key"}
+    climate._fujitsu_device._powerful_mode = get_prop_from_json(
+        "powerful_mode", properties
     )
-    climate._fujitsu_device.async_get_display_temperature_degree = AsyncMock(
-        return_value=22.0
+    climate._fujitsu_device._min_heat = get_prop_from_json("min_heat", properties)
+    climate._snapshot = DeviceSnapshot(
+        economy_mode=economy, powerful_mode=powerful, min_heat=min_heat
     )
+    return climate, mock_client, mock_coordinator
 
-    # Mock the internal client properly - this is the key!
-    climate._fujitsu_device._client = AsyncMock()
-    climate._fujitsu_device._client.async_set_device_property = AsyncMock()
 
-    # Mock internal attributes that async_update needs
-    climate._fujitsu_device._adjust_temperature = {"value": 22}
-    climate._fujitsu_device.async_get_adjust_temperature_degree = AsyncMock(
-        return_value=22.0
-    )
-    climate._fujitsu_device.get_fan_speed = MagicMock(
-        return_value={"value": 2}
-    )  # Medium speed
-    climate._fujitsu_device.get_fan_speed_desc = MagicMock(return_value="Medium")
-    climate._fujitsu_device.get_operation_mode = MagicMock(
-        return_value={"value": 1}
-    )  # Heat mode
-    climate._fujitsu_device.get_operation_mode_desc = MagicMock(return_value="Heat")
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_set_preset_mode_skips_modes_in_target_state() -> None:
+    """Test only the presets not yet in their target state are written."""
+    climate, mock_client, mock_coordinator = _preset_climate(1, 0, 0)
 
-    await climate.async_set_preset_mode(PRESET_NONE)
+    await climate.async_set_preset_mode(PRESET_ECO)
+    mock_client.async_set_device_property.assert_not_called()
+    mock_coordinator.async_refresh_properties.assert_not_called()
 
-    # Verify that all preset modes were turned off
-    climate._fujitsu_device.async_economy_mode_off.assert_called_once()
-    climate._fujitsu_device.async_powerful_mode_off.assert_called_once()
-    climate._fujitsu_device.async_min_heat_mode_off.assert_called_once()
+    await climate.async_set_preset_mode(PRESET_BOOST)
+    assert mock_client.async_set_device_property.call_args_list == [
+        call("eco", 0),
+        call("boost", 1),
+    ]
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_set_preset_mode_forced_or_stale() -> None:
+    """Test presets matching a stale snapshot, or forced, are written."""
+    climate, mock_client, mock_coordinator = _preset_climate(1, 0, 0)
+
+    await climate.async_set_preset_mode(PRESET_ECO, force=True)
+    assert mock_client.async_set_device_property.call_count == 3
+
+    mock_coordinator.is_fresh.return_value = False
+    await climate.async_set_preset_mode(PRESET_ECO)
+    assert mock_client.async_set_device_property.call_count == 6
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_set_preset_mode_unconfirmed() -> None:
+    """Test a failed confirmation read leaves the mode to the fast polls."""
+    climate, mock_client, mock_coordinator = _preset_climate(0, 0, 0)
+    mock_coordinator.async_refresh_properties.side_effect = CircuitOpenError("open")
+
+    await climate.async_set_preset_mode(PRESET_ECO)
+
+    mock_client.async_set_device_property.assert_called_once_with("eco", 1)
+    mock_coordinator.async_note_command.assert_called_once_with("test-dsn")
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_set_preset_mode_sends_off_writes_together() -> None:
+    """Test the off writes are in flight together and the on write waits."""
+    climate, mock_client, _ = _preset_climate(1, 0, 1)
+    release = asyncio.Event()
+    in_flight: list[str] = []
+    sent: list[str] = []
+
+    async def set_device_property(key: str, value: int) -> None:
+        in_flight.append(key)
+        if value == 0:
+            await release.wait()
+        sent.append(key)
+
+    mock_client.async_set_device_property.side_effect = set_device_property
+    task = asyncio.create_task(climate.async_set_preset_mode(PRESET_BOOST))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert in_flight == ["eco", "away"]
+
+    release.set()
+    await task
+    assert sent == ["eco", "away", "boost"]
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_retry_api_call_retries_after_timeout() -> None:
+    """Test an attempt running past the timeout is retried."""
+    attempts = 0
+
+    async def api_call() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(1)
+        return "ok"
+
+    assert (
+        await _async_retry_api_call(api_call, max_retries=2, delay=0, timeout=0.01)
+        == "ok"
+    )
+    assert attempts == 2
 
 
 def test_get_supported_presets_economy_mode() -> None:
     """Test get_supported_presets with economy mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2233,22 +2501,17 @@ def test_get_supported_presets_economy_mode() -> None:
     )
 
     # Mock properties with economy mode
-    climate._properties = {"economy_mode": True}  # type: ignore[assignment]
+    climate._snapshot = DeviceSnapshot(economy_mode=1)
 
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = True
-
-        presets = climate.get_supported_presets()
-        assert PRESET_NONE in presets
-        assert PRESET_ECO in presets
+    presets = climate.get_supported_presets()
+    assert PRESET_NONE in presets
+    assert PRESET_ECO in presets
 
 
 def test_get_supported_presets_powerful_mode() -> None:
     """Test get_supported_presets with powerful mode."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2261,22 +2524,17 @@ def test_get_supported_presets_powerful_mode() -> None:
     )
 
     # Mock properties with powerful mode
-    climate._properties = {"powerful_mode": True}  # type: ignore[assignment]
+    climate._snapshot = DeviceSnapshot(powerful_mode=1)
 
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = True
-
-        presets = climate.get_supported_presets()
-        assert PRESET_NONE in presets
-        assert PRESET_BOOST in presets
+    presets = climate.get_supported_presets()
+    assert PRESET_NONE in presets
+    assert PRESET_BOOST in presets
 
 
 def test_get_supported_presets_min_heat() -> None:
     """Test get_supported_presets with min heat."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2289,22 +2547,17 @@ def test_get_supported_presets_min_heat() -> None:
     )
 
     # Mock properties with min heat
-    climate._properties = {"min_heat": True}  # type: ignore[assignment]
+    climate._snapshot = DeviceSnapshot(min_heat=1)
 
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = True
-
-        presets = climate.get_supported_presets()
-        assert PRESET_NONE in presets
-        assert PRESET_AWAY in presets
+    presets = climate.get_supported_presets()
+    assert PRESET_NONE in presets
+    assert PRESET_AWAY in presets
 
 
 def test_get_supported_presets_multiple() -> None:
     """Test get_supported_presets with multiple modes."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2317,29 +2570,20 @@ def test_get_supported_presets_multiple() -> None:
     )
 
     # Mock properties with multiple modes
-    climate._properties = {  # type: ignore[assignment]
-        "economy_mode": True,
-        "powerful_mode": True,
-        "min_heat": True,
-    }
-
-    with patch(
-        "custom_components.fglair_heatpump_controller.climate.get_prop_from_json"
-    ) as mock_get_prop:
-        mock_get_prop.return_value = True
+    climate._snapshot = DeviceSnapshot(economy_mode=1, powerful_mode=1, min_heat=1)
 
-        presets = climate.get_supported_presets()
-        assert PRESET_NONE in presets
-        assert PRESET_ECO in presets
-        assert PRESET_BOOST in presets
-        assert PRESET_AWAY in presets
-        assert len(presets) == 4
+    presets = climate.get_supported_presets()
+    assert PRESET_NONE in presets
+    assert PRESET_ECO in presets
+    assert PRESET_BOOST in presets
+    assert PRESET_AWAY in presets
+    assert len(presets) == 4
 
 
 def test_get_supported_presets_none() -> None:
     """Test get_supported_presets with no properties."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2352,7 +2596,7 @@ def test_get_supported_presets_none() -> None:
     )
 
     # Mock properties as None
-    climate._properties = None
+    climate._snapshot = None
 
     presets = climate.get_supported_presets()
     assert PRESET_NONE in presets
@@ -2362,7 +2606,7 @@ def test_get_supported_presets_none() -> None:
 def test_climate_initialization_with_none_values() -> None:
     """Test climate initialization with None values."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     # Test with empty strings instead of None to avoid type errors
     climate = FujitsuClimate(
@@ -2383,7 +2627,7 @@ def test_climate_initialization_with_none_values() -> None:
 def test_climate_initialization_with_empty_strings() -> None:
     """Test climate initialization with empty strings."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2403,7 +2647,7 @@ def test_climate_initialization_with_empty_strings() -> None:
 def test_climate_initialization_with_special_characters() -> None:
     """Test climate initialization with special characters."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2424,7 +2668,7 @@ def test_climate_initialization_with_special_characters() -> None:
 def test_climate_initialization_with_negative_temperature_offset() -> None:
     """Test climate initialization with negative temperature offset."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2443,7 +2687,7 @@ def test_climate_initialization_with_negative_temperature_offset() -> None:
 def test_climate_initialization_with_large_temperature_offset() -> None:
     """Test climate initialization with large temperature offset."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2462,7 +2706,7 @@ def test_climate_initialization_with_large_temperature_offset() -> None:
 def test_climate_initialization_with_zero_temperature_offset() -> None:
     """Test climate initialization with zero temperature offset."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2481,7 +2725,7 @@ def test_climate_initialization_with_zero_temperature_offset() -> None:
 def test_climate_initialization_with_different_regions() -> None:
     """Test climate initialization with different regions."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     regions = ["eu", "us", "asia", "au", "jp"]
 
@@ -2503,7 +2747,7 @@ def test_climate_initialization_with_different_regions() -> None:
 def test_climate_initialization_with_long_dsn() -> None:
     """Test climate initialization with long DSN."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     long_dsn = "a" * 100  # Very long DSN
 
@@ -2525,7 +2769,7 @@ def test_climate_initialization_with_long_dsn() -> None:
 def test_climate_set_temperature() -> None:
     """Test climate entity set_temperature method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2550,7 +2794,7 @@ def test_climate_set_temperature() -> None:
 def test_climate_set_hvac_mode() -> None:
     """Test climate entity set_hvac_mode method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2575,7 +2819,7 @@ def test_climate_set_hvac_mode() -> None:
 def test_climate_set_fan_mode() -> None:
     """Test climate entity set_fan_mode method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2594,7 +2838,7 @@ def test_climate_set_fan_mode() -> None:
 def test_climate_set_swing_mode() -> None:
     """Test climate entity set_swing_mode method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2613,7 +2857,7 @@ def test_climate_set_swing_mode() -> None:
 def test_climate_set_preset_mode() -> None:
     """Test climate entity set_preset_mode method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2632,7 +2876,7 @@ def test_climate_set_preset_mode() -> None:
 def test_climate_turn_on() -> None:
     """Test climate entity turn_on method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2651,7 +2895,7 @@ def test_climate_turn_on() -> None:
 def test_climate_turn_off() -> None:
     """Test climate entity turn_off method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2670,7 +2914,7 @@ def test_climate_turn_off() -> None:
 def test_climate_update() -> None:
     """Test climate entity update method."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2689,7 +2933,7 @@ def test_climate_update() -> None:
 def test_climate_entity_registry() -> None:
     """Test climate entity registry properties."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2714,7 +2958,7 @@ def test_climate_entity_registry() -> None:
 def test_climate_current_temperature() -> None:
     """Test climate entity current temperature property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2732,7 +2976,7 @@ def test_climate_current_temperature() -> None:
 def test_climate_target_temperature() -> None:
     """Test climate entity target temperature property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2750,7 +2994,7 @@ def test_climate_target_temperature() -> None:
 def test_climate_current_humidity() -> None:
     """Test climate entity current humidity property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2768,7 +3012,7 @@ def test_climate_current_humidity() -> None:
 def test_climate_target_humidity() -> None:
     """Test climate entity target humidity property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -2786,7 +3030,7 @@ def test_climate_target_humidity() -> None:
 def test_climate_hvac_action() -> None:
     """Test climate entity HVAC action property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     with (
         patch(
@@ -2819,7 +3063,7 @@ def test_climate_hvac_action() -> None:
 def test_climate_current_fan_mode() -> None:
     """Test climate entity current fan mode property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     with patch("pyfujitsugeneral.splitAC.SplitAC.get_fan_speed") as mock_get_fan_speed:
         # Mock fan speed response
@@ -2845,7 +3089,7 @@ def test_climate_current_fan_mode() -> None:
 def test_climate_current_swing_mode() -> None:
     """Test climate entity current swing mode property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     # Mock swing mode responses
     mock_client.get_af_vertical_num_dir.return_value = {"value": 3}
@@ -2871,7 +3115,7 @@ def test_climate_current_swing_mode() -> None:
 def test_climate_current_preset_mode() -> None:
     """Test climate entity current preset mode property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     with patch(
         "pyfujitsugeneral.splitAC.SplitAC.get_properties"
@@ -2896,10 +3140,10 @@ def test_climate_current_preset_mode() -> None:
                 assert hasattr(climate, attr)  # Property exists and is accessible
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_async_setup_entry_success() -> None:
-    """Test successful climate setup entry."""
-    # Mock Home Assistant objects
+def _setup_entry_mocks(
+    devices: list[str],
+) -> tuple[MagicMock, MagicMock, MagicMock, AsyncMock]:
+    """Return hass, entry, coordinator and shared client mocks for setup."""
     mock_hass = MagicMock()
     mock_entry = MagicMock()
     mock_entry.entry_id = "test_entry_id"
@@ -2910,35 +3154,33 @@ async def test_async_setup_entry_success() -> None:
         CONF_TOKENPATH: "/test/path",
         CONF_TEMPERATURE_OFFSET: 0.0,
     }
-    mock_async_add_entities = MagicMock()
 
-    # Mock coordinator in hass.data
+    # Shared API client and cached inventory owned by the coordinator
+    mock_api_client = AsyncMock()
+
     mock_coordinator = MagicMock()
+    mock_coordinator.data = {
+        dsn: DeviceSnapshot(device_name=f"Device {dsn}") for dsn in devices
+    }
+    mock_coordinator.client = mock_api_client
+    mock_coordinator.devices_dsn = devices
     mock_hass.data = {DOMAIN: {mock_entry.entry_id: mock_coordinator}}
 
-    # Mock API client and authentication
-    mock_api_client = AsyncMock()
-    mock_api_client.async_authenticate.return_value = True
-    mock_api_client.async_get_devices_dsn.return_value = ["device1", "device2"]
+    return mock_hass, mock_entry, mock_coordinator, mock_api_client
 
-    with (
-        patch(
-            "custom_components.fglair_heatpump_controller.climate.FGLairApiClient",
-            return_value=mock_api_client,
-        ),
-        patch(
-            "custom_components.fglair_heatpump_controller.climate."
-            "async_get_clientsession",
-            return_value=MagicMock(),
-        ),
-    ):
-        await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
 
-    # Verify authentication was called
-    mock_api_client.async_authenticate.assert_called_once()
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_setup_entry_success() -> None:
+    """Test successful climate setup entry."""
+    mock_hass, mock_entry, _, mock_api_client = _setup_entry_mocks(
+        ["device1", "device2"]
+    )
+    mock_async_add_entities = MagicMock()
+
+    await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
 
-    # Verify devices were fetched
-    mock_api_client.async_get_devices_dsn.assert_called_once()
+    # The cached inventory of the coordinator is used, no second fetch
+    mock_api_client.async_get_devices_dsn.assert_not_called()
 
     # Verify entities were added
     mock_async_add_entities.assert_called_once()
@@ -2947,103 +3189,119 @@ async def test_async_setup_entry_success() -> None:
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
-async def test_async_setup_entry_auth_failure() -> None:
-    """Test climate setup entry with authentication failure."""
-    # Mock Home Assistant objects
-    mock_hass = MagicMock()
-    mock_entry = MagicMock()
-    mock_entry.entry_id = "test_entry_id"
-    mock_entry.data = {
-        CONF_USERNAME: "test_user",
-        CONF_PASSWORD: "test_pass",
-        CONF_REGION: "eu",
-        CONF_TOKENPATH: "/test/path",
-        CONF_TEMPERATURE_OFFSET: 0.0,
-    }
+async def test_async_setup_entry_reuses_coordinator_client() -> None:
+    """Test climate setup shares the authenticated client of the coordinator."""
+    mock_hass, mock_entry, _, mock_api_client = _setup_entry_mocks(["device1"])
     mock_async_add_entities = MagicMock()
 
-    # Mock coordinator in hass.data
-    mock_coordinator = MagicMock()
-    mock_hass.data = {DOMAIN: {mock_entry.entry_id: mock_coordinator}}
+    await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
 
-    # Mock API client with authentication failure
-    mock_api_client = AsyncMock()
-    mock_api_client.async_authenticate.return_value = False
+    # No second login is performed by the platform
+    mock_api_client.async_authenticate.assert_not_called()
 
-    with (
-        patch(
-            "custom_components.fglair_heatpump_controller.climate.FGLairApiClient",
-            return_value=mock_api_client,
-        ),
-        patch(
-            "custom_components.fglair_heatpump_controller.climate."
-            "async_get_clientsession",
-            return_value=MagicMock(),
-        ),
-    ):
-        await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
+    entities = mock_async_add_entities.call_args[0][0]
+    assert entities[0]._fglairapi_client is mock_api_client
 
-    # Verify authentication was called
-    mock_api_client.async_authenticate.assert_called_once()
 
-    # Verify no entities were added due to auth failure
-    mock_async_add_entities.assert_not_called()
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_setup_entry_registers_forced_services(
+    _mock_platform: MagicMock,
+) -> None:
+    """Test the set services taking a force flag are registered."""
+    mock_hass, mock_entry, _, _ = _setup_entry_mocks(["device1"])
+
+    await async_setup_entry(mock_hass, mock_entry, MagicMock())
+
+    services = {
+        call.args[0]: call.args[1:]
+        for call in _mock_platform.async_register_entity_service.call_args_list
+    }
+    assert set(services) == {
+        "set_temperature",
+        "set_hvac_mode",
+        "set_fan_mode",
+        "set_swing_mode",
+        "set_swing_horizontal_mode",
+        "set_preset_mode",
+    }
+    schema, method = services["set_hvac_mode"]
+    assert method == "async_set_hvac_mode"
+    assert vol.Schema(schema)({"hvac_mode": "heat"}) == {
+        "hvac_mode": HVACMode.HEAT,
+        "force": False,
+    }
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_setup_entry_no_devices() -> None:
     """Test climate setup entry with no devices."""
-    # Mock Home Assistant objects
-    mock_hass = MagicMock()
-    mock_entry = MagicMock()
-    mock_entry.entry_id = "test_entry_id"
-    mock_entry.data = {
-        CONF_USERNAME: "test_user",
-        CONF_PASSWORD: "test_pass",
-        CONF_REGION: "eu",
-        CONF_TOKENPATH: "/test/path",
-        CONF_TEMPERATURE_OFFSET: 0.0,
-    }
+    mock_hass, mock_entry, _, _ = _setup_entry_mocks([])
     mock_async_add_entities = MagicMock()
 
-    # Mock coordinator in hass.data
-    mock_coordinator = MagicMock()
-    mock_hass.data = {DOMAIN: {mock_entry.entry_id: mock_coordinator}}
+    await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
 
-    # Mock API client with no devices
-    mock_api_client = AsyncMock()
-    mock_api_client.async_authenticate.return_value = True
-    mock_api_client.async_get_devices_dsn.return_value = []
+    # Verify no entities were added
+    mock_async_add_entities.assert_not_called()
 
-    with (
-        patch(
-            "custom_components.fglair_heatpump_controller.climate.FGLairApiClient",
-            return_value=mock_api_client,
-        ),
-        patch(
-            "custom_components.fglair_heatpump_controller.climate."
-            "async_get_clientsession",
-            return_value=MagicMock(),
-        ),
-    ):
-        await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
 
-    # Verify authentication was called
-    mock_api_client.async_authenticate.assert_called_once()
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_setup_entry_follows_inventory() -> None:
+    """Test entities are added and removed as the inventory changes."""
+    mock_hass, mock_entry, mock_coordinator, _ = _setup_entry_mocks(["device1"])
+    mock_async_add_entities = MagicMock()
+
+    await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
+    sync_entities = mock_coordinator.async_add_listener.call_args.args[0]
+    mock_entry.async_on_unload.assert_called_once_with(
+        mock_coordinator.async_add_listener.return_value
+    )
+    (device1,) = mock_async_add_entities.call_args.args[0]
+
+    # A new unit shows up without a reload
+    mock_coordinator.devices_dsn = ["device1", "device2"]
+    mock_coordinator.data["device2"] = DeviceSnapshot(device_name="Device device2")
+    sync_entities()
+    assert mock_async_add_entities.call_count == 2
+    (device2,) = mock_async_add_entities.call_args.args[0]
+    assert device2._dsn == "device2"
+
+    # Nothing changes while the inventory is the same
+    sync_entities()
+    assert mock_async_add_entities.call_count == 2
+
+    # A removed unit drops its entity from the entity registry
+    mock_coordinator.devices_dsn = ["device2"]
+    device1.registry_entry = MagicMock()
+    device1.entity_id = "climate.device1"
+    with patch(
+        "custom_components.fglair_heatpump_controller.climate.er.async_get"
+    ) as mock_entity_registry:
+        sync_entities()
+    mock_entity_registry.return_value.async_remove.assert_called_once_with(
+        "climate.device1"
+    )
+
 
-    # Verify devices were fetched
-    mock_api_client.async_get_devices_dsn.assert_called_once()
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_setup_entry_waits_for_device_name() -> None:
+    """Test a listed device gets its entity once its name is known."""
+    mock_hass, mock_entry, mock_coordinator, _ = _setup_entry_mocks(["device1"])
+    mock_coordinator.data = {}
+    mock_async_add_entities = MagicMock()
+
+    await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
+    mock_async_add_entities.assert_not_called()
 
-    # Verify no entities were added (empty list)
+    # The first refresh, running in the background, fetched the device
+    mock_coordinator.data = {"device1": DeviceSnapshot(device_name="Living room")}
+    mock_coordinator.async_add_listener.call_args.args[0]()
     mock_async_add_entities.assert_called_once()
-    entities = mock_async_add_entities.call_args[0][0]
-    assert len(entities) == 0
 
 
 def test_climate_basic_properties() -> None:
     """Test that climate entity has all required basic properties."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     with patch(
         "pyfujitsugeneral.splitAC.SplitAC.get_device_name"
@@ -3074,7 +3332,7 @@ def test_climate_basic_properties() -> None:
 def test_climate_mode_lists() -> None:
     """Test climate mode lists."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -3103,7 +3361,7 @@ def test_climate_mode_lists() -> None:
 def test_climate_device_info_exists() -> None:
     """Test climate device info exists."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -3123,7 +3381,7 @@ def test_climate_device_info_exists() -> None:
 def test_climate_swing_modes_exists() -> None:
     """Test climate swing modes exists."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -3143,7 +3401,7 @@ def test_climate_swing_modes_exists() -> None:
 def test_climate_async_methods_exist() -> None:
     """Test climate async methods exist."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -3176,10 +3434,8 @@ def test_climate_async_methods_exist() -> None:
 def test_swing_horizontal_mode_property() -> None:
     """Test swing_horizontal_mode property."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.get_swing_horizontal_value.return_value = True
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3192,6 +3448,7 @@ def test_swing_horizontal_mode_property() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_horizontal_direction=1, af_horizontal_swing=1)
 
     swing_horizontal_mode = climate.swing_horizontal_mode
     assert swing_horizontal_mode == "horizontal"
@@ -3200,38 +3457,8 @@ def test_swing_horizontal_mode_property() -> None:
 def test_swing_horizontal_mode_property_none() -> None:
     """Test swing_horizontal_mode property when no horizontal swing."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.get_swing_horizontal_value.return_value = False
-    # Mock that device doesn't have vane_horizontal method
-    mock_device.vane_horizontal = None
-    mock_client.get_device.return_value = mock_device
-
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
-        region="eu",
-        tokenpath=DEFAULT_TOKEN_PATH,
-        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-        hass=MagicMock(),
-        coordinator=mock_coordinator,
-    )
-    climate._fujitsu_device = mock_device
-
-    swing_horizontal_mode = climate.swing_horizontal_mode
-    assert swing_horizontal_mode is None
-
-
-def test_swing_horizontal_mode_property_no_vane_horizontal() -> None:
-    """Test swing_horizontal_mode when device doesn't have vane_horizontal method."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.get_swing_horizontal_value.return_value = False
-    # Create a mock device that doesn't have vane_horizontal attribute
-    del mock_device.vane_horizontal
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3252,11 +3479,8 @@ def test_swing_horizontal_mode_property_no_vane_horizontal() -> None:
 def test_swing_horizontal_mode_property_fixed_position() -> None:
     """Test swing_horizontal_mode when swing is off but device has fixed position."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.get_swing_horizontal_value.return_value = False
-    mock_device.vane_horizontal.return_value = 3  # Fixed position 3
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3269,6 +3493,7 @@ def test_swing_horizontal_mode_property_fixed_position() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_horizontal_direction=3, af_horizontal_swing=0)
 
     swing_horizontal_mode = climate.swing_horizontal_mode
     assert swing_horizontal_mode == "Horizontal_3"
@@ -3277,59 +3502,8 @@ def test_swing_horizontal_mode_property_fixed_position() -> None:
 def test_swing_horizontal_mode_property_not_supported() -> None:
     """Test swing_horizontal_mode when device doesn't support horizontal swing."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = [
-        "vertical"
-    ]  # Only vertical support
-    mock_client.get_device.return_value = mock_device
-
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
-        region="eu",
-        tokenpath=DEFAULT_TOKEN_PATH,
-        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-        hass=MagicMock(),
-        coordinator=mock_coordinator,
-    )
-    climate._fujitsu_device = mock_device
-
-    swing_horizontal_mode = climate.swing_horizontal_mode
-    assert swing_horizontal_mode is None
-
-
-def test_swing_horizontal_mode_property_main_exception() -> None:
-    """Test swing_horizontal_mode with main exception in get_swing_modes_supported."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.side_effect = Exception("Main API Error")
-    mock_client.get_device.return_value = mock_device
-
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
-        region="eu",
-        tokenpath=DEFAULT_TOKEN_PATH,
-        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-        hass=MagicMock(),
-        coordinator=mock_coordinator,
-    )
-    climate._fujitsu_device = mock_device
-
-    swing_horizontal_mode = climate.swing_horizontal_mode
-    assert swing_horizontal_mode is None
-
-
-def test_swing_horizontal_mode_property_vane_horizontal_exception() -> None:
-    """Test swing_horizontal_mode property when vane_horizontal raises exception."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.get_swing_horizontal_value.return_value = False
-    mock_device.vane_horizontal.side_effect = Exception("Vane error")
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3342,6 +3516,7 @@ def test_swing_horizontal_mode_property_vane_horizontal_exception() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_vertical_direction=1)
 
     swing_horizontal_mode = climate.swing_horizontal_mode
     assert swing_horizontal_mode is None
@@ -3351,7 +3526,7 @@ def test_swing_horizontal_mode_property_vane_horizontal_exception() -> None:
 async def test_async_set_swing_mode_invalid_vertical_position() -> None:
     """Test async_set_swing_mode with invalid vertical position."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
     mock_device.get_device_name.return_value = {"value": "Test Device"}
     mock_client.get_device.return_value = mock_device
@@ -3376,7 +3551,7 @@ async def test_async_set_swing_mode_invalid_vertical_position() -> None:
 async def test_async_set_swing_mode_invalid_horizontal_position() -> None:
     """Test async_set_swing_mode with invalid horizontal position."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
     mock_device.get_device_name.return_value = {"value": "Test Device"}
     mock_client.get_device.return_value = mock_device
@@ -3400,10 +3575,8 @@ async def test_async_set_swing_mode_invalid_horizontal_position() -> None:
 def test_swing_horizontal_modes_property_supported() -> None:
     """Test swing_horizontal_modes property when supported."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.get_horizontal_positions.side_effect = Exception("No positions")
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3416,6 +3589,7 @@ def test_swing_horizontal_modes_property_supported() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_horizontal_direction=1)
 
     swing_horizontal_modes = climate.swing_horizontal_modes
     assert swing_horizontal_modes == ["horizontal"]
@@ -3424,10 +3598,8 @@ def test_swing_horizontal_modes_property_supported() -> None:
 def test_swing_horizontal_modes_property_with_positions() -> None:
     """Test swing_horizontal_modes property with specific positions."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.get_horizontal_positions.return_value = [1, 2, 3]
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3440,6 +3612,9 @@ def test_swing_horizontal_modes_property_with_positions() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(
+        af_horizontal_direction=1, af_horizontal_num_dir=3
+    )
 
     swing_horizontal_modes = climate.swing_horizontal_modes
     assert swing_horizontal_modes == [
@@ -3453,32 +3628,8 @@ def test_swing_horizontal_modes_property_with_positions() -> None:
 def test_swing_horizontal_modes_property_not_supported() -> None:
     """Test swing_horizontal_modes property when not supported."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["vertical"]
-    mock_client.get_device.return_value = mock_device
-
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
-        region="eu",
-        tokenpath=DEFAULT_TOKEN_PATH,
-        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-        hass=MagicMock(),
-        coordinator=mock_coordinator,
-    )
-    climate._fujitsu_device = mock_device
-
-    swing_horizontal_modes = climate.swing_horizontal_modes
-    assert swing_horizontal_modes is None
-
-
-def test_swing_horizontal_modes_property_exception() -> None:
-    """Test swing_horizontal_modes property with exception."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.side_effect = Exception("API Error")
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3491,6 +3642,7 @@ def test_swing_horizontal_modes_property_exception() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_vertical_direction=1)
 
     swing_horizontal_modes = climate.swing_horizontal_modes
     assert swing_horizontal_modes is None
@@ -3500,11 +3652,7 @@ def test_swing_horizontal_modes_property_exception() -> None:
 async def test_async_set_swing_horizontal_mode_supported() -> None:
     """Test async_set_swing_horizontal_mode when supported."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.async_set_af_horizontal_swing = AsyncMock()
-    mock_client.get_device.return_value = mock_device
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -3515,21 +3663,19 @@ async def test_async_set_swing_horizontal_mode_supported() -> None:
         hass=MagicMock(),
         coordinator=mock_coordinator,
     )
-    climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_horizontal_direction=1, af_horizontal_swing=0)
 
     await climate.async_set_swing_horizontal_mode("horizontal")
-    mock_device.async_set_af_horizontal_swing.assert_called_once_with(1)
+    mock_client.async_set_device_property.assert_called_once_with(
+        "af_horizontal_swing", 1
+    )
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_swing_horizontal_mode_position() -> None:
     """Test async_set_swing_horizontal_mode with specific position."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
-    mock_device.async_set_vane_horizontal_position = AsyncMock()
-    mock_client.get_device.return_value = mock_device
+    mock_coordinator = _mock_coordinator(mock_client)
 
     climate = FujitsuClimate(
         fglair_api_client=mock_client,
@@ -3540,19 +3686,23 @@ async def test_async_set_swing_horizontal_mode_position() -> None:
         hass=MagicMock(),
         coordinator=mock_coordinator,
     )
-    climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(
+        af_horizontal_direction=1, af_horizontal_num_dir=3
+    )
 
     await climate.async_set_swing_horizontal_mode("Horizontal_2")
-    mock_device.async_set_vane_horizontal_position.assert_called_once_with(2)
+    assert mock_client.async_set_device_property.call_args_list == [
+        call("af_horizontal_swing", 0),
+        call("af_horizontal_direction", 2),
+    ]
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_swing_horizontal_mode_invalid_value() -> None:
     """Test async_set_swing_horizontal_mode with invalid value raises error."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
     mock_device.async_set_af_horizontal_swing = AsyncMock()
     mock_client.get_device.return_value = mock_device
 
@@ -3566,6 +3716,7 @@ async def test_async_set_swing_horizontal_mode_invalid_value() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_horizontal_direction=1)
 
     with pytest.raises(HomeAssistantError, match="Invalid horizontal swing mode: off"):
         await climate.async_set_swing_horizontal_mode("off")
@@ -3575,9 +3726,8 @@ async def test_async_set_swing_horizontal_mode_invalid_value() -> None:
 async def test_async_set_swing_horizontal_mode_not_supported() -> None:
     """Test async_set_swing_horizontal_mode when not supported."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["vertical"]
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3590,6 +3740,7 @@ async def test_async_set_swing_horizontal_mode_not_supported() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_vertical_direction=1)
 
     await climate.async_set_swing_horizontal_mode("horizontal")
 
@@ -3598,9 +3749,8 @@ async def test_async_set_swing_horizontal_mode_not_supported() -> None:
 async def test_async_set_swing_horizontal_mode_exception() -> None:
     """Test async_set_swing_horizontal_mode with exception."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
     mock_device.async_set_af_horizontal_swing = AsyncMock(
         side_effect=Exception("API Error")
     )
@@ -3616,6 +3766,7 @@ async def test_async_set_swing_horizontal_mode_exception() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_horizontal_direction=1, af_horizontal_swing=0)
 
     with pytest.raises(HomeAssistantError, match="Failed to set horizontal swing mode"):
         await climate.async_set_swing_horizontal_mode("horizontal")
@@ -3624,9 +3775,8 @@ async def test_async_set_swing_horizontal_mode_exception() -> None:
 def test_supported_features_with_horizontal_swing() -> None:
     """Test supported_features includes horizontal swing when supported."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3639,6 +3789,7 @@ def test_supported_features_with_horizontal_swing() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_horizontal_direction=1)
 
     features = climate.supported_features
     assert ClimateEntityFeature.SWING_HORIZONTAL_MODE in features
@@ -3647,9 +3798,8 @@ def test_supported_features_with_horizontal_swing() -> None:
 def test_supported_features_without_horizontal_swing() -> None:
     """Test supported_features excludes horizontal swing when not supported."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["vertical"]
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3662,6 +3812,7 @@ def test_supported_features_without_horizontal_swing() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_vertical_direction=1)
 
     features = climate.supported_features
     assert ClimateEntityFeature.SWING_HORIZONTAL_MODE not in features
@@ -3671,7 +3822,7 @@ def test_supported_features_without_horizontal_swing() -> None:
 async def test_async_set_swing_mode_empty_vertical_position() -> None:
     """Test async_set_swing_mode with empty vertical position."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
     mock_client.get_device.return_value = mock_device
 
@@ -3694,7 +3845,7 @@ async def test_async_set_swing_mode_empty_vertical_position() -> None:
 async def test_async_set_swing_mode_empty_horizontal_position() -> None:
     """Test async_set_swing_mode with empty horizontal position."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
     mock_client.get_device.return_value = mock_device
 
@@ -3713,38 +3864,12 @@ async def test_async_set_swing_mode_empty_horizontal_position() -> None:
         await climate.async_set_swing_mode("Horizontal_")
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_async_set_swing_horizontal_mode_string_modes_list() -> None:
-    """Test async_set_swing_horizontal_mode when modes_list is a string."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = "horizontal"
-    mock_device.async_set_af_horizontal_swing = AsyncMock()
-    mock_client.get_device.return_value = mock_device
-
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
-        region="eu",
-        tokenpath=DEFAULT_TOKEN_PATH,
-        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-        hass=MagicMock(),
-        coordinator=mock_coordinator,
-    )
-    climate._fujitsu_device = mock_device
-
-    await climate.async_set_swing_horizontal_mode("horizontal")
-    mock_device.async_set_af_horizontal_swing.assert_called_once_with(1)
-
-
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_set_swing_horizontal_mode_invalid_position() -> None:
     """Test async_set_swing_horizontal_mode with invalid position string."""
     mock_client = MagicMock()
-    mock_coordinator = MagicMock()
+    mock_coordinator = _mock_coordinator(mock_client)
     mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = ["horizontal"]
     mock_client.get_device.return_value = mock_device
 
     climate = FujitsuClimate(
@@ -3757,80 +3882,7 @@ async def test_async_set_swing_horizontal_mode_invalid_position() -> None:
         coordinator=mock_coordinator,
     )
     climate._fujitsu_device = mock_device
+    climate._snapshot = DeviceSnapshot(af_horizontal_direction=1)
 
     with pytest.raises(HomeAssistantError, match="Invalid horizontal position: abc"):
         await climate.async_set_swing_horizontal_mode("Horizontal_abc")
-
-
-def test_supported_features_with_string_modes_list() -> None:
-    """Test supported_features when modes_list is a string."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = "horizontal"
-    mock_client.get_device.return_value = mock_device
-
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
-        region="eu",
-        tokenpath=DEFAULT_TOKEN_PATH,
-        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-        hass=MagicMock(),
-        coordinator=mock_coordinator,
-    )
-    climate._fujitsu_device = mock_device
-
-    features = climate.supported_features
-    assert ClimateEntityFeature.SWING_HORIZONTAL_MODE in features
-
-
-def test_swing_horizontal_modes_with_string_modes_list() -> None:
-    """Test swing_horizontal_modes when modes_list is a string."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.return_value = "horizontal"
-    mock_device.get_horizontal_positions.return_value = [1, 2, 3]
-    mock_client.get_device.return_value = mock_device
-
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
-        region="eu",
-        tokenpath=DEFAULT_TOKEN_PATH,
-        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-        hass=MagicMock(),
-        coordinator=mock_coordinator,
-    )
-    climate._fujitsu_device = mock_device
-
-    swing_horizontal_modes = climate.swing_horizontal_modes
-    assert swing_horizontal_modes is not None
-    assert "horizontal" in swing_horizontal_modes
-    assert "Horizontal_1" in swing_horizontal_modes
-    assert "Horizontal_2" in swing_horizontal_modes
-    assert "Horizontal_3" in swing_horizontal_modes
-
-
-def test_supported_features_horizontal_swing_exception() -> None:
-    """Test supported_features handles exception when checking horizontal swing."""
-    mock_client = MagicMock()
-    mock_coordinator = MagicMock()
-    mock_device = MagicMock()
-    mock_device.get_swing_modes_supported.side_effect = Exception("API Error")
-    mock_client.get_device.return_value = mock_device
-
-    climate = FujitsuClimate(
-        fglair_api_client=mock_client,
-        dsn="test-dsn",
-        region="eu",
-        tokenpath=DEFAULT_TOKEN_PATH,
-        temperature_offset=DEFAULT_TEMPERATURE_OFFSET,
-        hass=MagicMock(),
-        coordinator=mock_coordinator,
-    )
-    climate._fujitsu_device = mock_device
-
-    features = climate.supported_features
-    assert ClimateEntityFeature.SWING_HORIZONTAL_MODE not in features
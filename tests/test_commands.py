@@ -0,0 +1,116 @@
+"""Test the per-device command queue."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.fglair_heatpump_controller.commands import DeviceCommandQueue
+
+MERGE_WINDOW = timedelta(milliseconds=10)
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_rapid_writes_of_a_property_are_merged() -> None:
+    """Test only the last write within the window is sent."""
+    queue = DeviceCommandQueue(MERGE_WINDOW)
+    writes = [AsyncMock(return_value=value) for value in (20, 21, 22)]
+
+    results = await asyncio.gather(
+        *(queue.async_write("adjust_temperature", write) for write in writes)
+    )
+
+    writes[0].assert_not_called()
+    writes[1].assert_not_called()
+    writes[2].assert_called_once()
+    # Every caller is released by the merged write
+    assert results == [22, 22, 22]
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_writes_of_different_properties_are_sent_in_order() -> None:
+    """Test writes of different properties are all sent, one at a time."""
+    queue = DeviceCommandQueue(MERGE_WINDOW)
+    sent: list[str] = []
+    in_flight = 0
+
+    def write(prop: str) -> AsyncMock:
+        async def send() -> None:
+            nonlocal in_flight
+            in_flight += 1
+            assert in_flight == 1
+            await asyncio.sleep(0)
+            sent.append(prop)
+            in_flight -= 1
+
+        return AsyncMock(side_effect=send)
+
+    await asyncio.gather(
+        queue.async_write("operation_mode", write("operation_mode")),
+        queue.async_write("fan_speed", write("fan_speed")),
+    )
+
+    assert sent == ["operation_mode", "fan_speed"]
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_write_after_flush_is_sent_again() -> None:
+    """Test a write requested once the previous one landed is not dropped."""
+    queue = DeviceCommandQueue(MERGE_WINDOW)
+    first = AsyncMock(return_value=1)
+    second = AsyncMock(return_value=2)
+
+    assert await queue.async_write("fan_speed", first) == 1
+    assert await queue.async_write("fan_speed", second) == 2
+
+    first.assert_called_once()
+    second.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_failed_write_is_raised_to_every_caller() -> None:
+    """Test a failure of the merged write reaches every waiting caller."""
+    queue = DeviceCommandQueue(MERGE_WINDOW)
+    failing = AsyncMock(side_effect=RuntimeError("cloud down"))
+
+    results = await asyncio.gather(
+        queue.async_write("fan_speed", AsyncMock()),
+        queue.async_write("fan_speed", failing),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    failing.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_cancelled_caller_does_not_cancel_the_write() -> None:
+    """Test the merged write still lands when one caller gives up."""
+    queue = DeviceCommandQueue(MERGE_WINDOW)
+    write = AsyncMock(return_value="done")
+
+    abandoned = asyncio.create_task(queue.async_write("fan_speed", AsyncMock()))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(queue.async_write("fan_speed", write))
+    await asyncio.sleep(0)
+    abandoned.cancel()
+
+    assert await waiting == "done"
+    write.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_shutdown_drops_writes_not_sent_yet() -> None:
+    """Test a shut down queue sends nothing and releases its callers."""
+    queue = DeviceCommandQueue(MERGE_WINDOW)
+    write = AsyncMock()
+
+    waiting = asyncio.create_task(queue.async_write("fan_speed", write))
+    await asyncio.sleep(0)
+    queue.async_shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    await asyncio.sleep(MERGE_WINDOW.total_seconds() * 2)
+    write.assert_not_called()
@@ -1,19 +1,34 @@
 """Test config flow."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
+from pyfujitsugeneral.exceptions import FGLairGeneralException
 import pytest
+import voluptuous as vol
 
 from custom_components.fglair_heatpump_controller.config_flow import (
     DATA_SCHEMA,
+    OPTIONS_SCHEMA,
     FGLairIntegrationFlowHandler,
+    FGLairOptionsFlowHandler,
 )
 from custom_components.fglair_heatpump_controller.const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_OPTIMISTIC_GRACE_PERIOD,
+    CONF_PUBLISH_DEADBAND,
+    CONF_RELAX_UNCOMMANDED_REFRESH,
     CONF_TEMPERATURE_OFFSET,
     CONF_TOKENPATH,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_OPTIMISTIC_GRACE_PERIOD,
+    DEFAULT_PUBLISH_DEADBAND,
+    DEFAULT_RELAX_UNCOMMANDED_REFRESH,
     DEFAULT_TEMPERATURE_OFFSET,
     DEFAULT_TOKEN_PATH,
 )
@@ -62,7 +77,6 @@ async def test_async_step_user_with_input() -> None:
         CONF_USERNAME: "test_user",
         CONF_PASSWORD: "test_pass",
         CONF_REGION: "eu",
-        CONF_TOKENPATH: "/test/path",
         CONF_TEMPERATURE_OFFSET: 1.0,
     }
 
@@ -75,7 +89,7 @@ async def test_async_step_user_with_input() -> None:
             username="test_user",
             password="test_pass",
             region="eu",
-            tokenpath="/test/path",
+            tokenpath=DEFAULT_TOKEN_PATH,
             temperature_offset=1.0,
         )
 
@@ -91,7 +105,7 @@ async def test_create_client_success() -> None:
 
     with (
         patch(
-            "custom_components.fglair_heatpump_controller.config_flow.FGLairApiClient",
+            "custom_components.fglair_heatpump_controller.config_flow.FglairApiClient",
             return_value=mock_client,
         ),
         patch(
@@ -132,7 +146,7 @@ async def test_create_client_timeout_error() -> None:
 
     with (
         patch(
-            "custom_components.fglair_heatpump_controller.config_flow.FGLairApiClient",
+            "custom_components.fglair_heatpump_controller.config_flow.FglairApiClient",
             return_value=mock_client,
         ),
         patch(
@@ -165,7 +179,7 @@ async def test_create_client_connection_error() -> None:
     # ConnectionError is now handled consistently with other connection errors
     with (
         patch(
-            "custom_components.fglair_heatpump_controller.config_flow.FGLairApiClient",
+            "custom_components.fglair_heatpump_controller.config_flow.FglairApiClient",
             return_value=mock_client,
         ),
         patch(
@@ -185,6 +199,70 @@ async def test_create_client_connection_error() -> None:
         assert result["reason"] == "cannot_connect"
 
 
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_create_client_refused_login() -> None:
+    """Test _create_client aborts when the cloud refuses the login."""
+    handler = FGLairIntegrationFlowHandler()
+    handler.hass = MagicMock(spec=HomeAssistant)
+
+    mock_client = AsyncMock()
+    mock_client.async_authenticate.side_effect = FGLairGeneralException("refused")
+
+    with (
+        patch(
+            "custom_components.fglair_heatpump_controller.config_flow.FglairApiClient",
+            return_value=mock_client,
+        ),
+        patch(
+            "custom_components.fglair_heatpump_controller.config_flow."
+            "async_get_clientsession",
+            return_value=MagicMock(),
+        ),
+    ):
+        result = await handler._create_client(
+            username="test_user",
+            password="test_pass",
+            region="eu",
+            tokenpath="/test/path",
+            temperature_offset=1.0,
+        )
+        assert result["type"] == FlowResultType.ABORT
+        assert result["reason"] == "invalid_auth"
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_create_client_keeps_token_out_of_file(tmp_path: Path) -> None:
+    """Test the login of the config flow never writes the token file."""
+    handler = FGLairIntegrationFlowHandler()
+    handler.hass = MagicMock(spec=HomeAssistant)
+    tokenpath = tmp_path / "token.txt"
+
+    with (
+        patch(
+            "custom_components.fglair_heatpump_controller.config_flow."
+            "async_get_clientsession",
+            return_value=MagicMock(),
+        ),
+        patch(
+            "pyfujitsugeneral.client.FGLairApiClient.api_wrapper",
+            AsyncMock(return_value={"access_token": "test_token"}),
+        ),
+        patch.object(
+            handler, "_create_entry", return_value={"type": "create_entry"}
+        ) as mock_create_entry,
+    ):
+        await handler._create_client(
+            username="test_user",
+            password="test_pass",
+            region="eu",
+            tokenpath=str(tokenpath),
+            temperature_offset=1.0,
+        )
+
+    assert mock_create_entry.call_args.args[-1] == "test_token"
+    assert not tokenpath.exists()
+
+
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_client_blank_password() -> None:
     """Test _create_client with blank password."""
@@ -275,7 +353,7 @@ def test_data_schema_structure() -> None:
     assert CONF_USERNAME in DATA_SCHEMA.schema
     assert CONF_PASSWORD in DATA_SCHEMA.schema
     assert CONF_REGION in DATA_SCHEMA.schema
-    assert CONF_TOKENPATH in DATA_SCHEMA.schema
+    assert CONF_TOKENPATH not in DATA_SCHEMA.schema
     assert CONF_TEMPERATURE_OFFSET in DATA_SCHEMA.schema
 
 
@@ -285,7 +363,7 @@ def test_data_schema_defaults() -> None:
     assert CONF_USERNAME in DATA_SCHEMA.schema
     assert CONF_PASSWORD in DATA_SCHEMA.schema
     assert CONF_REGION in DATA_SCHEMA.schema
-    assert CONF_TOKENPATH in DATA_SCHEMA.schema
+    assert CONF_TOKENPATH not in DATA_SCHEMA.schema
     assert CONF_TEMPERATURE_OFFSET in DATA_SCHEMA.schema
 
     # Test that we can create a schema with defaults
@@ -293,7 +371,6 @@ def test_data_schema_defaults() -> None:
         CONF_USERNAME: "",
         CONF_PASSWORD: "",
         CONF_REGION: "eu",
-        CONF_TOKENPATH: DEFAULT_TOKEN_PATH,
         CONF_TEMPERATURE_OFFSET: DEFAULT_TEMPERATURE_OFFSET,
     }
 
@@ -302,7 +379,6 @@ def test_data_schema_defaults() -> None:
     assert validated_data[CONF_USERNAME] == ""
     assert validated_data[CONF_PASSWORD] == ""
     assert validated_data[CONF_REGION] == "eu"
-    assert validated_data[CONF_TOKENPATH] == DEFAULT_TOKEN_PATH
     assert validated_data[CONF_TEMPERATURE_OFFSET] == DEFAULT_TEMPERATURE_OFFSET
 
 
@@ -330,7 +406,7 @@ async def test_create_client_with_different_regions() -> None:
         with (
             patch(
                 "custom_components.fglair_heatpump_controller.config_flow."
-                "FGLairApiClient",
+                "FglairApiClient",
                 return_value=mock_client,
             ),
             patch(
@@ -375,7 +451,7 @@ async def test_create_client_with_different_temperature_offsets() -> None:
         with (
             patch(
                 "custom_components.fglair_heatpump_controller.config_flow."
-                "FGLairApiClient",
+                "FglairApiClient",
                 return_value=mock_client,
             ),
             patch(
@@ -423,7 +499,7 @@ async def test_create_client_with_special_characters() -> None:
 
     with (
         patch(
-            "custom_components.fglair_heatpump_controller.config_flow.FGLairApiClient",
+            "custom_components.fglair_heatpump_controller.config_flow.FglairApiClient",
             return_value=mock_client,
         ),
         patch(
@@ -451,3 +527,48 @@ async def test_create_client_with_special_characters() -> None:
             1.0,
             "special_token",
         )
+
+
+def test_options_flow_handler() -> None:
+    """Test the config flow provides an options flow."""
+    options_flow = FGLairIntegrationFlowHandler.async_get_options_flow(MagicMock())
+    assert isinstance(options_flow, FGLairOptionsFlowHandler)
+
+
+def test_options_schema_defaults() -> None:
+    """Test OPTIONS_SCHEMA falls back to the integration defaults."""
+    assert OPTIONS_SCHEMA({}) == {
+        CONF_MAX_CONCURRENT_REQUESTS: DEFAULT_MAX_CONCURRENT_REQUESTS,
+        CONF_OPTIMISTIC_GRACE_PERIOD: DEFAULT_OPTIMISTIC_GRACE_PERIOD,
+        CONF_PUBLISH_DEADBAND: DEFAULT_PUBLISH_DEADBAND,
+        CONF_MIN_PUBLISH_INTERVAL: DEFAULT_MIN_PUBLISH_INTERVAL,
+        CONF_RELAX_UNCOMMANDED_REFRESH: DEFAULT_RELAX_UNCOMMANDED_REFRESH,
+    }
+    with pytest.raises(vol.Invalid):
+        OPTIONS_SCHEMA({CONF_MAX_CONCURRENT_REQUESTS: 0})
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_options_flow_step_init() -> None:
+    """Test the options form is shown and the submitted options stored."""
+    handler = FGLairOptionsFlowHandler()
+    handler.hass = MagicMock(spec=HomeAssistant)
+    mock_entry = MagicMock()
+    mock_entry.options = {CONF_PUBLISH_DEADBAND: 0.2}
+
+    with patch.object(
+        FGLairOptionsFlowHandler,
+        "config_entry",
+        new_callable=PropertyMock,
+        return_value=mock_entry,
+    ):
+        result = await handler.async_step_init(user_input=None)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    options = OPTIONS_SCHEMA({CONF_MIN_PUBLISH_INTERVAL: 60})
+    result = await handler.async_step_init(user_input=options)
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"] == options
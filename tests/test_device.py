@@ -0,0 +1,149 @@
+"""Test the FGLair devices and their snapshots."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pyfujitsugeneral.splitAC import get_prop_from_json
+import pytest
+
+from custom_components.fglair_heatpump_controller.const import DEFAULT_TOKEN_PATH
+from custom_components.fglair_heatpump_controller.device import (
+    DeviceSnapshot,
+    FglairSplitAC,
+)
+
+PAYLOAD = [
+    {
+        "property": {
+            "name": "operation_mode",
+            "key": 1,
+            "value": 6,
+            "base_type": "integer",
+            "data_updated_at": "2025-01-01T00:00:00Z",
+        }
+    },
+    {"property": {"name": "economy_mode", "key": 2, "value": 0}},
+    {"property": {"name": "op_status", "key": 3, "value": 16777216}},
+    {
+        "property": {
+            "name": "refresh",
+            "key": 4,
+            "value": 0,
+            "data_updated_at": "2025-01-01T00:00:00Z",
+        }
+    },
+    {"property": {"name": "not_used", "key": 5, "value": 1}},
+]
+
+
+def test_snapshot_parses_used_values() -> None:
+    """Test only the values of the used properties are kept."""
+    snapshot = DeviceSnapshot.from_properties(PAYLOAD, current_temperature=21.0)
+
+    assert snapshot.current_temperature == 21.0
+    assert snapshot.operation_mode == 6
+    assert snapshot.economy_mode == 0
+    assert snapshot.op_status == 16777216
+    assert snapshot.refresh_updated_at == "2025-01-01T00:00:00Z"
+    # Properties the device does not report are None
+    assert snapshot.powerful_mode is None
+    assert not hasattr(snapshot, "__dict__")
+
+
+def test_snapshot_fingerprint() -> None:
+    """Test the fingerprint follows the values of the snapshot."""
+    snapshot = DeviceSnapshot.from_properties(PAYLOAD)
+
+    assert snapshot.fingerprint == DeviceSnapshot.from_properties(PAYLOAD).fingerprint
+    assert (
+        snapshot.with_values(refresh_updated_at="2025-01-02T00:00:00Z").fingerprint
+        == snapshot.fingerprint
+    )
+    changed = snapshot.with_values(economy_mode=1)
+    assert changed.economy_mode == 1
+    assert changed.fingerprint != snapshot.fingerprint
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_device_drops_payload_once_parsed() -> None:
+    """Test the device keeps the parsed values but not the payload."""
+    client = MagicMock()
+    client.async_get_device_properties = AsyncMock(return_value=PAYLOAD)
+    device = FglairSplitAC("dsn1", client, DEFAULT_TOKEN_PATH, 0.0)
+
+    assert await device.async_update_properties() is PAYLOAD
+
+    assert device.get_properties() is None
+    assert device.get_operation_mode() == {"value": 6, "key": 1}
+    assert device.get_op_status_desc() == "Defrost"
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_device_compact_properties() -> None:
+    """Test the used properties are rebuilt for another device to parse."""
+    client = MagicMock()
+    client.async_get_device_properties = AsyncMock(return_value=PAYLOAD)
+    device = FglairSplitAC("dsn1", client, DEFAULT_TOKEN_PATH, 0.0)
+    await device.async_update_properties()
+
+    compact = device.compact_properties()
+    restored = FglairSplitAC("dsn1", client, DEFAULT_TOKEN_PATH, 0.0)
+    await restored.async_parse_properties(compact)
+
+    assert {item["property"]["name"] for item in compact} == {
+        "operation_mode",
+        "economy_mode",
+        "op_status",
+        "refresh",
+    }
+    assert restored.get_economy_mode() == {"value": 0, "key": 2}
+    assert restored.get_op_status_desc() == "Defrost"
+    assert restored.get_refresh() == device.get_refresh()
+    assert DeviceSnapshot.from_properties(compact) == DeviceSnapshot.from_properties(
+        PAYLOAD
+    )
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_device_temperatures_read_from_payload() -> None:
+    """Test both temperatures come from the payload without history calls."""
+    client = MagicMock()
+    client.async_get_device_properties = AsyncMock(
+        return_value=[
+            {"property": {"name": "display_temperature", "key": 6, "value": 7150}},
+            {"property": {"name": "adjust_temperature", "key": 7, "value": 225}},
+        ]
+    )
+    client.async_get_device_property = AsyncMock()
+    device = FglairSplitAC("dsn1", client, DEFAULT_TOKEN_PATH, 1.0)
+    await device.async_update_properties()
+
+    assert device.display_temperature_degree() == 20.5
+    assert device.adjust_temperature_degree() == 22.5
+
+    # Values the device does not report at the moment are not looked up
+    await device.async_parse_properties(
+        [
+            {"property": {"name": "display_temperature", "key": 6, "value": 65535}},
+            {"property": {"name": "adjust_temperature", "key": 7, "value": 65535}},
+        ]
+    )
+    assert device.display_temperature_degree() is None
+    assert device.adjust_temperature_degree() is None
+    client.async_get_device_property.assert_not_called()
+    client.async_get_device_properties.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_device_parses_each_property_from_the_index() -> None:
+    """Test the library setters are not handed the whole payload."""
+    device = FglairSplitAC("dsn1", MagicMock(), DEFAULT_TOKEN_PATH, 0.0)
+    with patch(
+        "pyfujitsugeneral.splitAC.get_prop_from_json", wraps=get_prop_from_json
+    ) as mock_get_prop:
+        await device.async_parse_properties(PAYLOAD)
+
+    assert max(len(call.args[1]) for call in mock_get_prop.call_args_list) == 1
+    assert device.get_operation_mode() == {"value": 6, "key": 1}
+    assert device.get_economy_mode() == {"value": 0, "key": 2}
+    assert device.get_powerful_mode() == {}
+    assert device.get_op_status_desc() == "Defrost"
@@ -1,12 +1,16 @@
 """Test integration setup."""
 
+import asyncio
+from datetime import UTC, datetime, timedelta
 import inspect
 import json
+import logging
 import os
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_TOKEN, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 import pytest
@@ -14,22 +18,55 @@ import pytest
 from custom_components.fglair_heatpump_controller import (
     FglairDataUpdateCoordinator,
     UpdateFailed,
+    _async_refresh_devices,
+    async_remove_entry,
     async_setup_entry,
     async_unload_entry,
 )
+from custom_components.fglair_heatpump_controller.breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
 from custom_components.fglair_heatpump_controller.climate import FujitsuClimate
 from custom_components.fglair_heatpump_controller.config_flow import (
     FGLairIntegrationFlowHandler,
 )
 from custom_components.fglair_heatpump_controller.const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_OPTIMISTIC_GRACE_PERIOD,
+    CONF_PUBLISH_DEADBAND,
+    CONF_RELAX_UNCOMMANDED_REFRESH,
     CONF_TOKENPATH,
+    DATA_CAPABILITIES,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_PUBLISH_DEADBAND,
     DEFAULT_TEMPERATURE_OFFSET,
     DEFAULT_TOKEN_PATH,
     DOMAIN,
+    FAST_SCAN_INTERVAL,
+    IDLE_SCAN_INTERVAL,
+    IDLE_THRESHOLD,
+    INTERACTION_DURATION,
+    INVENTORY_REFRESH_INTERVAL,
     PLATFORMS,
+    REFRESH_MINUTES_INTERVAL,
     SCAN_INTERVAL,
+    SERVICE_REFRESH_DEVICES,
     VERSION,
 )
+from custom_components.fglair_heatpump_controller.device import (
+    DeviceSnapshot,
+    FglairSplitAC,
+)
+
+
+def _mock_client() -> AsyncMock:
+    """Return an API client mock whose circuit breaker is closed."""
+    client = AsyncMock()
+    client.breaker = CircuitBreaker()
+    return client
 
 
 def test_setup_entry_function() -> None:
@@ -360,26 +397,31 @@ async def test_async_setup_entry_success() -> None:
         CONF_PASSWORD: "test_pass",
         CONF_REGION: "eu",
         CONF_TOKENPATH: "/test/path",
+        CONF_TOKEN: "stored_token",
     }
+    mock_entry.options = {}
 
     mock_coordinator = AsyncMock(spec=FglairDataUpdateCoordinator)
     mock_coordinator.async_config_entry_first_refresh.return_value = None
+    mock_coordinator.async_restore.return_value = False
 
     mock_api_client = AsyncMock()
+    mock_api_client.async_renew_token_before_expiry = MagicMock()
 
     with (
         patch(
-            "custom_components.fglair_heatpump_controller.FGLairApiClient",
+            "custom_components.fglair_heatpump_controller.FglairApiClient",
             return_value=mock_api_client,
-        ),
+        ) as mock_client_class,
         patch(
             "custom_components.fglair_heatpump_controller.async_get_clientsession",
             return_value=MagicMock(),
         ),
+        patch("custom_components.fglair_heatpump_controller.Store") as mock_store,
         patch(
             "custom_components.fglair_heatpump_controller.FglairDataUpdateCoordinator",
             return_value=mock_coordinator,
-        ),
+        ) as mock_class_coordinator,
         patch(
             "homeassistant.helpers.frame.report_usage",
             MagicMock(),
@@ -387,6 +429,8 @@ async def test_async_setup_entry_success() -> None:
     ):
         # Mock the config_entries attribute
         mock_hass.config_entries = AsyncMock()
+        mock_hass.services = MagicMock()
+        mock_store.return_value.async_load = AsyncMock(return_value=None)
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock(
             return_value=None
         )
@@ -394,12 +438,146 @@ async def test_async_setup_entry_success() -> None:
         result = await async_setup_entry(mock_hass, mock_entry)
 
         assert result is True
-        mock_coordinator.async_config_entry_first_refresh.assert_called_once()
+        # The first refresh does not delay the startup
+        mock_coordinator.async_config_entry_first_refresh.assert_not_called()
+        mock_coordinator.async_refresh.assert_called_once()
+        # The client is built once and seeded with the token of the entry
+        mock_client_class.assert_called_once()
+        assert mock_client_class.call_args.kwargs["access_token"] == "stored_token"
+        mock_api_client.async_authenticate.assert_not_called()
+        # The refresh and the token renewal are tasks owned by the config entry
+        assert mock_entry.async_create_background_task.call_count == 2
+        mock_api_client.async_renew_token_before_expiry.assert_called_once()
+        # The token is persisted in a store of its own for every entry
+        store_keys = [store_call.args[2] for store_call in mock_store.call_args_list]
+        assert any(key.endswith("test_entry_id.token") for key in store_keys)
+        assert mock_client_class.call_args.kwargs["store"] is mock_store.return_value
+        # So is the last known state of the devices
+        assert any(key.endswith("test_entry_id.snapshots") for key in store_keys)
+        mock_coordinator.async_restore.assert_called_once()
+        mock_api_client.async_load_token.assert_called_once()
+        # The inventory refresh service is registered once for the domain
+        mock_hass.services.async_register.assert_not_called()
+        # Capability profiles are shared by every entry and persisted
+        coordinator_kwargs = mock_class_coordinator.call_args.kwargs
+        # Its background tasks are owned by the config entry
+        assert coordinator_kwargs["config_entry"] is mock_entry
+        # Room temperature publishing defaults apply
+        assert coordinator_kwargs["publish_deadband"] == DEFAULT_PUBLISH_DEADBAND
+        assert coordinator_kwargs["min_publish_interval"] == timedelta(
+            seconds=DEFAULT_MIN_PUBLISH_INTERVAL
+        )
+        capabilities = mock_class_coordinator.call_args.kwargs["capabilities"]
+        assert capabilities is mock_hass.data[DATA_CAPABILITIES]
+        assert any(
+            store_call.args[2].endswith(".capabilities")
+            for store_call in mock_store.call_args_list
+        )
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_setup_entry_restored_state() -> None:
+    """Test setup does not wait for the cloud when a state was restored."""
+    mock_hass = MagicMock(spec=HomeAssistant)
+    mock_hass.data = {}
+    mock_entry = MagicMock(spec=ConfigEntry)
+    mock_entry.entry_id = "test_entry_id"
+    mock_entry.data = {
+        CONF_USERNAME: "test_user",
+        CONF_PASSWORD: "test_pass",
+        CONF_REGION: "eu",
+        CONF_TOKENPATH: "/test/path",
+    }
+    mock_entry.options = {}
+
+    mock_coordinator = AsyncMock(spec=FglairDataUpdateCoordinator)
+    mock_coordinator.async_restore.return_value = True
+    mock_coordinator.async_refresh = MagicMock()
+
+    with (
+        patch(
+            "custom_components.fglair_heatpump_controller.FglairApiClient",
+            return_value=AsyncMock(),
+        ),
+        patch(
+            "custom_components.fglair_heatpump_controller.async_get_clientsession",
+            return_value=MagicMock(),
+        ),
+        patch("custom_components.fglair_heatpump_controller.Store") as mock_store,
+        patch(
+            "custom_components.fglair_heatpump_controller.FglairDataUpdateCoordinator",
+            return_value=mock_coordinator,
+        ),
+    ):
+        mock_hass.config_entries = AsyncMock()
+        mock_hass.services = MagicMock()
+        mock_store.return_value.async_load = AsyncMock(return_value=None)
+
+        assert await async_setup_entry(mock_hass, mock_entry) is True
+
+    mock_coordinator.async_config_entry_first_refresh.assert_not_called()
+    # The live refresh runs in the background, next to the token renewal
+    mock_coordinator.async_refresh.assert_called_once()
+    assert mock_entry.async_create_background_task.call_count == 2
+    mock_hass.config_entries.async_forward_entry_setups.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_setup_entry_options() -> None:
+    """Test the tuning options of the entry reach the coordinator."""
+    mock_hass = MagicMock(spec=HomeAssistant)
+    mock_hass.data = {}
+    mock_entry = MagicMock(spec=ConfigEntry)
+    mock_entry.entry_id = "test_entry_id"
+    mock_entry.data = {
+        CONF_USERNAME: "test_user",
+        CONF_PASSWORD: "test_pass",
+        CONF_REGION: "eu",
+        CONF_TOKENPATH: "/test/path",
+    }
+    mock_entry.options = {
+        CONF_MAX_CONCURRENT_REQUESTS: 2,
+        CONF_OPTIMISTIC_GRACE_PERIOD: 45,
+        CONF_PUBLISH_DEADBAND: 0.2,
+        CONF_MIN_PUBLISH_INTERVAL: 60,
+        CONF_RELAX_UNCOMMANDED_REFRESH: True,
+    }
+
+    mock_coordinator = AsyncMock(spec=FglairDataUpdateCoordinator)
+    mock_coordinator.async_refresh = MagicMock()
+
+    with (
+        patch(
+            "custom_components.fglair_heatpump_controller.FglairApiClient",
+            return_value=AsyncMock(),
+        ),
+        patch(
+            "custom_components.fglair_heatpump_controller.async_get_clientsession",
+            return_value=MagicMock(),
+        ),
+        patch("custom_components.fglair_heatpump_controller.Store") as mock_store,
+        patch(
+            "custom_components.fglair_heatpump_controller.FglairDataUpdateCoordinator",
+            return_value=mock_coordinator,
+        ) as mock_class_coordinator,
+    ):
+        mock_hass.config_entries = AsyncMock()
+        mock_hass.services = MagicMock()
+        mock_store.return_value.async_load = AsyncMock(return_value=None)
+
+        assert await async_setup_entry(mock_hass, mock_entry) is True
+
+    coordinator_kwargs = mock_class_coordinator.call_args.kwargs
+    assert coordinator_kwargs["max_concurrent_requests"] == 2
+    assert coordinator_kwargs["optimistic_grace_period"] == timedelta(seconds=45)
+    assert coordinator_kwargs["publish_deadband"] == 0.2
+    assert coordinator_kwargs["min_publish_interval"] == timedelta(seconds=60)
+    assert coordinator_kwargs["relax_uncommanded_refresh"] is True
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_setup_entry_exception() -> None:
-    """Test async_setup_entry with exception."""
+    """Test a failing cloud does not fail or stall the setup."""
     mock_hass = MagicMock(spec=HomeAssistant)
     mock_hass.data = {}
     mock_entry = MagicMock(spec=ConfigEntry)
@@ -410,38 +588,46 @@ async def test_async_setup_entry_exception() -> None:
         CONF_REGION: "eu",
         CONF_TOKENPATH: "/test/path",
     }
+    mock_entry.options = {}
 
     mock_api_client = AsyncMock()
-    mock_api_client.async_get_devices_dsn.side_effect = Exception("API Error")
+    mock_api_client.async_get_devices.side_effect = Exception("API Error")
+    mock_api_client.async_renew_token_before_expiry = MagicMock()
 
     with (
         patch(
-            "custom_components.fglair_heatpump_controller.FGLairApiClient",
+            "custom_components.fglair_heatpump_controller.FglairApiClient",
             return_value=mock_api_client,
         ),
         patch(
             "custom_components.fglair_heatpump_controller.async_get_clientsession",
             return_value=MagicMock(),
         ),
+        patch("custom_components.fglair_heatpump_controller.Store") as mock_store,
         patch(
             "homeassistant.helpers.frame.report_usage",
             MagicMock(),
         ),
-        patch(
-            "homeassistant.helpers.update_coordinator.DataUpdateCoordinator."
-            "async_config_entry_first_refresh",
-            AsyncMock(),
-        ),
     ):
         # Mock the config_entries attribute
         mock_hass.config_entries = AsyncMock()
+        mock_hass.services = MagicMock()
+        mock_store.return_value.async_load = AsyncMock(return_value=None)
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock(
             return_value=None
         )
 
         result = await async_setup_entry(mock_hass, mock_entry)
 
-        assert result is True  # The function doesn't handle exceptions, it returns True
+        assert result is True
+        mock_hass.config_entries.async_forward_entry_setups.assert_called_once()
+
+        # The failure surfaces once the background refresh ran
+        first_refresh = mock_entry.async_create_background_task.call_args_list[0]
+        await first_refresh.args[1]
+        coordinator = mock_hass.data[DOMAIN]["test_entry_id"]
+        assert coordinator.last_update_success is False
+        assert coordinator.data is None
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
@@ -454,6 +640,7 @@ async def test_async_unload_entry_success() -> None:
     mock_coordinator = AsyncMock(spec=FglairDataUpdateCoordinator)
 
     mock_hass.data = {DOMAIN: {"test_entry_id": mock_coordinator}}
+    mock_hass.services = MagicMock()
 
     # Mock the config_entries attribute
     mock_hass.config_entries = AsyncMock()
@@ -464,6 +651,57 @@ async def test_async_unload_entry_success() -> None:
     assert result is True
 
 
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_refresh_devices_service() -> None:
+    """Test the service refreshes the inventory of every account."""
+    coordinators = [AsyncMock(spec=FglairDataUpdateCoordinator) for _ in range(2)]
+    mock_call = MagicMock()
+    mock_call.hass.data = {
+        DOMAIN: {"entry1": coordinators[0], "entry2": coordinators[1]}
+    }
+
+    await _async_refresh_devices(mock_call)
+
+    for coordinator in coordinators:
+        coordinator.async_refresh_inventory.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_unload_last_entry_removes_service() -> None:
+    """Test the service is removed with the last entry."""
+    mock_hass = MagicMock(spec=HomeAssistant)
+    mock_hass.services = MagicMock()
+    mock_entry = MagicMock(spec=ConfigEntry)
+    mock_entry.entry_id = "test_entry_id"
+    mock_hass.data = {DOMAIN: {"test_entry_id": MagicMock(), "other": MagicMock()}}
+    mock_hass.config_entries = AsyncMock()
+    mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+
+    await async_unload_entry(mock_hass, mock_entry)
+    mock_hass.services.async_remove.assert_not_called()
+
+    mock_entry.entry_id = "other"
+    await async_unload_entry(mock_hass, mock_entry)
+    mock_hass.services.async_remove.assert_called_once_with(
+        DOMAIN, SERVICE_REFRESH_DEVICES
+    )
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_async_remove_entry_removes_token_store() -> None:
+    """Test removing an entry removes its persisted token and state."""
+    mock_hass = MagicMock(spec=HomeAssistant)
+    mock_entry = MagicMock(spec=ConfigEntry)
+    mock_entry.entry_id = "test_entry_id"
+
+    with patch("custom_components.fglair_heatpump_controller.Store") as mock_store:
+        mock_store.return_value.async_remove = AsyncMock()
+        await async_remove_entry(mock_hass, mock_entry)
+
+    assert mock_store.return_value.async_remove.call_count == 2
+    assert mock_store.call_args.args[2].endswith("test_entry_id.snapshots")
+
+
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_async_unload_entry_no_coordinator() -> None:
     """Test async_unload_entry with no coordinator."""
@@ -632,38 +870,721 @@ def test_italian_translations() -> None:
 async def test_coordinator_async_update_data_success() -> None:
     """Test coordinator _async_update_data method success."""
     mock_hass = MagicMock()
-    mock_client = AsyncMock()
+    mock_client = _mock_client()
 
     # Mock the frame helper to avoid Home Assistant setup issues
     with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
         coordinator = FglairDataUpdateCoordinator(hass=mock_hass, client=mock_client)
 
     # Mock the client method to return successfully
-    mock_client.async_get_devices_dsn = AsyncMock(return_value={"devices": []})
+    mock_client.async_get_devices = AsyncMock(return_value=[])
 
     # Test the method
-    await coordinator._async_update_data()
+    data = await coordinator._async_update_data()
 
     # Verify the client method was called
-    mock_client.async_get_devices_dsn.assert_called_once()
+    mock_client.async_get_devices.assert_called_once()
+    assert data == {}
 
 
 @pytest.mark.asyncio  # type: ignore[misc]
 async def test_coordinator_async_update_data_exception() -> None:
     """Test coordinator _async_update_data method with exception."""
     mock_hass = MagicMock()
-    mock_client = AsyncMock()
+    mock_client = _mock_client()
 
     # Mock the frame helper to avoid Home Assistant setup issues
     with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
         coordinator = FglairDataUpdateCoordinator(hass=mock_hass, client=mock_client)
 
     # Mock the client method to raise an exception
-    mock_client.async_get_devices_dsn = AsyncMock(side_effect=Exception("Test error"))
+    mock_client.async_get_devices = AsyncMock(side_effect=Exception("Test error"))
 
     # Test that the method raises UpdateFailed
     with pytest.raises(UpdateFailed):
         await coordinator._async_update_data()
 
     # Verify the client method was called
-    mock_client.async_get_devices_dsn.assert_called_once()
+    mock_client.async_get_devices.assert_called_once()
+
+
+def _inventory(*dsns: str) -> list[dict[str, Any]]:
+    """Return the inventory listing the given devices, all of one model."""
+    return [{"dsn": dsn, "oem_model": "AP-WD2E", "sw_version": "1.0"} for dsn in dsns]
+
+
+def _mock_device(
+    current_temperature: float | None = 21.0, target_temperature: float | None = 22.0
+) -> MagicMock:
+    """Return a SplitAC mock with a freshly refreshed sensor timestamp."""
+    device = MagicMock()
+    device.async_update_properties = AsyncMock(
+        return_value=[{"property": {"name": "operation_mode", "value": 6}}]
+    )
+    device.display_temperature_degree.return_value = current_temperature
+    device.adjust_temperature_degree.return_value = target_temperature
+    device.get_refresh.return_value = {"data_updated_at": "2999-01-01T00:00:00Z"}
+    device.async_set_refresh = AsyncMock()
+    return device
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_async_update_data_snapshots() -> None:
+    """Test coordinator builds a snapshot for every DSN."""
+    mock_client = _mock_client()
+    mock_client.async_get_devices = AsyncMock(return_value=_inventory("dsn1", "dsn2"))
+
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(hass=MagicMock(), client=mock_client)
+
+    coordinator.devices = {"dsn1": _mock_device(), "dsn2": _mock_device(19.5, 20.0)}
+
+    data = await coordinator._async_update_data()
+
+    assert data["dsn1"] == DeviceSnapshot(
+        current_temperature=21.0, target_temperature=22.0, operation_mode=6
+    )
+    assert data["dsn2"].current_temperature == 19.5
+    assert data["dsn2"].target_temperature == 20.0
+    for device in coordinator.devices.values():
+        device.async_update_properties.assert_called_once()
+        device.async_set_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_persists_snapshots() -> None:
+    """Test the snapshots are saved after an update that changed them."""
+    mock_client = _mock_client()
+    mock_client.async_get_devices = AsyncMock(return_value=_inventory("dsn1"))
+    store = MagicMock()
+
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(
+            hass=MagicMock(), client=mock_client, store=store
+        )
+    coordinator.devices = {"dsn1": _mock_device()}
+
+    coordinator.data = await coordinator._async_update_data()
+    store.async_delay_save.assert_called_once()
+
+    # Nothing is written again while no device nor the inventory changed
+    coordinator._next_poll.clear()
+    coordinator.data = await coordinator._async_update_data()
+    store.async_delay_save.assert_called_once()
+
+    coordinator.devices["dsn1"].display_temperature_degree.return_value = 25.0
+    coordinator._next_poll.clear()
+    coordinator.data = await coordinator._async_update_data()
+    assert store.async_delay_save.call_count == 2
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_restores_last_known_state() -> None:
+    """Test a restored state renders and writes like a fetched one."""
+    properties = [
+        {"property": {"name": "operation_mode", "key": 1, "value": 6}},
+        {"property": {"name": "economy_mode", "key": 2, "value": 0}},
+        {"property": {"name": "not_used", "key": 3, "value": 1}},
+    ]
+    store = MagicMock()
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(
+            hass=MagicMock(), client=MagicMock(), store=store
+        )
+        restored = FglairDataUpdateCoordinator(
+            hass=MagicMock(), client=MagicMock(), store=store
+        )
+    await coordinator.get_device("dsn1").async_parse_properties(properties)
+    coordinator.data = {
+        "dsn1": DeviceSnapshot.from_properties(
+            properties, current_temperature=21.0, target_temperature=22.0
+        )
+    }
+    # The inventory is restored with the devices never fetched
+    coordinator.devices_dsn = ["dsn1", "dsn2"]
+    coordinator._capability_keys = {"dsn1": "AP-WD2E/1.0", "dsn2": None}
+    store.async_load = AsyncMock(return_value=coordinator._data_to_save())
+
+    assert await restored.async_restore() is True
+
+    assert restored.data == coordinator.data
+    assert restored.devices_dsn == ["dsn1", "dsn2"]
+    assert restored.capability_key("dsn1") == "AP-WD2E/1.0"
+    # The device knows the property keys before the cloud answered
+    device = restored.get_device("dsn1")
+    assert device.get_operation_mode() == {"value": 6, "key": 1}
+    assert device.get_economy_mode() == {"value": 0, "key": 2}
+    # Writes are never skipped against a restored snapshot
+    assert restored.is_fresh("dsn1") is False
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_restore_without_state() -> None:
+    """Test nothing is restored on the first run."""
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(
+            hass=MagicMock(), client=MagicMock(), store=store
+        )
+
+    assert await coordinator.async_restore() is False
+    assert coordinator.data is None
+
+
+def test_coordinator_get_device() -> None:
+    """Test coordinator creates one SplitAC per DSN and reuses it."""
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(
+            hass=MagicMock(), client=MagicMock(), temperature_offset=1.5
+        )
+
+    device = coordinator.get_device("dsn1")
+
+    assert device.get_dsn() == "dsn1"
+    assert device._temperature_offset == 1.5
+    assert coordinator.get_device("dsn1") is device
+    assert coordinator.devices == {"dsn1": device}
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_device_failure_keeps_previous_snapshot() -> None:
+    """Test a failing device keeps its last snapshot."""
+    mock_client = _mock_client()
+    mock_client.async_get_devices = AsyncMock(return_value=_inventory("dsn1", "dsn2"))
+
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(hass=MagicMock(), client=mock_client)
+
+    previous = DeviceSnapshot(current_temperature=20.0, target_temperature=21.0)
+    coordinator.data = {"dsn1": previous}
+    failing = _mock_device()
+    failing.async_update_properties.side_effect = Exception("API Error")
+    never_seen = _mock_device()
+    never_seen.async_update_properties.side_effect = Exception("API Error")
+    coordinator.devices = {"dsn1": failing, "dsn2": never_seen}
+
+    data = await coordinator._async_update_data()
+
+    assert data == {"dsn1": previous}
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_unreported_temperatures_keep_previous_values() -> None:
+    """Test temperatures the device does not report keep the last known values."""
+    mock_client = _mock_client()
+    mock_client.async_get_devices = AsyncMock(return_value=_inventory("dsn1"))
+
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(hass=MagicMock(), client=mock_client)
+
+    coordinator.data = {
+        "dsn1": DeviceSnapshot(current_temperature=20.0, target_temperature=21.0)
+    }
+    device = _mock_device()
+    device.display_temperature_degree.return_value = None
+    device.adjust_temperature_degree.return_value = None
+    device.get_refresh.return_value = {}
+    coordinator.devices = {"dsn1": device}
+
+    data = await coordinator._async_update_data()
+
+    assert data["dsn1"].current_temperature == 20.0
+    assert data["dsn1"].target_temperature == 21.0
+
+
+def _stale_device() -> MagicMock:
+    """Return a SplitAC mock whose sensor data was uploaded long ago."""
+    device = _mock_device()
+    device.async_update_properties.return_value = [
+        {"property": {"name": "operation_mode", "value": 6}},
+        {
+            "property": {
+                "name": "refresh",
+                "value": 0,
+                "data_updated_at": "2025-01-01T00:00:00Z",
+            }
+        },
+    ]
+    return device
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_fails_while_cloud_is_down() -> None:
+    """Test the entities are unavailable while the circuit is not closed."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    await _refresh_at(coordinator, start)
+
+    coordinator.client.breaker.state = CircuitState.OPEN
+    coordinator.devices["dsn1"].async_update_properties.side_effect = CircuitOpenError(
+        "suspended"
+    )
+    with pytest.raises(UpdateFailed):
+        await _refresh_at(coordinator, start + SCAN_INTERVAL)
+    # Every entity must refresh its availability
+    assert coordinator._changed_dsn is None
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_skips_device_warning_while_cloud_is_down(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test devices failing fast do not each log a warning every cycle."""
+    coordinator = _adaptive_coordinator(["dsn1", "dsn2"])
+    for device in coordinator.devices.values():
+        device.async_update_properties.side_effect = CircuitOpenError("suspended")
+
+    with caplog.at_level(logging.WARNING):
+        assert await coordinator._async_fetch_device_snapshot("dsn1") is None
+        assert await coordinator._async_fetch_device_snapshot("dsn2") is None
+
+    assert "Failed to update device" not in caplog.text
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_refreshes_stale_display_temperature() -> None:
+    """Test stale devices are asked for fresh sensor data in the background."""
+    coordinator = _adaptive_coordinator(["dsn1", "dsn2", "dsn3"])
+    coordinator.devices["dsn1"] = _stale_device()
+    coordinator.devices["dsn2"] = _stale_device()
+    start = datetime(2025, 1, 1, 1, tzinfo=UTC)
+
+    await _refresh_at(coordinator, start)
+
+    # The poll does not wait for the requests, sent together afterwards
+    for device in coordinator.devices.values():
+        device.async_set_refresh.assert_not_called()
+    create_task = coordinator.config_entry.async_create_background_task
+    create_task.assert_called_once()
+    await create_task.call_args.args[1]
+    coordinator.devices["dsn1"].async_set_refresh.assert_called_once_with(1)
+    coordinator.devices["dsn2"].async_set_refresh.assert_called_once_with(1)
+    coordinator.devices["dsn3"].async_set_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_does_not_repeat_pending_refresh_requests() -> None:
+    """Test a request is not sent again while the device did not answer."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    coordinator.devices["dsn1"] = _stale_device()
+    create_task = coordinator.config_entry.async_create_background_task
+    create_task.side_effect = lambda hass, target, name: target.close()
+    start = datetime(2025, 1, 1, 1, tzinfo=UTC)
+
+    await _refresh_at(coordinator, start)
+    await _refresh_at(coordinator, start + SCAN_INTERVAL)
+    assert create_task.call_count == 1
+
+    # Still not answered after a whole interval, the request is sent again
+    await _refresh_at(coordinator, start + REFRESH_MINUTES_INTERVAL)
+    assert create_task.call_count == 2
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_refreshes_uncommanded_devices_by_default() -> None:
+    """Test every device keeps fresh sensor data unless opted out."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    coordinator.devices["dsn1"] = _stale_device()
+    create_task = coordinator.config_entry.async_create_background_task
+    create_task.side_effect = lambda hass, target, name: target.close()
+
+    await _refresh_at(
+        coordinator, datetime(2025, 1, 1, tzinfo=UTC) + REFRESH_MINUTES_INTERVAL * 2
+    )
+
+    create_task.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_refreshes_commanded_devices_often() -> None:
+    """Test the opt-in keeps sensor data fresh only for commanded devices."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    coordinator._relax_uncommanded_refresh = True
+    coordinator.devices["dsn1"] = _stale_device()
+    create_task = coordinator.config_entry.async_create_background_task
+    create_task.side_effect = lambda hass, target, name: target.close()
+    start = datetime(2025, 1, 1, tzinfo=UTC) + REFRESH_MINUTES_INTERVAL * 2
+
+    # Not commanded lately, its sensor data is not stale yet
+    await _refresh_at(coordinator, start)
+    create_task.assert_not_called()
+
+    # Asking for its state fetches the device and refreshes it often
+    with patch(
+        "custom_components.fglair_heatpump_controller.utcnow", return_value=start
+    ):
+        coordinator.async_note_interaction("dsn1")
+    await _refresh_at(coordinator, start)
+    create_task.assert_called_once()
+    assert coordinator.devices["dsn1"].async_update_properties.call_count == 2
+
+    # Once the interaction is over, the long interval applies again
+    coordinator._refresh_requested.clear()
+    await _refresh_at(coordinator, start + INTERACTION_DURATION)
+    create_task.assert_called_once()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_bounds_concurrent_device_fetches() -> None:
+    """Test devices are fetched concurrently but never above the limit."""
+    dsns = [f"dsn{index}" for index in range(6)]
+    mock_client = _mock_client()
+    mock_client.async_get_devices = AsyncMock(return_value=_inventory(*dsns))
+
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(
+            hass=MagicMock(), client=mock_client, max_concurrent_requests=2
+        )
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_update_properties() -> list[Any]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    for dsn in dsns:
+        device = _mock_device()
+        device.async_update_properties.side_effect = slow_update_properties
+        coordinator.devices[dsn] = device
+
+    data = await coordinator._async_update_data()
+
+    assert list(data) == dsns
+    assert max_in_flight == 2
+
+
+def _adaptive_coordinator(dsns: list[str]) -> FglairDataUpdateCoordinator:
+    """Return a coordinator with one active (heating) mocked device per DSN."""
+    mock_client = _mock_client()
+    mock_client.async_get_devices = AsyncMock(return_value=_inventory(*dsns))
+
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        coordinator = FglairDataUpdateCoordinator(
+            hass=MagicMock(), client=mock_client, config_entry=MagicMock()
+        )
+    coordinator._schedule_refresh = MagicMock()
+
+    for dsn in dsns:
+        coordinator.devices[dsn] = _mock_device()
+    return coordinator
+
+
+async def _refresh_at(
+    coordinator: FglairDataUpdateCoordinator, now: datetime
+) -> dict[str, Any]:
+    """Run one coordinator cycle at the given time."""
+    with patch("custom_components.fglair_heatpump_controller.utcnow", return_value=now):
+        coordinator.data = await coordinator._async_update_data()
+    return coordinator.data
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_polls_fast_after_command() -> None:
+    """Test a command switches the device to fast polling for a while."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+
+    await _refresh_at(coordinator, start)
+    assert coordinator.update_interval == SCAN_INTERVAL
+
+    with patch(
+        "custom_components.fglair_heatpump_controller.utcnow", return_value=start
+    ):
+        coordinator.async_note_command("dsn1")
+    assert coordinator.update_interval == FAST_SCAN_INTERVAL
+    coordinator._schedule_refresh.assert_called_once()
+
+    await _refresh_at(coordinator, start + FAST_SCAN_INTERVAL)
+    assert coordinator.update_interval == FAST_SCAN_INTERVAL
+    assert coordinator.devices["dsn1"].async_update_properties.call_count == 2
+
+    await _refresh_at(coordinator, start + timedelta(minutes=2))
+    assert coordinator.update_interval == SCAN_INTERVAL
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_backs_off_for_devices_that_are_off() -> None:
+    """Test devices that are off are polled slowly and keep their snapshot."""
+    coordinator = _adaptive_coordinator(["on", "off"])
+    coordinator.devices["off"].async_update_properties.return_value = [
+        {"property": {"name": "operation_mode", "value": 0}}
+    ]
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+
+    first = await _refresh_at(coordinator, start)
+    second = await _refresh_at(coordinator, start + SCAN_INTERVAL)
+
+    assert coordinator.devices["on"].async_update_properties.call_count == 2
+    assert coordinator.devices["off"].async_update_properties.call_count == 1
+    assert second["off"] is first["off"]
+
+    await _refresh_at(coordinator, start + IDLE_SCAN_INTERVAL)
+    assert coordinator.devices["off"].async_update_properties.call_count == 2
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_snapshots_fresh_while_polled() -> None:
+    """Test only snapshots fetched lately by this run are fresh."""
+    coordinator = _adaptive_coordinator(["on", "off"])
+    coordinator.devices["off"].async_update_properties.return_value = [
+        {"property": {"name": "operation_mode", "value": 0}}
+    ]
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    assert coordinator.is_fresh("on") is False
+
+    await _refresh_at(coordinator, start)
+    await _refresh_at(coordinator, start + SCAN_INTERVAL)
+
+    with patch(
+        "custom_components.fglair_heatpump_controller.utcnow",
+        return_value=start + SCAN_INTERVAL + timedelta(seconds=30),
+    ):
+        assert coordinator.is_fresh("on") is True
+        # Polled every IDLE_SCAN_INTERVAL only, its snapshot may be stale
+        assert coordinator.is_fresh("off") is False
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_backs_off_for_unchanged_devices() -> None:
+    """Test a device that does not change for a long time is polled slowly."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+
+    await _refresh_at(coordinator, start)
+    assert coordinator.update_interval == SCAN_INTERVAL
+
+    await _refresh_at(coordinator, start + IDLE_THRESHOLD)
+    assert coordinator.update_interval == IDLE_SCAN_INTERVAL
+
+    coordinator.devices["dsn1"].display_temperature_degree.return_value = 25
+    await _refresh_at(coordinator, start + IDLE_THRESHOLD + IDLE_SCAN_INTERVAL)
+    assert coordinator.update_interval == SCAN_INTERVAL
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_only_dispatches_changed_devices() -> None:
+    """Test listeners are only called when the snapshot of their DSN changed."""
+    coordinator = _adaptive_coordinator(["dsn1", "dsn2"])
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    listeners = {"dsn1": MagicMock(), "dsn2": MagicMock(), None: MagicMock()}
+    for context, listener in listeners.items():
+        coordinator.async_add_listener(listener, context)
+
+    await _refresh_at(coordinator, start)
+    coordinator.async_update_listeners()
+    assert all(listener.call_count == 1 for listener in listeners.values())
+
+    coordinator.devices["dsn2"].display_temperature_degree.return_value = 25
+    await _refresh_at(coordinator, start + SCAN_INTERVAL)
+    coordinator.async_update_listeners()
+
+    assert listeners["dsn1"].call_count == 1
+    assert listeners["dsn2"].call_count == 2
+    assert listeners[None].call_count == 2
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_dispatches_all_devices_after_failure() -> None:
+    """Test every listener is called when the update fails or recovers."""
+    coordinator = _adaptive_coordinator(["dsn1", "dsn2"])
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    listeners = {"dsn1": MagicMock(), "dsn2": MagicMock()}
+    for context, listener in listeners.items():
+        coordinator.async_add_listener(listener, context)
+    await _refresh_at(coordinator, start)
+
+    coordinator.client.async_get_devices.side_effect = Exception("API Error")
+    coordinator._inventory_expires = None
+    with pytest.raises(UpdateFailed):
+        await _refresh_at(coordinator, start + SCAN_INTERVAL)
+    coordinator.async_update_listeners()
+    assert all(listener.call_count == 1 for listener in listeners.values())
+
+    coordinator.client.async_get_devices.side_effect = None
+    coordinator._inventory_expires = None
+    coordinator.last_update_success = False
+    await _refresh_at(coordinator, start + 2 * SCAN_INTERVAL)
+    coordinator.async_update_listeners()
+    assert all(listener.call_count == 2 for listener in listeners.values())
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_caches_device_inventory() -> None:
+    """Test the DSN list is only fetched again once the inventory expired."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+
+    await _refresh_at(coordinator, start)
+    await _refresh_at(coordinator, start + SCAN_INTERVAL)
+    coordinator.client.async_get_devices.assert_called_once()
+    assert coordinator.devices["dsn1"].async_update_properties.call_count == 2
+
+    await _refresh_at(coordinator, start + INVENTORY_REFRESH_INTERVAL)
+    assert coordinator.client.async_get_devices.call_count == 2
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_keys_capabilities_by_model() -> None:
+    """Test the inventory tells the capability profile key of every device."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    coordinator.client.async_get_devices.return_value = [
+        *_inventory("dsn1"),
+        {"dsn": "dsn2", "oem_model": "AP-WD2E"},
+    ]
+    await _refresh_at(coordinator, datetime(2025, 1, 1, tzinfo=UTC))
+
+    assert coordinator.capability_key("dsn1") == "AP-WD2E/1.0"
+    # Without firmware the model is not enough to share capabilities
+    assert coordinator.capability_key("dsn2") is None
+    assert coordinator.capability_key("unknown") is None
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_refresh_inventory_on_demand() -> None:
+    """Test added and removed devices are picked up on demand."""
+    coordinator = _adaptive_coordinator(["dsn1", "dsn2"])
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    await _refresh_at(coordinator, start)
+
+    coordinator.client.async_get_devices.return_value = _inventory("dsn2", "dsn3")
+    coordinator.devices["dsn3"] = _mock_device()
+
+    async def refresh() -> None:
+        await _refresh_at(coordinator, start + timedelta(seconds=1))
+
+    coordinator.async_refresh = refresh  # type: ignore[method-assign]
+    await coordinator.async_refresh_inventory()
+
+    assert coordinator.devices_dsn == ["dsn2", "dsn3"]
+    assert set(coordinator.data) == {"dsn2", "dsn3"}
+    assert "dsn1" not in coordinator.devices
+    assert coordinator.client.async_get_devices.call_count == 2
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_forgets_removed_device() -> None:
+    """Test the state of a removed device is dropped and its writes cancelled."""
+    coordinator = _adaptive_coordinator(["dsn1", "dsn2"])
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    await _refresh_at(coordinator, start)
+    queue = MagicMock()
+    coordinator._command_queues["dsn1"] = queue
+    coordinator._fast_poll_until["dsn1"] = start + timedelta(minutes=1)
+    coordinator._interaction_until["dsn1"] = start + timedelta(minutes=1)
+
+    coordinator.client.async_get_devices.return_value = _inventory("dsn2")
+    coordinator._inventory_expires = None
+    await _refresh_at(coordinator, start + timedelta(seconds=1))
+
+    queue.async_shutdown.assert_called_once()
+    for state in (
+        coordinator._next_poll,
+        coordinator._fetched_at,
+        coordinator._command_queues,
+        coordinator._fast_poll_until,
+        coordinator._interaction_until,
+        coordinator._last_change,
+        coordinator._activity,
+    ):
+        assert "dsn1" not in state
+    assert "dsn2" in coordinator._activity
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_sends_commands_through_device_queue() -> None:
+    """Test every device gets its own command queue."""
+    coordinator = _adaptive_coordinator(["dsn1", "dsn2"])
+
+    with patch(
+        "custom_components.fglair_heatpump_controller.DeviceCommandQueue"
+    ) as mock_queue_class:
+        mock_queue_class.return_value.async_write = AsyncMock(return_value="sent")
+        write = AsyncMock()
+        assert await coordinator.async_send_command("dsn1", "fan_speed", write) == (
+            "sent"
+        )
+        await coordinator.async_send_command("dsn1", "operation_mode", write)
+        await coordinator.async_send_command("dsn2", "fan_speed", write)
+
+    assert mock_queue_class.call_count == 2
+    mock_queue_class.return_value.async_write.assert_any_call("fan_speed", write)
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_refreshes_only_named_properties() -> None:
+    """Test a targeted refresh reads the named properties and publishes them."""
+    coordinator = _adaptive_coordinator(["dsn1", "dsn2"])
+    await _refresh_at(coordinator, datetime(2025, 1, 1, tzinfo=UTC))
+    listeners = {"dsn1": MagicMock(), "dsn2": MagicMock()}
+    for context, listener in listeners.items():
+        coordinator.async_add_listener(listener, context)
+
+    device = FglairSplitAC("dsn1", coordinator.client, DEFAULT_TOKEN_PATH, 0.0)
+    await device.async_set_economy_mode(
+        [{"property": {"name": "economy_mode", "key": 1, "value": 0}}]
+    )
+    coordinator.devices["dsn1"] = device
+    # The datapoints of the property, oldest first
+    coordinator.client.async_get_device_property = AsyncMock(
+        return_value=[
+            {"datapoint": {"value": 0, "updated_at": "2025-01-01T00:00:00Z"}},
+            {"datapoint": {"value": 1, "updated_at": "2025-01-01T00:01:00Z"}},
+        ]
+    )
+    previous = coordinator.data["dsn1"]
+
+    await coordinator.async_refresh_properties("dsn1", ("economy_mode", "min_heat"))
+
+    coordinator.client.async_get_device_property.assert_called_once_with(1)
+    assert device.get_economy_mode() == {"value": 1, "key": 1}
+    snapshot = coordinator.data["dsn1"]
+    assert snapshot.economy_mode == 1
+    assert snapshot.fingerprint != previous.fingerprint
+    assert snapshot.current_temperature == previous.current_temperature
+    listeners["dsn1"].assert_called_once()
+    listeners["dsn2"].assert_not_called()
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_refresh_without_datapoints_keeps_property() -> None:
+    """Test a property without a readable history keeps its value and key."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    await _refresh_at(coordinator, datetime(2025, 1, 1, tzinfo=UTC))
+    device = FglairSplitAC("dsn1", coordinator.client, DEFAULT_TOKEN_PATH, 0.0)
+    await device.async_set_economy_mode(
+        [{"property": {"name": "economy_mode", "key": 1, "value": 0}}]
+    )
+    coordinator.devices["dsn1"] = device
+
+    # No history yet, or an error payload in place of the history
+    for response in ([], {"error": "not found"}):
+        coordinator.client.async_get_device_property = AsyncMock(return_value=response)
+        await coordinator.async_refresh_properties("dsn1", ("economy_mode",))
+
+        assert device.get_economy_mode() == {"value": 0, "key": 1}
+
+
+@pytest.mark.asyncio  # type: ignore[misc]
+async def test_coordinator_shutdown_drops_queued_writes() -> None:
+    """Test unloading the entry cancels the writes still in their window."""
+    coordinator = _adaptive_coordinator(["dsn1"])
+    coordinator.config_entry.async_on_unload.assert_called_once_with(
+        coordinator.async_shutdown
+    )
+    write = AsyncMock()
+
+    waiting = asyncio.create_task(
+        coordinator.async_send_command("dsn1", "fan_speed", write)
+    )
+    await asyncio.sleep(0)
+    await coordinator.async_shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    write.assert_not_called()